@@ -0,0 +1,374 @@
+"""
+Модуль fake_hh_server.py содержит локальную замену API HH.ru для бенчмарков.
+
+Сервер отвечает на GET /vacancies (поиск с пагинацией) и GET /vacancies/{id}
+(детальная информация) синтетическими или записанными вакансиями, поэтому
+парсер можно измерять без обращения к api.hh.ru. Задержка ответа и доля
+ответов 429 настраиваются, чтобы воспроизводить медленный или перегруженный API.
+Модуль не зависит от Django.
+
+Записанные вакансии — каталог JSON-файлов с ответами /vacancies/{id};
+элементы поисковой выдачи строятся из тех же файлов.
+
+Основной функционал:
+- synthetic_vacancy: детерминированная синтетическая вакансия в формате API
+- FakeHHServer: HTTP-сервер в фоновом потоке со счетчиками запросов
+"""
+
+import json
+import math
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Константы
+DEFAULT_VACANCY_COUNT = 2000
+MAX_SEARCH_DEPTH = 2000  # как у API HH.ru: глубже выдача не отдается
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 100
+FIRST_VACANCY_ID = 90000000
+PUBLISHED_BASE = datetime(2025, 1, 1, 12, 0, tzinfo=timezone(timedelta(hours=3)))
+HH_DATE_FORMAT = '%Y-%m-%dT%H:%M:%S%z'
+SEARCH_ITEM_FIELDS = ('id', 'name', 'alternate_url', 'salary', 'experience', 'employment',
+                      'employer', 'published_at', 'key_skills', 'snippet')
+
+POSITIONS = {
+    'Python разработчик': ['Python', 'Django', 'PostgreSQL', 'Redis', 'Docker', 'Celery', 'FastAPI'],
+    'Backend-разработчик': ['Python', 'Go', 'PostgreSQL', 'Kafka', 'Docker', 'Kubernetes', 'gRPC'],
+    'Java developer': ['Java', 'Spring', 'Hibernate', 'PostgreSQL', 'Kafka', 'Maven'],
+    'Frontend-разработчик': ['JavaScript', 'TypeScript', 'React', 'Vue.js', 'CSS', 'Webpack'],
+    'Data Scientist': ['Python', 'Pandas', 'NumPy', 'Scikit-learn', 'PyTorch', 'SQL'],
+    'Аналитик данных': ['SQL', 'Excel', 'Python', 'Power BI', 'Tableau', 'ClickHouse'],
+    'DevOps инженер': ['Linux', 'Docker', 'Kubernetes', 'Ansible', 'Terraform', 'CI/CD'],
+    'QA инженер': ['Selenium', 'Python', 'Pytest', 'Postman', 'SQL', 'Jira'],
+}
+LEVELS = ['', 'Junior ', 'Middle ', 'Senior ', 'Ведущий ']
+COMPANY_PREFIXES = ['Альфа', 'Бета', 'Гамма', 'Дельта', 'Омега', 'Север', 'Вектор', 'Спектр']
+COMPANY_SUFFIXES = ['Софт', 'Технологии', 'Системы', 'Лаб', 'Диджитал', 'Групп']
+EXPERIENCE_IDS = ['noExperience', 'between1And3', 'between3And6', 'moreThan6']
+EMPLOYMENT_IDS = ['full', 'full', 'full', 'part', 'remote', 'project']
+CURRENCIES = ['RUR'] * 8 + ['USD', 'EUR']
+DUTIES = [
+    'разработка и поддержка сервисов компании',
+    'проектирование архитектуры новых модулей',
+    'оптимизация производительности и запросов к базе данных',
+    'написание автотестов и участие в код-ревью',
+    'взаимодействие с аналитиками и командой продукта',
+    'развитие внутренней платформы и инструментов',
+]
+CONDITIONS = [
+    'официальное трудоустройство',
+    'гибкий график и возможность удаленной работы',
+    'ДМС и компенсация обучения',
+    'современный стек и сильная команда',
+    'годовые бонусы по результатам работы',
+]
+
+
+def synthetic_vacancy(index: int, seed: int = 0) -> dict:
+    """
+    Синтетическая вакансия в формате ответа /vacancies/{id}.
+
+    Одинаковые index и seed всегда дают одну и ту же вакансию.
+
+    Args:
+        index: int (порядковый номер вакансии; меньший номер — более свежая вакансия)
+        seed: int (зерно генератора)
+
+    Returns:
+        dict: данные вакансии без поля url (его подставляет сервер)
+    """
+    rng = random.Random(seed * 1000003 + index)
+    vacancy_id = FIRST_VACANCY_ID + index
+    position = rng.choice(list(POSITIONS))
+    skills = rng.sample(POSITIONS[position], rng.randint(2, len(POSITIONS[position])))
+
+    salary = None
+    if rng.random() < 0.7:
+        salary_from = rng.choice([None, rng.randint(40, 300) * 1000])
+        salary_to = rng.choice([None, rng.randint(100, 500) * 1000])
+        if salary_from and salary_to and salary_from > salary_to:
+            salary_from, salary_to = salary_to, salary_from
+        if salary_from or salary_to:
+            currency = rng.choice(CURRENCIES)
+            if currency != 'RUR':
+                salary_from = salary_from and salary_from // 80
+                salary_to = salary_to and salary_to // 80
+            salary = {'from': salary_from, 'to': salary_to, 'currency': currency, 'gross': False}
+
+    duties = ''.join(f'<li>{duty}</li>' for duty in rng.sample(DUTIES, 3))
+    conditions = ''.join(f'<li>{condition}</li>' for condition in rng.sample(CONDITIONS, 2))
+    description = (
+        f'<p>Ищем специалиста на позицию {position}.</p>'
+        f'<p><strong>Обязанности:</strong></p><ul>{duties}</ul>'
+        f'<p><strong>Требования:</strong> опыт работы с {", ".join(skills)}.</p>'
+        f'<p><strong>Условия:</strong></p><ul>{conditions}</ul>'
+    )
+
+    published_at = PUBLISHED_BASE - timedelta(minutes=7 * index)
+    return {
+        'id': str(vacancy_id),
+        'name': f'{rng.choice(LEVELS)}{position}',
+        'alternate_url': f'https://hh.ru/vacancy/{vacancy_id}',
+        'salary': salary,
+        'experience': {'id': rng.choice(EXPERIENCE_IDS)},
+        'employment': {'id': rng.choice(EMPLOYMENT_IDS)},
+        'employer': {'name': f'{rng.choice(COMPANY_PREFIXES)} {rng.choice(COMPANY_SUFFIXES)} {index % 97}'},
+        'published_at': published_at.strftime(HH_DATE_FORMAT),
+        'key_skills': [{'name': skill} for skill in skills],
+        'snippet': {'requirement': f'Опыт работы с {skills[0]}.', 'responsibility': DUTIES[index % len(DUTIES)]},
+        'description': description,
+    }
+
+
+def load_recorded_vacancies(directory: str) -> list:
+    """
+    Загрузка записанных ответов /vacancies/{id} из каталога.
+
+    Args:
+        directory: str (каталог с JSON-файлами)
+
+    Returns:
+        list: данные вакансий в порядке имен файлов
+    """
+    vacancies = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith('.json'):
+            with open(os.path.join(directory, name), encoding='utf-8') as file:
+                vacancies.append(json.load(file))
+    return vacancies
+
+
+class FakeHHServer:
+    """
+    Локальный HTTP-сервер, имитирующий поиск и детальную информацию API HH.ru.
+
+    Сервер запускается в фоновом потоке (start/stop или контекстный менеджер)
+    либо в текущем потоке через serve_forever.
+    """
+
+    def __init__(self, vacancy_count: int = DEFAULT_VACANCY_COUNT, latency: float = 0.0,
+                 jitter: float = 0.0, error_rate: float = 0.0, retry_after: str = None,
+                 seed: int = 0, recorded_dir: str = None, host: str = '127.0.0.1', port: int = 0):
+        """
+        Создание сервера.
+
+        Args:
+            vacancy_count: int (количество синтетических вакансий)
+            latency: float (задержка каждого ответа в секундах)
+            jitter: float (случайная добавка к задержке, от 0 до jitter секунд)
+            error_rate: float (доля запросов, получающих ответ 429)
+            retry_after: str (значение заголовка Retry-After в ответах 429; None — без заголовка)
+            seed: int (зерно синтетических вакансий и выбора ответов 429)
+            recorded_dir: str (каталог записанных вакансий вместо синтетических)
+            host: str (адрес прослушивания)
+            port: int (порт; 0 — свободный порт)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.seed = seed
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stats = {'search': 0, 'detail': 0, 'throttled': 0, 'not_found': 0}
+
+        if recorded_dir:
+            self._vacancies = load_recorded_vacancies(recorded_dir)
+        else:
+            self._vacancies = [synthetic_vacancy(index, seed) for index in range(vacancy_count)]
+        self._by_id = {str(vacancy['id']): vacancy for vacancy in self._vacancies}
+
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+
+    @property
+    def url(self) -> str:
+        """Базовый адрес сервера."""
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def search_url(self) -> str:
+        """Адрес поиска вакансий (замена BASE_API_URL)."""
+        return f'{self.url}/vacancies'
+
+    def start(self) -> 'FakeHHServer':
+        """Запуск сервера в фоновом потоке."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Обработка запросов в текущем потоке до остановки."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Остановка сервера и освобождение порта."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'FakeHHServer':
+        """Запуск сервера при входе в контекст."""
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        """Остановка сервера при выходе из контекста."""
+        self.stop()
+
+    def stats(self) -> dict:
+        """Количество обработанных запросов по типам."""
+        with self._lock:
+            return dict(self._stats)
+
+    def reset_stats(self) -> None:
+        """Сброс счетчиков запросов."""
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
+
+    def _count(self, key: str) -> None:
+        """Увеличение счетчика запросов."""
+        with self._lock:
+            self._stats[key] += 1
+
+    def _wait(self) -> None:
+        """Задержка ответа."""
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _throttled(self) -> bool:
+        """Выбор запроса для ответа 429."""
+        if self.error_rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def search(self, params: dict) -> tuple:
+        """
+        Страница поисковой выдачи.
+
+        Поддерживаются page, per_page, date_from и date_to; текст запроса не учитывается.
+
+        Args:
+            params: dict (параметры запроса)
+
+        Returns:
+            tuple: HTTP-код и тело ответа
+        """
+        try:
+            page = int(params.get('page', 0))
+            per_page = min(int(params.get('per_page', DEFAULT_PER_PAGE)), MAX_PER_PAGE)
+        except ValueError:
+            return 400, {'errors': [{'type': 'bad_argument'}]}
+
+        vacancies = self._vacancies
+        if params.get('date_from'):
+            date_from = datetime.fromisoformat(params['date_from'])
+            if date_from.tzinfo is None:
+                date_from = date_from.replace(tzinfo=PUBLISHED_BASE.tzinfo)
+            vacancies = [vacancy for vacancy in vacancies
+                         if datetime.strptime(vacancy['published_at'], HH_DATE_FORMAT) >= date_from]
+        if params.get('date_to'):
+            date_to = datetime.fromisoformat(params['date_to'])
+            if date_to.tzinfo is None:
+                date_to = date_to.replace(tzinfo=PUBLISHED_BASE.tzinfo)
+            vacancies = [vacancy for vacancy in vacancies
+                         if datetime.strptime(vacancy['published_at'], HH_DATE_FORMAT) <= date_to]
+
+        found = len(vacancies)
+        if per_page <= 0:
+            return 200, {'items': [], 'found': found, 'pages': 0, 'page': page, 'per_page': per_page}
+        if (page + 1) * per_page > MAX_SEARCH_DEPTH:
+            return 400, {'errors': [{'type': 'bad_argument', 'value': 'page'}]}
+
+        start = page * per_page
+        items = [self._search_item(vacancy) for vacancy in vacancies[start:start + per_page]]
+        pages = math.ceil(min(found, MAX_SEARCH_DEPTH) / per_page)
+        return 200, {'items': items, 'found': found, 'pages': pages, 'page': page, 'per_page': per_page}
+
+    def detail(self, vacancy_id: str) -> tuple:
+        """
+        Детальная информация о вакансии.
+
+        Args:
+            vacancy_id: str (идентификатор вакансии)
+
+        Returns:
+            tuple: HTTP-код и тело ответа
+        """
+        vacancy = self._by_id.get(vacancy_id)
+        if vacancy is None:
+            return 404, {'errors': [{'type': 'not_found'}]}
+        return 200, {**vacancy, 'url': f'{self.search_url}/{vacancy_id}'}
+
+    def _search_item(self, vacancy: dict) -> dict:
+        """Элемент поисковой выдачи; парсер читает key_skills из элемента выдачи."""
+        item = {field: vacancy.get(field) for field in SEARCH_ITEM_FIELDS if field in vacancy}
+        item['url'] = f"{self.search_url}/{vacancy['id']}"
+        return item
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Обработчик запросов FakeHHServer."""
+
+    protocol_version = 'HTTP/1.1'  # соединения переиспользуются пулом requests.Session
+
+    def do_GET(self) -> None:
+        """Маршрутизация GET-запросов."""
+        fake = self.server.fake
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip('/')
+        fake._wait()
+
+        if fake._throttled():
+            fake._count('throttled')
+            headers = {'Retry-After': fake.retry_after} if fake.retry_after is not None else {}
+            self._send_json(429, {'errors': [{'type': 'too_many_requests'}]}, headers)
+            return
+
+        if path == '/vacancies':
+            fake._count('search')
+            params = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+            status, body = fake.search(params)
+            self._send_json(status, body)
+            return
+
+        if path.startswith('/vacancies/'):
+            fake._count('detail')
+            vacancy_id = path.rsplit('/', 1)[1]
+            etag = f'"{vacancy_id}"'
+            if self.headers.get('If-None-Match') == etag:
+                self._send_json(304, None)
+                return
+            status, body = fake.detail(vacancy_id)
+            self._send_json(status, body, {'ETag': etag} if status == 200 else {})
+            return
+
+        fake._count('not_found')
+        self._send_json(404, {'errors': [{'type': 'not_found'}]})
+
+    def _send_json(self, status: int, body, headers: dict = None) -> None:
+        """Отправка JSON-ответа с длиной содержимого (для keep-alive)."""
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8') if body is not None else b''
+        self.send_response(status)
+        if body is not None:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args) -> None:
+        """Журнал запросов отключен: он искажает замеры."""
@@ -0,0 +1,625 @@
+"""
+Модуль hh_client.py содержит клиент API HeadHunter без зависимости от Django.
+
+Клиент загружает поисковую выдачу и детальную информацию о вакансиях и
+приводит их к единому формату; сохранение в базу данных выполняет адаптер
+HHApiParser (hh_parser.py). Модуль можно использовать из скриптов и
+командной строки (hh_crawl.py) без запуска Django.
+
+Основной функционал:
+- Парсинг вакансий по поисковым запросам с пагинацией
+- Обработка и нормализация данных вакансий
+- Параллельная загрузка детальной информации с общим ограничением частоты запросов
+- Кэширование детальной информации с условными запросами (http_cache.py)
+- Архивирование исходных ответов API (payload_archive.py)
+- normalize_vacancy: нормализация без сетевых запросов (в том числе из архива)
+- Повторы запросов при ошибках API и сетевых сбоях (retry_policy.py)
+- Метрики запросов и стадий (metrics.py)
+- SeenIds: общий для нескольких запросов учет уже обработанных вакансий
+"""
+
+import html
+import json
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from hhparser.services.salary import salary_bounds_from_api
+from DjangoProject_HH_parser.Services.rate_limiter import RateLimiter, DEFAULT_RATE, DEFAULT_BURST
+from DjangoProject_HH_parser.Services.http_cache import HttpCache
+from DjangoProject_HH_parser.Services.payload_archive import PayloadArchive
+from DjangoProject_HH_parser.Services.retry_policy import RetryPolicy
+from DjangoProject_HH_parser.Services import metrics
+
+# Константы
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 YaBrowser/25.6.0.0 Safari/537.36"
+BASE_API_URL = "https://api.hh.ru/vacancies"
+DEFAULT_MAX_WORKERS = 8
+MAX_VACANCY_COUNT = 2000  # глубже API HH.ru не отдает результаты поиска
+MAX_PARALLEL_SLICES = 4
+MAX_PAGE_ATTEMPTS = 3
+DEFAULT_AREA = 1  # Москва
+SKILLS_TEXT_LIMIT = 1000
+ALLOWED_DESCRIPTION_TAGS = frozenset({'p', 'br', 'ul', 'ol', 'li', 'strong', 'b', 'em', 'i', 'u',
+                                      'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote'})
+_DROPPED_BLOCKS = re.compile(r'<!--.*?-->|<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_HTML_TAG = re.compile(r'<(/?)([a-zA-Z][a-zA-Z0-9]*)\b[^<>]*>')
+
+EXPERIENCE_MAP = {
+    'noExperience': 'no',
+    'between1And3': '1-3',
+    'between3And6': '3-6',
+    'moreThan6': '6+'
+}
+
+EMPLOYMENT_MAP = {
+    'full': 'full',
+    'part': 'part',
+    'remote': 'remote',
+    'project': 'project'
+}
+
+logger = logging.getLogger(__name__)
+
+
+def clean_description(description: str) -> str:
+    """
+    Очистка описания вакансии от HTML-разметки.
+
+    Args:
+        description: str (описание в HTML)
+
+    Returns:
+        str: полный текст описания без тегов и HTML-сущностей
+    """
+    return html.unescape(re.sub('<[^<]+?>', '', description or ''))
+
+
+def sanitize_description_html(description: str) -> str:
+    """
+    Безопасная HTML-разметка описания вакансии.
+
+    Остаются только теги ALLOWED_DESCRIPTION_TAGS без атрибутов; скрипты,
+    стили и комментарии удаляются, прочие угловые скобки экранируются.
+
+    Args:
+        description: str (описание в HTML от API)
+
+    Returns:
+        str: очищенная разметка
+    """
+    description = _DROPPED_BLOCKS.sub('', description or '')
+    parts = []
+    position = 0
+    for match in _HTML_TAG.finditer(description):
+        parts.append(description[position:match.start()].replace('<', '&lt;').replace('>', '&gt;'))
+        closing, name = match.group(1), match.group(2).lower()
+        if name in ALLOWED_DESCRIPTION_TAGS and not (closing and name == 'br'):
+            parts.append(f'<{closing}{name}>')
+        position = match.end()
+    parts.append(description[position:].replace('<', '&lt;').replace('>', '&gt;'))
+    return ''.join(parts)
+
+
+def format_salary(salary_data: dict) -> str:
+    """
+    Обработка и форматирование данных о зарплате.
+
+    Преобразует данные о зарплате из API в читаемый формат
+    с поддержкой диапазонов и различных валют.
+
+    Args:
+        salary_data: dict (данные о зарплате от API)
+
+    Returns:
+        str: отформатированная строка с информацией о зарплате
+    """
+    if not salary_data:
+        return "Не указана"
+
+    salary_from = salary_data.get('from')
+    salary_to = salary_data.get('to')
+    currency = '₽' if salary_data.get('currency') == 'RUR' else salary_data.get('currency', '')
+
+    if salary_from and salary_to:
+        return f"{salary_from:,} - {salary_to:,} {currency}".replace(',', ' ')
+    elif salary_from:
+        return f"от {salary_from:,} {currency}".replace(',', ' ')
+    elif salary_to:
+        return f"до {salary_to:,} {currency}".replace(',', ' ')
+    else:
+        return "Не указана"
+
+
+def normalize_vacancy(vacancy_data: dict, details: dict = None) -> dict:
+    """
+    Преобразование ответов API о вакансии в единый формат приложения.
+
+    Не выполняет сетевых запросов: используется и при обходе API, и при
+    повторной нормализации ответов из архива (payload_archive.py).
+
+    Args:
+        vacancy_data: dict (элемент поисковой выдачи или детальная информация)
+        details: dict (детальная информация о вакансии; источник описания и навыков)
+
+    Returns:
+        dict: структурированные данные вакансии или None без обязательных данных
+    """
+    if not vacancy_data.get('name') or not vacancy_data.get('alternate_url'):
+        return None
+    details = details or {}
+
+    experience = EXPERIENCE_MAP.get((vacancy_data.get('experience') or {}).get('id'), 'no')
+    employment = EMPLOYMENT_MAP.get((vacancy_data.get('employment') or {}).get('id'), 'full')
+
+    # Обрабатываем навыки; полный список сохраняется в индекс навыков
+    key_skills = [skill['name'] for skill in vacancy_data.get('key_skills') or details.get('key_skills') or []]
+    skills_text = ', '.join(key_skills)
+    if len(skills_text) > SKILLS_TEXT_LIMIT:  # Ограничиваем длину
+        skills_text = skills_text[:SKILLS_TEXT_LIMIT] + "..."
+
+    return {
+        'title': vacancy_data.get('name', 'Без названия').strip(),
+        'company': (vacancy_data.get('employer') or {}).get('name', 'Не указано').strip(),
+        'salary': format_salary(vacancy_data.get('salary')),
+        **salary_bounds_from_api(vacancy_data.get('salary')),
+        'description': clean_description(details.get('description', '')),
+        'description_html': sanitize_description_html(details.get('description', '')),
+        'experience': experience,
+        'employment': employment,
+        'skills': skills_text,
+        'key_skills': key_skills,
+        'link': vacancy_data.get('alternate_url', '').strip(),
+        'hh_id': str(vacancy_data.get('id', '')),
+        'published_at': vacancy_data.get('published_at'),
+    }
+
+
+class SeenIds:
+    """
+    Потокобезопасное множество идентификаторов вакансий, уже взятых в обработку.
+
+    Общий экземпляр позволяет нескольким обходам не загружать детальную
+    информацию об одной и той же вакансии дважды.
+    """
+
+    def __init__(self):
+        """Создание пустого множества."""
+        self._ids = set()
+        self._lock = threading.Lock()
+
+    def claim(self, ids) -> set:
+        """
+        Отметка идентификаторов как обработанных.
+
+        Args:
+            ids: iterable (идентификаторы вакансий)
+
+        Returns:
+            set: идентификаторы, которые до этого не встречались
+        """
+        with self._lock:
+            fresh = set(ids) - self._ids
+            self._ids |= fresh
+        return fresh
+
+    def __len__(self) -> int:
+        """Количество отмеченных идентификаторов."""
+        with self._lock:
+            return len(self._ids)
+
+
+class HHClient:
+    """
+    Клиент API HeadHunter для получения и нормализации данных о вакансиях.
+
+    Обеспечивает сбор и обработку данных вакансий с поддержкой
+    пагинации, ограничения частоты и повторов запросов. Не зависит от Django;
+    сохранение в базу данных добавляет HHApiParser.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, rate_limiter: RateLimiter = None,
+                 http_cache: HttpCache = None, retry_policy: RetryPolicy = None,
+                 pool_size: int = None, base_url: str = BASE_API_URL,
+                 archive: PayloadArchive = None) -> None:
+        """
+        Инициализация клиента с настройками HTTP-сессии.
+
+        Создает сессию requests с пользовательскими заголовками
+        для корректной работы с API HH.ru. Пул соединений сессии рассчитан
+        на параллельную загрузку детальной информации.
+
+        Args:
+            max_workers: int (максимальное количество параллельных запросов деталей вакансий)
+            rate_limiter: RateLimiter (общий ограничитель частоты запросов, создается при отсутствии)
+            http_cache: HttpCache (кэш детальной информации; None — без кэша)
+            retry_policy: RetryPolicy (политика повторов запросов, создается при отсутствии)
+            pool_size: int (размер пула соединений; по умолчанию с запасом на обход срезов)
+            base_url: str (адрес поиска вакансий)
+            archive: PayloadArchive (архив исходных ответов API; None — без архива)
+        """
+        self.base_url = base_url
+        self.archive = archive
+        self.http_cache = http_cache
+        self.max_workers = max(1, int(max_workers))
+        self.rate_limiter = rate_limiter or RateLimiter(DEFAULT_RATE, DEFAULT_BURST)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.session = requests.Session()
+        # Запас соединений на параллельный обход срезов выдачи (partitioning.py)
+        adapter = HTTPAdapter(pool_connections=1,
+                              pool_maxsize=pool_size or self.max_workers * MAX_PARALLEL_SLICES)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'user-agent': USER_AGENT,
+            'HH-User-Agent': 'HH Parser App'
+        })
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Выполняет GET-запрос с учетом ограничения частоты и политики повторов.
+
+        Ответы 429/5xx и сетевые ошибки повторяются с экспоненциальной
+        задержкой (или по заголовку Retry-After) не более retry_policy.max_retries
+        раз; при перегрузке API общий ограничитель снижает скорость запросов.
+
+        Args:
+            url: str (адрес запроса)
+            **kwargs: параметры requests.Session.get
+
+        Returns:
+            requests.Response: ответ сервера (последний, если повторы исчерпаны)
+
+        Raises:
+            requests.exceptions.RequestException: сетевая ошибка после исчерпания повторов
+        """
+        endpoint = 'search' if url == self.base_url else 'detail'
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            started = time.perf_counter()
+            try:
+                response = self.session.get(url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                metrics.HTTP_LATENCY.observe(time.perf_counter() - started, endpoint=endpoint)
+                metrics.HTTP_REQUESTS.inc(endpoint=endpoint, status='error')
+                if attempt >= self.retry_policy.max_retries:
+                    raise
+                delay = self.retry_policy.get_delay(attempt)
+                metrics.HTTP_RETRIES.inc(endpoint=endpoint, reason='network')
+                logger.warning("Сетевая ошибка (%s), повтор через %.1f с", e, delay)
+                time.sleep(delay)
+            else:
+                metrics.HTTP_LATENCY.observe(time.perf_counter() - started, endpoint=endpoint)
+                metrics.HTTP_REQUESTS.inc(endpoint=endpoint, status=response.status_code)
+                if not self.retry_policy.should_retry_status(response.status_code):
+                    self.rate_limiter.reward()
+                    return response
+                if attempt >= self.retry_policy.max_retries:
+                    return response
+                delay = self.retry_policy.get_delay(attempt, response.headers.get('Retry-After'))
+                if delay is None:
+                    logger.warning("Ответ %s от API, Retry-After %s превышает допустимую задержку, повтор отменен",
+                                   response.status_code, response.headers.get('Retry-After'))
+                    return response
+                # Пауза ограничителя задерживает и этот, и все параллельные запросы
+                self.rate_limiter.penalize(delay)
+                metrics.HTTP_RETRIES.inc(endpoint=endpoint, reason=response.status_code)
+                logger.warning("Ответ %s от API, повтор через %.1f с", response.status_code, delay)
+
+            attempt += 1
+
+    def parse_vacancies(self, search_query: str = "Python", vacancy_count: int = 50,
+                        progress_callback=None) -> list:
+        """
+        Основной метод для парсинга вакансий по заданным параметрам.
+
+        Выполняет поиск вакансий с поддержкой пагинации и ограничений API.
+        Обрабатывает сетевые ошибки и ограничения на количество запросов.
+        Собирает все страницы iter_vacancy_pages в один список.
+
+        Args:
+            search_query: str (поисковый запрос для фильтрации вакансий, по умолчанию "Python")
+            vacancy_count: int (количество вакансий для получения, максимум MAX_VACANCY_COUNT)
+            progress_callback: callable (вызывается после каждой страницы как
+                progress_callback(pages_fetched=..., items_parsed=...))
+
+        Returns:
+            list: список словарей с данными вакансий
+        """
+        all_vacancies = []
+        for page_vacancies in self.iter_vacancy_pages(search_query, vacancy_count, progress_callback):
+            all_vacancies.extend(page_vacancies)
+        return all_vacancies
+
+    def count_vacancies(self, search_query: str, extra_params: dict = None) -> int:
+        """
+        Получение общего количества вакансий по запросу без загрузки деталей.
+
+        Args:
+            search_query: str (поисковый запрос)
+            extra_params: dict (дополнительные параметры поиска: area, date_from, date_to, salary)
+
+        Returns:
+            int: значение found из ответа API
+        """
+        params = {
+            'text': search_query,
+            'page': 0,
+            'per_page': 1,
+            'area': DEFAULT_AREA,
+            **(extra_params or {}),
+        }
+        response = self._get(self.base_url, params=params, timeout=15)
+        response.raise_for_status()
+        return int(response.json().get('found', 0))
+
+    def iter_vacancy_pages(self, search_query: str = "Python", vacancy_count: int = 50,
+                           progress_callback=None, extra_params: dict = None, stop_event=None,
+                           known_ids=None, seen: SeenIds = None, on_complete=None, on_page_skipped=None):
+        """
+        Генератор страниц поисковой выдачи с уже обработанными вакансиями.
+
+        Каждая страница загружается и разбирается только тогда, когда
+        потребитель запрашивает следующий элемент, поэтому в памяти
+        одновременно находится не более одной страницы.
+
+        Args:
+            search_query: str (поисковый запрос для фильтрации вакансий)
+            vacancy_count: int (количество вакансий для получения, максимум MAX_VACANCY_COUNT)
+            progress_callback: callable (вызывается после каждой страницы как
+                progress_callback(pages_fetched=..., items_parsed=...))
+            extra_params: dict (параметры, дополняющие или заменяющие стандартные, например срез выдачи)
+            stop_event: threading.Event (досрочная остановка обхода между страницами)
+            known_ids: set (идентификаторы уже известных вакансий; такие вакансии не загружаются,
+                а обход прекращается на первой странице, где они встретились)
+            seen: SeenIds (общий учет вакансий нескольких обходов; вакансии, уже взятые
+                другим обходом, пропускаются без загрузки деталей, а обход продолжается)
+            on_complete: callable (вызывается без аргументов, если обход без пропусков дошел
+                до известных вакансий или до конца выдачи; не вызывается при достижении
+                vacancy_count, остановке, ошибке сети и пропуске страницы)
+            on_page_skipped: callable (вызывается без аргументов, когда страница пропущена
+                после MAX_PAGE_ATTEMPTS ошибок)
+
+        Yields:
+            list: список словарей с данными вакансий одной страницы
+        """
+        collected = 0
+        page = 0
+        page_failures = 0
+        pages_skipped = False
+
+        # Ограничиваем количество вакансий глубиной выдачи API HH.ru
+        if vacancy_count > MAX_VACANCY_COUNT:
+            vacancy_count = MAX_VACANCY_COUNT
+        per_page = min(50, vacancy_count)
+
+        while collected < vacancy_count:
+            if stop_event is not None and stop_event.is_set():
+                break
+
+            logger.info("Парсинг страницы %s, собрано %s/%s вакансий", page + 1, collected, vacancy_count)
+
+            params = {
+                'text': search_query,
+                'page': page,
+                'per_page': per_page,
+                'area': DEFAULT_AREA,
+                'only_with_salary': False,
+                **(extra_params or {}),
+            }
+
+            # Повторяется только загрузка страницы: после yield страница уже отдана
+            # потребителю, и повторный запрос вернул бы ему те же вакансии
+            try:
+                with metrics.timed(metrics.STAGE_DURATION, stage='fetch'):
+                    response = self._get(self.base_url, params=params, timeout=15)
+                    response.raise_for_status()
+                    data = response.json()
+                if not isinstance(data, dict):
+                    raise ValueError(f"ответ не является объектом JSON: {type(data).__name__}")
+            except requests.exceptions.RequestException as e:
+                # Временные сбои уже повторены в _get, здесь ошибка окончательная
+                logger.error("Ошибка сети при запросе: %s", e)
+                break
+            except Exception as e:
+                page_failures += 1
+                logger.warning("Общая ошибка на странице %s (попытка %s): %s", page + 1, page_failures, e)
+                if page_failures >= MAX_PAGE_ATTEMPTS:
+                    logger.error("Страница %s пропущена", page + 1)
+                    pages_skipped = True
+                    if on_page_skipped:
+                        on_page_skipped()
+                    page += 1
+                    page_failures = 0
+                continue
+            page_failures = 0
+            if self.archive:
+                self.archive.append_search(response)
+
+            if not data.get('items'):
+                logger.info("На странице %s нет вакансий", page + 1)
+                if on_complete and not pages_skipped:
+                    on_complete()
+                break
+            metrics.STAGE_ITEMS.inc(len(data['items']), stage='fetch')
+
+            items = data['items']
+            reached_known = False
+            if known_ids is not None:
+                fresh_items = [item for item in items if str(item.get('id')) not in known_ids]
+                reached_known = len(fresh_items) < len(items)
+                items = fresh_items
+
+            # Новые вакансии, отброшенные лимитом, не позволяют считать обход полным
+            truncated = len(items) > vacancy_count - collected
+            items = items[:vacancy_count - collected]
+            complete = not truncated and not pages_skipped
+            if seen is not None:
+                fresh_ids = seen.claim(str(item.get('id')) for item in items)
+                items = [item for item in items if str(item.get('id')) in fresh_ids]
+            page_vacancies = self.parse_vacancy_items(items)
+            collected += len(page_vacancies)
+
+            if progress_callback:
+                progress_callback(pages_fetched=page + 1, items_parsed=collected)
+
+            yield page_vacancies
+
+            if reached_known:
+                logger.info("Достигнуты уже известные вакансии")
+                if on_complete and complete:
+                    on_complete()
+                break
+
+            # Проверяем, есть ли еще страницы; без количества страниц текущая считается последней
+            if page >= data.get('pages', page + 1) - 1:
+                logger.info("Достигнут конец списка вакансий")
+                if on_complete and complete:
+                    on_complete()
+                break
+
+            page += 1
+
+        logger.info("Всего собрано вакансий: %s", collected)
+        if self.http_cache:
+            logger.info("HTTP-кэш: %s", self.http_cache.stats())
+
+    def parse_vacancy_items(self, items: list) -> list:
+        """
+        Параллельный парсинг вакансий одной страницы поисковой выдачи.
+
+        Запросы детальной информации выполняются в пуле потоков размером
+        max_workers; частоту запросов ограничивает общий rate_limiter.
+        Порядок вакансий сохраняется.
+
+        Args:
+            items: list (сырые данные вакансий со страницы поиска)
+
+        Returns:
+            list: список словарей с данными успешно обработанных вакансий
+        """
+        if not items:
+            return []
+
+        workers = min(self.max_workers, len(items))
+        with metrics.timed(metrics.STAGE_DURATION, stage='parse'):
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._safe_parse_vacancy_item, items))
+
+        parsed = [vacancy for vacancy in results if vacancy]
+        metrics.STAGE_ITEMS.inc(len(parsed), stage='parse')
+        return parsed
+
+    def _safe_parse_vacancy_item(self, vacancy_data: dict) -> dict:
+        """Парсит вакансию, перехватывая ошибки отдельного элемента."""
+        try:
+            return self.parse_vacancy_item(vacancy_data)
+        except Exception as e:
+            logger.warning("Ошибка парсинга вакансии: %s", e)
+            return None
+
+    def parse_vacancy_item(self, vacancy_data: dict) -> dict:
+        """
+        Парсинг отдельной вакансии и преобразование данных в единый формат.
+
+        Обрабатывает данные одной вакансии, извлекает основную информацию
+        и преобразует форматы данных в единый стандарт приложения.
+
+        Args:
+            vacancy_data: dict (сырые данные вакансии от API)
+
+        Returns:
+            dict: структурированные данные вакансии или None при ошибке
+        """
+        # Проверяем наличие обязательных данных до запроса детальной информации
+        if not vacancy_data.get('name') or not vacancy_data.get('alternate_url'):
+            logger.debug("Пропуск вакансии: отсутствуют обязательные данные")
+            return None
+
+        return normalize_vacancy(vacancy_data, self._fetch_details(vacancy_data.get('url')))
+
+    def _fetch_details(self, vacancy_url: str) -> dict:
+        """Детальная информация о вакансии или пустой словарь при ошибке."""
+        if not vacancy_url:
+            return {}
+
+        try:
+            return self.get_vacancy_details(vacancy_url)
+        except Exception as e:
+            logger.warning("Не удалось получить полное описание: %s", e)
+            return {}
+
+    def get_vacancy_details(self, vacancy_url: str) -> dict:
+        """
+        Получение детальной информации о вакансии через HTTP-кэш.
+
+        Свежая запись кэша возвращается без запроса к API; для устаревшей
+        отправляется условный запрос, и ответ 304 продлевает запись.
+
+        Args:
+            vacancy_url: str (URL детальной информации вакансии)
+
+        Returns:
+            dict: данные вакансии от API
+        """
+        cache = self.http_cache
+        entry = cache.lookup(vacancy_url) if cache else None
+
+        if entry and entry['fresh']:
+            cache.record('hit')
+            metrics.CACHE_LOOKUPS.inc(outcome='hit')
+            return json.loads(entry['body'])
+
+        headers = cache.conditional_headers(entry) if entry else {}
+        response = self._get(vacancy_url, headers=headers, timeout=10)
+
+        if entry and response.status_code == 304:
+            cache.refresh(vacancy_url)
+            cache.record('revalidated')
+            metrics.CACHE_LOOKUPS.inc(outcome='revalidated')
+            return json.loads(entry['body'])
+
+        response.raise_for_status()
+        if self.archive:
+            self.archive.append_detail(response)
+        if cache:
+            cache.store(vacancy_url, response.content,
+                        etag=response.headers.get('ETag'),
+                        last_modified=response.headers.get('Last-Modified'))
+            cache.record('miss')
+            metrics.CACHE_LOOKUPS.inc(outcome='miss')
+        return response.json()
+
+    def get_full_description(self, vacancy_url: str) -> str:
+        """
+        Получение полного описания вакансии по URL.
+
+        Выполняет дополнительный запрос для получения детального описания
+        вакансии и очищает HTML-разметку.
+
+        Args:
+            vacancy_url: str (URL для получения полного описания)
+
+        Returns:
+            str: очищенное текстовое описание вакансии
+        """
+        return clean_description(self._fetch_details(vacancy_url).get('description', ''))
+
+    def parse_salary(self, salary_data: dict) -> str:
+        """
+        Обработка и форматирование данных о зарплате.
+
+        Преобразует данные о зарплате из API в читаемый формат
+        с поддержкой диапазонов и различных валют.
+
+        Args:
+            salary_data: dict (данные о зарплате от API)
+
+        Returns:
+            str: отформатированная строка с информацией о зарплате
+        """
+        return format_salary(salary_data)
@@ -0,0 +1,293 @@
+"""
+Модуль hh_crawl.py содержит параллельный обход нескольких поисковых запросов и CLI.
+
+Запросы обходятся одновременно одним клиентом HHClient: у них общие пул
+соединений, ограничитель частоты и учет уже взятых вакансий (SeenIds),
+поэтому вакансия, найденная несколькими запросами, загружается один раз.
+Модуль не зависит от Django и запускается без настройки проекта:
+
+    python -m DjangoProject_HH_parser.Services.hh_crawl python golang "data engineer" --count 500
+
+Вакансии выводятся в формате JSON Lines; сохранение в базу данных
+выполняет команда manage.py hh_crawl с теми же параметрами. С --output -
+стандартный вывод содержит только строки JSON Lines (журнал и итоги
+пишутся в stderr), поэтому его можно передавать другой программе. Каждая
+страница записывается целыми строками, Ctrl+C во время записи откладывается
+до ее окончания, а поток сбрасывается и при прерывании, так что вывод не
+обрывается на середине строки.
+
+Основной функционал:
+- iter_query_pages: потоковая выдача страниц нескольких запросов
+- add_crawl_arguments / build_client: общие параметры CLI и команды hh_crawl
+- main: точка входа командной строки
+"""
+
+import argparse
+import json
+import logging
+import os
+import queue
+import signal
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from DjangoProject_HH_parser.Services.hh_client import (HHClient, SeenIds, BASE_API_URL, DEFAULT_MAX_WORKERS,
+                                                        MAX_VACANCY_COUNT)
+from DjangoProject_HH_parser.Services.http_cache import HttpCache
+from DjangoProject_HH_parser.Services.partitioning import iter_partitioned_pages
+from DjangoProject_HH_parser.Services.rate_limiter import RateLimiter, DEFAULT_RATE, DEFAULT_BURST
+
+# Константы
+DEFAULT_QUERY_COUNT = 100
+DEFAULT_PARALLEL_QUERIES = 4
+QUEUE_SIZE = 16
+LOG_FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
+_DONE = object()
+
+logger = logging.getLogger(__name__)
+
+
+def iter_query_pages(client: HHClient, queries: list, vacancy_count: int,
+                     max_parallel: int = DEFAULT_PARALLEL_QUERIES, seen: SeenIds = None):
+    """
+    Генератор страниц вакансий, собранных параллельным обходом нескольких запросов.
+
+    Каждый запрос обходится в своем потоке; вакансии, уже взятые другим
+    запросом, пропускаются до загрузки детальной информации. Запросы больше
+    MAX_VACANCY_COUNT обходятся по срезам (partitioning.iter_partitioned_pages).
+
+    Args:
+        client: HHClient (общий клиент API)
+        queries: list (поисковые запросы)
+        vacancy_count: int (количество новых вакансий на один запрос)
+        max_parallel: int (количество одновременно обходимых запросов)
+        seen: SeenIds (учет обработанных вакансий; создается при отсутствии)
+
+    Yields:
+        tuple: (запрос, список вакансий очередной страницы)
+    """
+    queries = list(dict.fromkeys(query.strip() for query in queries if query and query.strip()))
+    if not queries:
+        return
+
+    seen = seen if seen is not None else SeenIds()
+    pages = queue.Queue(maxsize=QUEUE_SIZE)
+    stop_event = threading.Event()
+
+    def put(item) -> None:
+        while not stop_event.is_set():
+            try:
+                pages.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def crawl_query(search_query: str) -> None:
+        try:
+            if vacancy_count > MAX_VACANCY_COUNT:
+                query_pages = iter_partitioned_pages(client, search_query, vacancy_count, seen=seen)
+            else:
+                query_pages = client.iter_vacancy_pages(search_query, vacancy_count,
+                                                        stop_event=stop_event, seen=seen)
+            for page_vacancies in query_pages:
+                if stop_event.is_set():
+                    break
+                put((search_query, page_vacancies))
+        except Exception as e:
+            logger.error("Ошибка обхода запроса '%s': %s", search_query, e)
+        finally:
+            put(_DONE)
+
+    finished = 0
+    executor = ThreadPoolExecutor(max_workers=max(1, max_parallel), thread_name_prefix='hh-query')
+    try:
+        for search_query in queries:
+            executor.submit(crawl_query, search_query)
+
+        while finished < len(queries):
+            item = pages.get()
+            if item is _DONE:
+                finished += 1
+                continue
+            if item[1]:
+                yield item
+    finally:
+        stop_event.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def add_crawl_arguments(parser) -> None:
+    """
+    Регистрация параметров обхода, общих для CLI и команды manage.py hh_crawl.
+
+    Args:
+        parser: argparse.ArgumentParser (парсер аргументов)
+    """
+    parser.add_argument('queries', nargs='*', help="Поисковые запросы")
+    parser.add_argument('--queries-file', default=None,
+                        help="Файл с поисковыми запросами, по одному в строке")
+    parser.add_argument('--count', type=int, default=DEFAULT_QUERY_COUNT,
+                        help="Количество вакансий на один запрос")
+    parser.add_argument('--parallel', type=int, default=DEFAULT_PARALLEL_QUERIES,
+                        help="Количество одновременно обходимых запросов")
+    parser.add_argument('--workers', type=int, default=DEFAULT_MAX_WORKERS,
+                        help="Количество потоков загрузки деталей на один запрос")
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help="Общее ограничение запросов в секунду")
+    parser.add_argument('--base-url', default=BASE_API_URL,
+                        help="Адрес поиска вакансий (например, локального fake_hh_server)")
+    parser.add_argument('--output', default=None,
+                        help="Файл для вакансий в формате JSON Lines ('-' — стандартный вывод, "
+                             "в который пишутся только строки JSON Lines)")
+
+
+def read_queries(options: dict) -> list:
+    """
+    Поисковые запросы из аргументов и файла.
+
+    Args:
+        options: dict (разобранные аргументы)
+
+    Returns:
+        list: запросы без повторов в исходном порядке
+    """
+    queries = list(options.get('queries') or [])
+    if options.get('queries_file'):
+        with open(options['queries_file'], encoding='utf-8') as file:
+            queries.extend(file)
+    return list(dict.fromkeys(query.strip() for query in queries if query.strip()))
+
+
+def client_options(options: dict) -> dict:
+    """
+    Параметры конструктора клиента: общий пул соединений на все запросы.
+
+    Args:
+        options: dict (разобранные аргументы)
+
+    Returns:
+        dict: именованные аргументы HHClient
+    """
+    parallel = max(1, options['parallel'])
+    workers = max(1, options['workers'])
+    return {
+        'max_workers': workers,
+        'rate_limiter': RateLimiter(options['rate'], DEFAULT_BURST),
+        'pool_size': parallel * workers + parallel,
+        'base_url': options['base_url'],
+    }
+
+
+def build_client(options: dict) -> HHClient:
+    """
+    Клиент для CLI: HTTP-кэш включается параметром --cache.
+
+    Args:
+        options: dict (разобранные аргументы)
+
+    Returns:
+        HHClient: клиент API
+    """
+    http_cache = HttpCache(options['cache']) if options.get('cache') else None
+    return HHClient(http_cache=http_cache, **client_options(options))
+
+
+def write_vacancies(stream, search_query: str, vacancies: list) -> None:
+    """
+    Запись вакансий в формате JSON Lines.
+
+    Страница записывается одним вызовом write, чтобы прерывание не оставило
+    в потоке оборванную строку.
+
+    Args:
+        stream: file (поток вывода)
+        search_query: str (запрос, которым найдены вакансии)
+        vacancies: list (данные вакансий)
+    """
+    lines = [json.dumps({'query': search_query, **vacancy}, ensure_ascii=False) + '\n' for vacancy in vacancies]
+    stream.write(''.join(lines))
+
+
+class DeferredInterrupt:
+    """
+    Контекстный менеджер, откладывающий KeyboardInterrupt до конца блока.
+
+    Прерывание посреди записи в заполненный канал оставляет в выводе часть
+    строки; сигнал SIGINT, полученный внутри блока, обрабатывается после
+    его завершения. Вне основного потока менеджер ничего не делает.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация менеджера."""
+        self._received = False
+        self._previous = None
+
+    def _handle(self, signum, frame) -> None:
+        """Запоминает сигнал до конца блока."""
+        self._received = True
+
+    def __enter__(self) -> 'DeferredInterrupt':
+        """Установка обработчика SIGINT на время блока."""
+        if threading.current_thread() is threading.main_thread():
+            self._received = False
+            self._previous = signal.signal(signal.SIGINT, self._handle)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Восстановление обработчика и прерывание, если сигнал был получен."""
+        if self._previous is None:
+            return
+        signal.signal(signal.SIGINT, self._previous)
+        self._previous = None
+        if self._received:
+            raise KeyboardInterrupt
+
+
+def main(argv: list = None) -> int:
+    """
+    Точка входа командной строки.
+
+    Args:
+        argv: list (аргументы; по умолчанию sys.argv)
+
+    Returns:
+        int: код завершения
+    """
+    parser = argparse.ArgumentParser(prog='hh_crawl', description="Параллельный обход поисковых запросов HH.ru")
+    add_crawl_arguments(parser)
+    parser.add_argument('--cache', default=None, help="Файл HTTP-кэша детальной информации (SQLite)")
+    parser.add_argument('--log-level', default=os.environ.get('HH_LOG_LEVEL', 'INFO'),
+                        help="Уровень журналирования")
+    options = vars(parser.parse_args(argv))
+    logging.basicConfig(level=options['log_level'].upper(), format=LOG_FORMAT, stream=sys.stderr)
+
+    queries = read_queries(options)
+    if not queries:
+        parser.error("не заданы поисковые запросы")
+
+    client = build_client(options)
+    output = options['output']
+    stream = open(output, 'w', encoding='utf-8') if output and output != '-' else sys.stdout
+    counts = dict.fromkeys(queries, 0)
+    try:
+        for search_query, vacancies in iter_query_pages(client, queries, options['count'], options['parallel']):
+            with DeferredInterrupt():
+                write_vacancies(stream, search_query, vacancies)
+            counts[search_query] += len(vacancies)
+    except KeyboardInterrupt:
+        logger.warning("Обход прерван")
+        return 130
+    finally:
+        if stream is sys.stdout:
+            stream.flush()
+        else:
+            stream.close()
+
+    for search_query, count in counts.items():
+        logger.info("Запрос '%s': %s вакансий", search_query, count)
+    logger.info("Всего уникальных вакансий: %s", sum(counts.values()))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
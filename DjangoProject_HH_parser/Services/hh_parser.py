@@ -1,302 +1,391 @@
 """
-Модуль hh_parser.py содержит класс HHApiParser для парсинга вакансий с HeadHunter API.
+Модуль hh_parser.py содержит класс HHApiParser — адаптер сохранения вакансий в базу данных.
+
+Загрузка и разбор вакансий выполняются клиентом HHClient (hh_client.py),
+который не зависит от Django; HHApiParser добавляет к нему HTTP-кэш из
+настроек проекта и сохранение в модель Vacancy вместе с поисковым индексом,
+индексом навыков и кластерами дубликатов. Модуль импортируется после
+настройки Django (manage.py, веб-сервер или django.setup() в скрипте).
 
 Основной функционал:
-- Парсинг вакансий по поисковым запросам
-- Обработка и нормализация данных вакансий
-- Сохранение данных в базу данных
-- Обработка ошибок API и сетевых сбоев
+- Сохранение данных в базу данных (пакетное и построчное)
+- Пропуск неизменившихся вакансий по хэшу содержимого и история изменений (services/revisions.py)
+- Полные описания в сжатой таблице VacancyDescription (services/descriptions.py)
+- Общий HTTP-кэш детальной информации по настройке HH_HTTP_CACHE
+- Архив исходных ответов API по настройке HH_PAYLOAD_ARCHIVE
+- Метрики записи в БД (metrics.py) и журналирование через logging
 """
 
-import requests
-import time
+import logging
 import os
-import django
-import sys
-import re
-from django.utils import timezone
+import threading
+import time
+from django.conf import settings
+from django.db import transaction
 from hhparser.models import Vacancy
-
-# Настройка Django окружения
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'DjangoProject_HH_parser.settings')
-django.setup()
+from hhparser.services.search import index_vacancies
+from hhparser.services.skills import sync_vacancy_skills, split_skills
+from hhparser.services.dedup import assign_clusters
+from hhparser.services.statistics import invalidate_statistics
+from hhparser.services.revisions import TRACKED_FIELDS, content_hash, diff_vacancy, record_revisions
+from hhparser.services.descriptions import description_preview, load_descriptions, store_descriptions
+from hhparser.services.signals import derived_indexes_deferred
+from DjangoProject_HH_parser.Services.hh_client import HHClient, DEFAULT_MAX_WORKERS
+from DjangoProject_HH_parser.Services.http_cache import HttpCache
+from DjangoProject_HH_parser.Services.payload_archive import PayloadArchive, DEFAULT_SEGMENT_BYTES
+from DjangoProject_HH_parser.Services.rate_limiter import RateLimiter
+from DjangoProject_HH_parser.Services.retry_policy import RetryPolicy
+from DjangoProject_HH_parser.Services import metrics
 
 # Константы
-USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 YaBrowser/25.6.0.0 Safari/537.36"
-BASE_API_URL = "https://api.hh.ru/vacancies"
+BULK_BATCH_SIZE = 500
+BULK_UPDATE_FIELDS = [*TRACKED_FIELDS, 'content_hash']
+
+logger = logging.getLogger(__name__)
+
+_default_http_cache = None
+_default_http_cache_lock = threading.Lock()
+_default_payload_archive = None
+_default_payload_archive_lock = threading.Lock()
+
 
+def get_default_http_cache() -> HttpCache:
+    """
+    Общий для процесса HTTP-кэш детальной информации по настройке HH_HTTP_CACHE.
 
-class HHApiParser:
+    Returns:
+        HttpCache: экземпляр кэша или None, если кэш отключен в настройках
+    """
+    global _default_http_cache
+    config = getattr(settings, 'HH_HTTP_CACHE', {})
+    if not config.get('ENABLED', True):
+        return None
+    with _default_http_cache_lock:
+        if _default_http_cache is None:
+            _default_http_cache = HttpCache(
+                config.get('PATH', os.path.join(settings.BASE_DIR, '.hh_cache', 'http_cache.sqlite3')),
+                ttl=config.get('TTL', 30 * 60),
+                max_bytes=config.get('MAX_BYTES', 256 * 1024 * 1024),
+            )
+        return _default_http_cache
+
+
+def get_default_payload_archive() -> PayloadArchive:
     """
-    Парсер для взаимодействия с API HeadHunter и получения данных о вакансиях.
+    Общий для процесса архив исходных ответов API по настройке HH_PAYLOAD_ARCHIVE.
 
-    Обеспечивает сбор, обработку и сохранение данных вакансий с поддержкой
-    фильтрации, пагинации и обработки ошибок API.
+    Returns:
+        PayloadArchive: архив или None, если архивирование отключено в настройках
     """
+    global _default_payload_archive
+    config = getattr(settings, 'HH_PAYLOAD_ARCHIVE', {})
+    if not config.get('ENABLED', True):
+        return None
+    with _default_payload_archive_lock:
+        if _default_payload_archive is None:
+            _default_payload_archive = PayloadArchive(
+                config.get('PATH', os.path.join(settings.BASE_DIR, '.hh_archive')),
+                max_segment_bytes=config.get('SEGMENT_BYTES', DEFAULT_SEGMENT_BYTES),
+            )
+        return _default_payload_archive
+
+
+class HHApiParser(HHClient):
+    """
+    Парсер вакансий HeadHunter с сохранением в базу данных.
 
-    def __init__(self) -> None:
+    Наследует загрузку и разбор вакансий от HHClient и добавляет
+    сохранение с проверкой уникальности по ссылке.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, rate_limiter: RateLimiter = None,
+                 http_cache: HttpCache = None, retry_policy: RetryPolicy = None,
+                 archive: PayloadArchive = None, **kwargs) -> None:
         """
-        Инициализация парсера с настройками HTTP-сессии.
+        Инициализация парсера.
 
-        Создает сессию requests с пользовательскими заголовками
-        для корректной работы с API HH.ru.
+        Args:
+            max_workers: int (максимальное количество параллельных запросов деталей вакансий)
+            rate_limiter: RateLimiter (общий ограничитель частоты запросов, создается при отсутствии)
+            http_cache: HttpCache (кэш детальной информации, по умолчанию get_default_http_cache())
+            retry_policy: RetryPolicy (политика повторов запросов, создается при отсутствии)
+            archive: PayloadArchive (архив ответов API, по умолчанию get_default_payload_archive())
+            **kwargs: остальные параметры HHClient (pool_size, base_url)
         """
-        self.base_url = BASE_API_URL
-        self.session = requests.Session()
-        self.session.headers.update({
-            'user-agent': USER_AGENT,
-            'HH-User-Agent': 'HH Parser App'
-        })
-
-    def parse_vacancies(self, search_query: str = "Python", vacancy_count: int = 50) -> list:
+        super().__init__(
+            max_workers=max_workers,
+            rate_limiter=rate_limiter,
+            http_cache=http_cache if http_cache is not None else get_default_http_cache(),
+            retry_policy=retry_policy,
+            archive=archive if archive is not None else get_default_payload_archive(),
+            **kwargs,
+        )
+
+    def save_to_database(self, vacancies: list, bulk: bool = True, update_indexes: bool = True,
+                         written_ids: set = None, pending_skills: dict = None) -> int:
         """
-        Основной метод для парсинга вакансий по заданным параметрам.
+        Сохранение вакансий в базу данных с проверкой уникальности.
 
-        Выполняет поиск вакансий с поддержкой пагинации и ограничений API.
-        Обрабатывает сетевые ошибки и ограничения на количество запросов.
+        Выполняет валидацию данных и сохраняет/обновляет записи в базе данных.
+        Обеспечивает уникальность записей по ссылке на вакансию.
+
+        В пакетном режиме (по умолчанию) хэши существующих записей загружаются
+        запросом link__in; вакансии с неизменившимся хэшем содержимого не
+        перезаписываются, остальные пишутся через bulk_create с
+        update_conflicts по полю link в одной транзакции, а изменившиеся поля
+        обновленных вакансий сохраняются в VacancyRevision. В строку вакансии
+        пишется краткое описание, полные текст и HTML — в VacancyDescription.
+        После сохранения обновляется индекс навыков (services/skills.py) по
+        полным спискам key_skills.
+
+        При массовой загрузке (update_indexes=False) поисковый индекс и
+        кластеры дубликатов в пакетном режиме не обновляются: их обновляют
+        один раз после загрузки по идентификаторам, собранным в written_ids
+        (index_vacancies, assign_clusters). Если передан pending_skills,
+        индекс навыков тоже не синхронизируется: полные списки навыков
+        записанных вакансий добавляются в него для sync_vacancy_skills
+        крупными пакетами.
 
         Args:
-            search_query: str (поисковый запрос для фильтрации вакансий, по умолчанию "Python")
-            vacancy_count: int (количество вакансий для получения, максимум 500)
+            vacancies: list (список словарей с данными вакансий)
+            bulk: bool (пакетное сохранение вместо update_or_create по одной записи)
+            update_indexes: bool (обновлять поисковый индекс и кластеры дубликатов после записи)
+            written_ids: set (множество, в которое добавляются идентификаторы записанных вакансий)
+            pending_skills: dict (словарь ссылка → навыки для отложенной синхронизации индекса навыков)
 
         Returns:
-            list: список словарей с данными вакансий
+            int: количество успешно обработанных вакансий (включая неизменившиеся)
         """
-        all_vacancies = []
-        page = 0
-        per_page = min(50, vacancy_count)
-
-        # Ограничиваем максимальное количество вакансий для избежания лимитов API
-        if vacancy_count > 500:
-            vacancy_count = 500
-
-        while len(all_vacancies) < vacancy_count:
-            print(f"Парсинг страницы {page + 1}, собрано {len(all_vacancies)}/{vacancy_count} вакансий")
-
-            params = {
-                'text': search_query,
-                'page': page,
-                'per_page': per_page,
-                'area': 1,  # Москва
-                'only_with_salary': False,
-            }
+        prepared = []
+        skills_by_link = {}
+        descriptions_by_link = {}
+        skipped_count = 0
 
+        for vacancy_info in vacancies:
+            vacancy_data = self._prepare_vacancy(vacancy_info)
+            if vacancy_data is None:
+                skipped_count += 1
+            else:
+                prepared.append(vacancy_data)
+                skills_by_link[vacancy_data['link']] = (vacancy_info.get('key_skills')
+                                                        or split_skills(vacancy_data['skills']))
+                descriptions_by_link[vacancy_data['link']] = (vacancy_info.get('description', ''),
+                                                              vacancy_info.get('description_html', ''))
+
+        started = time.perf_counter()
+        if bulk:
             try:
-                response = self.session.get(self.base_url, params=params, timeout=15)
-                response.raise_for_status()
-                data = response.json()
-
-                if 'items' not in data or not data['items']:
-                    print(f"На странице {page + 1} нет вакансий")
-                    break
-
-                for vacancy_data in data['items']:
-                    if len(all_vacancies) >= vacancy_count:
-                        break
-
-                    try:
-                        vacancy = self.parse_vacancy_item(vacancy_data)
-                        if vacancy:
-                            all_vacancies.append(vacancy)
-                    except Exception as e:
-                        print(f"Ошибка парсинга вакансии: {e}")
-                        continue
-
-                # Проверяем, есть ли еще страницы
-                if page >= data['pages'] - 1:
-                    print("Достигнут конец списка вакансий")
-                    break
-
-                page += 1
-                time.sleep(0.5)  # Уважаем API HH.ru
-
-            except requests.exceptions.RequestException as e:
-                print(f"Ошибка сети при запросе: {e}")
-                break
+                with metrics.timed(metrics.DB_WRITE_DURATION, mode='bulk'):
+                    saved_count, updated_count, unchanged_count, written = \
+                        self._bulk_save(prepared, descriptions_by_link, update_indexes)
             except Exception as e:
-                print(f"Общая ошибка: {e}")
-                continue
-
-        print(f"Всего собрано вакансий: {len(all_vacancies)}")
-        return all_vacancies
-
-    def parse_vacancy_item(self, vacancy_data: dict) -> dict:
+                logger.error("Ошибка пакетного сохранения, переход к построчному: %s", e)
+                with metrics.timed(metrics.DB_WRITE_DURATION, mode='row'):
+                    (saved_count, updated_count, unchanged_count,
+                     failed_count, written) = self._save_one_by_one(prepared, descriptions_by_link)
+                skipped_count += failed_count
+        else:
+            with metrics.timed(metrics.DB_WRITE_DURATION, mode='row'):
+                (saved_count, updated_count, unchanged_count,
+                 failed_count, written) = self._save_one_by_one(prepared, descriptions_by_link)
+            skipped_count += failed_count
+
+        logger.info("Итог: сохранено %s, обновлено %s, без изменений %s, пропущено %s",
+                    saved_count, updated_count, unchanged_count, skipped_count)
+        total_processed = saved_count + updated_count + unchanged_count
+        if written:
+            # bulk_create не отправляет сигналы, а текстовое поле навыков обрезано,
+            # поэтому индекс навыков синхронизируется явно по полным спискам
+            written_skills = {link: skills_by_link[link] for link in written}
+            if pending_skills is None:
+                sync_vacancy_skills(written_skills)
+            else:
+                pending_skills.update(written_skills)
+            if written_ids is not None:
+                written_ids.update(written.values())
+            invalidate_statistics()
+
+        metrics.DB_ROWS.inc(saved_count, result='created')
+        metrics.DB_ROWS.inc(updated_count, result='updated')
+        metrics.DB_ROWS.inc(unchanged_count, result='unchanged')
+        metrics.DB_ROWS.inc(skipped_count, result='skipped')
+        metrics.STAGE_ITEMS.inc(total_processed, stage='save')
+        metrics.STAGE_DURATION.observe(time.perf_counter() - started, stage='save')
+        return total_processed
+
+    def _prepare_vacancy(self, vacancy_info: dict) -> dict:
         """
-        Парсинг отдельной вакансии и преобразование данных в единый формат.
-
-        Обрабатывает данные одной вакансии, извлекает основную информацию
-        и преобразует форматы данных в единый стандарт приложения.
+        Валидация и подготовка данных вакансии к сохранению.
 
         Args:
-            vacancy_data: dict (сырые данные вакансии от API)
+            vacancy_info: dict (данные вакансии после парсинга)
 
         Returns:
-            dict: структурированные данные вакансии или None при ошибке
+            dict: значения полей модели Vacancy или None, если вакансию нужно пропустить
         """
-        # Проверяем наличие обязательных данных
-        if not vacancy_data.get('name') or not vacancy_data.get('alternate_url'):
-            print(f"❌ Пропуск вакансии: отсутствуют обязательные данные")
+        # Проверяем обязательные поля
+        if not vacancy_info.get('title'):
+            logger.debug("Пропуск: отсутствует название")
             return None
 
-        experience_map = {
-            'noExperience': 'no',
-            'between1And3': '1-3',
-            'between3And6': '3-6',
-            'moreThan6': '6+'
-        }
+        if not vacancy_info.get('link'):
+            logger.debug("Пропуск '%s': отсутствует ссылка", vacancy_info.get('title', ''))
+            return None
 
-        employment_map = {
-            'full': 'full',
-            'part': 'part',
-            'remote': 'remote',
-            'project': 'project'
-        }
+        # Проверяем корректность ссылки
+        if not vacancy_info['link'].startswith('http'):
+            logger.debug("Пропуск '%s': некорректная ссылка '%s'", vacancy_info['title'], vacancy_info['link'])
+            return None
 
-        experience = experience_map.get(vacancy_data.get('experience', {}).get('id'), 'no')
-        employment = employment_map.get(vacancy_data.get('employment', {}).get('id'), 'full')
-        description = self.get_full_description(vacancy_data.get('url'))
-
-        # Обрабатываем навыки
-        skills_text = ', '.join([skill['name'] for skill in vacancy_data.get('key_skills', [])])
-        if len(skills_text) > 1000:  # Ограничиваем длину
-            skills_text = skills_text[:1000] + "..."
-
-        vacancy_info = {
-            'title': vacancy_data.get('name', 'Без названия').strip(),
-            'company': vacancy_data.get('employer', {}).get('name', 'Не указано').strip(),
-            'salary': self.parse_salary(vacancy_data.get('salary')),
-            'description': description,
-            'experience': experience,
-            'employment': employment,
-            'skills': skills_text,
-            'link': vacancy_data.get('alternate_url', '').strip(),
+        description = vacancy_info.get('description', '')
+        vacancy_data = {
+            'link': vacancy_info['link'].strip(),
+            'title': vacancy_info.get('title', '').strip(),
+            'company': vacancy_info.get('company', '').strip(),
+            'salary': vacancy_info.get('salary', 'Не указана'),
+            'salary_from': vacancy_info.get('salary_from'),
+            'salary_to': vacancy_info.get('salary_to'),
+            'currency': vacancy_info.get('currency', ''),
+            'description': description_preview(description),
+            'experience': vacancy_info.get('experience', 'no'),
+            'employment': vacancy_info.get('employment', 'full'),
+            'skills': vacancy_info.get('skills', ''),
         }
+        # Хэш учитывает полный текст: изменения за пределами краткого описания не теряются
+        vacancy_data['content_hash'] = content_hash({**vacancy_data, 'description': description})
+        return vacancy_data
 
-        return vacancy_info
-
-    def get_full_description(self, vacancy_url: str) -> str:
+    def _bulk_save(self, prepared: list, descriptions: dict, update_indexes: bool = True) -> tuple:
         """
-        Получение полного описания вакансии по URL.
-
-        Выполняет дополнительный запрос для получения детального описания
-        вакансии и очищает HTML-разметку.
+        Пакетное сохранение подготовленных вакансий.
 
         Args:
-            vacancy_url: str (URL для получения полного описания)
+            prepared: list (словари значений полей из _prepare_vacancy)
+            descriptions: dict (ссылка → полные текст и HTML описания)
+            update_indexes: bool (обновлять поисковый индекс и кластеры дубликатов)
 
         Returns:
-            str: очищенное текстовое описание вакансии
+            tuple: (новых записей, обновленных записей, записей без изменений,
+                    словарь ссылка → идентификатор записанных вакансий)
         """
-        if not vacancy_url:
-            return ""
-
-        try:
-            response = self.session.get(vacancy_url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            description = data.get('description', '')
-            clean_description = re.sub('<[^<]+?>', '', description)
-            return clean_description[:1500]  # Ограничиваем длину
-
-        except Exception as e:
-            print(f"Не удалось получить полное описание: {e}")
-            return ""
-
-    def parse_salary(self, salary_data: dict) -> str:
+        # Дубликаты внутри пакета: побеждает последняя версия
+        by_link = {vacancy_data['link']: vacancy_data for vacancy_data in prepared}
+        if not by_link:
+            return 0, 0, 0, {}
+
+        links = list(by_link)
+        existing = {}
+        for start in range(0, len(links), BULK_BATCH_SIZE):
+            existing.update(
+                (link, (vacancy_id, stored_hash)) for link, vacancy_id, stored_hash in
+                Vacancy.objects.filter(link__in=links[start:start + BULK_BATCH_SIZE])
+                .values_list('link', 'id', 'content_hash')
+            )
+
+        # Неизменившиеся вакансии не перезаписываются и не переиндексируются
+        written = [link for link in links
+                   if link not in existing or existing[link][1] != by_link[link]['content_hash']]
+        unchanged_count = len(links) - len(written)
+        if not written:
+            return 0, 0, unchanged_count, {}
+
+        changed_ids = {existing[link][0]: link for link in written if link in existing}
+        ids = list(changed_ids)
+        previous = {}
+        previous_descriptions = {}
+        for start in range(0, len(ids), BULK_BATCH_SIZE):
+            chunk = ids[start:start + BULK_BATCH_SIZE]
+            for values in Vacancy.objects.filter(id__in=chunk).values('id', *TRACKED_FIELDS):
+                previous[values.pop('id')] = values
+            # Полные описания читаются до перезаписи: правка конца текста не видна в кратком
+            previous_descriptions.update(load_descriptions(chunk))
+
+        objects = [Vacancy(**by_link[link]) for link in written]
+        with transaction.atomic():
+            Vacancy.objects.bulk_create(
+                objects,
+                batch_size=BULK_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=['link'],
+                update_fields=BULK_UPDATE_FIELDS,
+            )
+            # У записей без хэша (сохраненных до его появления) с прежними значениями
+            # изменений нет: они только получают хэш
+            record_revisions({vacancy_id: diff_vacancy(previous[vacancy_id], by_link[link],
+                                                       previous_descriptions.get(vacancy_id), descriptions[link][0])
+                              for vacancy_id, link in changed_ids.items() if vacancy_id in previous})
+            # Полные описания записываются до индексации: индекс и дубликаты строятся по ним
+            ids_by_link = {}
+            for start in range(0, len(written), BULK_BATCH_SIZE):
+                ids_by_link.update(Vacancy.objects.filter(link__in=written[start:start + BULK_BATCH_SIZE])
+                                   .values_list('link', 'id'))
+            store_descriptions({vacancy_id: descriptions[link] for link, vacancy_id in ids_by_link.items()})
+            # bulk_create не отправляет сигналы, поэтому индекс и кластеры дубликатов обновляются явно
+            if update_indexes:
+                index_vacancies(links=written)
+                assign_clusters(links=written)
+
+        updated_count = len(changed_ids)
+        return len(objects) - updated_count, updated_count, unchanged_count, ids_by_link
+
+    def _save_one_by_one(self, prepared: list, descriptions: dict) -> tuple:
         """
-        Обработка и форматирование данных о зарплате.
+        Построчное сохранение через update_or_create.
 
-        Преобразует данные о зарплате из API в читаемый формат
-        с поддержкой диапазонов и различных валют.
+        Обработчики post_save поискового индекса, кластеров дубликатов и
+        навыков на время записи отключены: они видят только краткое описание
+        и обрезанное поле навыков. Индекс и кластеры обновляются здесь после
+        записи полного описания, навыки — в save_to_database по полным спискам.
 
         Args:
-            salary_data: dict (данные о зарплате от API)
+            prepared: list (словари значений полей из _prepare_vacancy)
+            descriptions: dict (ссылка → полные текст и HTML описания)
 
         Returns:
-            str: отформатированная строка с информацией о зарплате
-        """
-        if not salary_data:
-            return "Не указана"
-
-        salary_from = salary_data.get('from')
-        salary_to = salary_data.get('to')
-        currency = '₽' if salary_data.get('currency') == 'RUR' else salary_data.get('currency', '')
-
-        if salary_from and salary_to:
-            return f"{salary_from:,} - {salary_to:,} {currency}".replace(',', ' ')
-        elif salary_from:
-            return f"от {salary_from:,} {currency}".replace(',', ' ')
-        elif salary_to:
-            return f"до {salary_to:,} {currency}".replace(',', ' ')
-        else:
-            return "Не указана"
-
-    def save_to_database(self, vacancies: list) -> int:
-        """
-        Сохранение вакансий в базу данных с проверкой уникальности.
-
-        Выполняет валидацию данных и сохраняет/обновляет записи в базе данных.
-        Обеспечивает уникальность записей по ссылке на вакансию.
-
-        Args:
-            vacancies: list (список словарей с данными вакансий)
-
-        Returns:
-            int: количество успешно обработанных вакансий
+            tuple: (сохранено, обновлено, без изменений, пропущено из-за ошибок,
+                    словарь ссылка → идентификатор записанных вакансий)
         """
         saved_count = 0
         updated_count = 0
-        skipped_count = 0
+        unchanged_count = 0
+        failed_count = 0
+        written = {}
 
-        for vacancy_info in vacancies:
+        for vacancy_data in prepared:
             try:
-                # Проверяем обязательные поля
-                if not vacancy_info.get('title'):
-                    print(f"❌ Пропуск: отсутствует название")
-                    skipped_count += 1
-                    continue
-
-                if not vacancy_info.get('link'):
-                    print(f"❌ Пропуск '{vacancy_info.get('title', '')}': отсутствует ссылка")
-                    skipped_count += 1
-                    continue
+                defaults = dict(vacancy_data)
+                link = defaults.pop('link')
 
-                # Проверяем корректность ссылки
-                if not vacancy_info['link'].startswith('http'):
-                    print(f"❌ Пропуск '{vacancy_info['title']}': некорректная ссылка '{vacancy_info['link']}'")
-                    skipped_count += 1
+                previous = Vacancy.objects.filter(link=link).values('id', 'content_hash', *TRACKED_FIELDS).first()
+                if previous and previous['content_hash'] == defaults['content_hash']:
+                    unchanged_count += 1
                     continue
 
-                # Подготавливаем данные
-                vacancy_data = {
-                    'title': vacancy_info.get('title', '').strip(),
-                    'company': vacancy_info.get('company', '').strip(),
-                    'salary': vacancy_info.get('salary', 'Не указана'),
-                    'description': vacancy_info.get('description', ''),
-                    'experience': vacancy_info.get('experience', 'no'),
-                    'employment': vacancy_info.get('employment', 'full'),
-                    'skills': vacancy_info.get('skills', ''),
-                }
-
                 # Сохраняем или обновляем
-                obj, created = Vacancy.objects.update_or_create(
-                    link=vacancy_info['link'].strip(),
-                    defaults=vacancy_data
-                )
+                with transaction.atomic(), derived_indexes_deferred():
+                    obj, created = Vacancy.objects.update_or_create(
+                        link=link,
+                        defaults=defaults
+                    )
+                    if previous:
+                        record_revisions({obj.id: diff_vacancy(previous, defaults,
+                                                               load_descriptions([obj.id]).get(obj.id),
+                                                               descriptions[link][0])})
+                    store_descriptions({obj.id: descriptions[link]})
+                    index_vacancies(vacancy_ids=[obj.id])
+                    assign_clusters(vacancy_ids=[obj.id])
+                written[link] = obj.id
 
                 if created:
                     saved_count += 1
-                    print(f"✅ Сохранена: {vacancy_info['title'][:60]}...")
+                    logger.debug("Сохранена: %s", vacancy_data['title'][:60])
                 else:
                     updated_count += 1
-                    print(f"🔄 Обновлена: {vacancy_info['title'][:60]}...")
+                    logger.debug("Обновлена: %s", vacancy_data['title'][:60])
 
             except Exception as e:
-                print(f"❌ Ошибка сохранения '{vacancy_info.get('title', 'Без названия')}': {e}")
-                skipped_count += 1
+                logger.warning("Ошибка сохранения '%s': %s", vacancy_data.get('title', 'Без названия'), e)
+                failed_count += 1
                 continue
 
-        print(f"📊 Итог: сохранено {saved_count}, обновлено {updated_count}, пропущено {skipped_count}")
-        total_processed = saved_count + updated_count
-        return total_processed
\ No newline at end of file
+        return saved_count, updated_count, unchanged_count, failed_count, written
@@ -0,0 +1,222 @@
+"""
+Модуль http_cache.py содержит локальный дисковый HTTP-кэш для ответов API HH.ru.
+
+Основной класс:
+- HttpCache: кэш в файле SQLite с поддержкой ETag/Last-Modified,
+  временем жизни записей, вытеснением по размеру (LRU) и счетчиками
+  попаданий и промахов.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+# Константы
+DEFAULT_TTL = 30 * 60  # секунд, в течение которых запись отдается без запроса к API
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+EVICT_TARGET = 0.9  # доля max_bytes, до которой кэш сокращается при вытеснении
+RESYNC_WRITES = 1000  # записей между сверками размера с файлом (его пишут и другие процессы)
+EVICT_BATCH_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS http_cache_accessed_at ON http_cache (accessed_at);
+"""
+
+
+class HttpCache:
+    """
+    Дисковый HTTP-кэш с условными запросами.
+
+    Свежие записи (младше ttl) отдаются без обращения к API. Для устаревших
+    записей клиент отправляет If-None-Match/If-Modified-Since и при ответе
+    304 продлевает запись через refresh. Суммарный размер тел ограничен
+    max_bytes, при превышении удаляются давно не читавшиеся записи.
+    Размер кэша хранится в памяти и изменяется при каждой записи, поэтому
+    store не суммирует всю таблицу; с файлом он сверяется раз в
+    RESYNC_WRITES записей и перед вытеснением.
+    """
+
+    def __init__(self, path: str, ttl: float = DEFAULT_TTL, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Открытие (или создание) файла кэша.
+
+        Args:
+            path: str (путь к файлу SQLite)
+            ttl: float (время жизни записи без перепроверки, секунды)
+            max_bytes: int (максимальный суммарный размер сжатых тел)
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+        self._total = self._stored_size()
+        self._writes = 0
+
+    def lookup(self, url: str):
+        """
+        Поиск записи в кэше.
+
+        Args:
+            url: str (адрес ресурса)
+
+        Returns:
+            dict: запись с ключами body, etag, last_modified, fresh или None
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT etag, last_modified, body, stored_at FROM http_cache WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            now = time.time()
+            self._connection.execute("UPDATE http_cache SET accessed_at = ? WHERE url = ?", (now, url))
+
+        etag, last_modified, body, stored_at = row
+        return {
+            'body': zlib.decompress(body),
+            'etag': etag,
+            'last_modified': last_modified,
+            'fresh': now - stored_at < self.ttl,
+        }
+
+    def conditional_headers(self, entry: dict) -> dict:
+        """
+        Заголовки условного запроса для устаревшей записи.
+
+        Args:
+            entry: dict (запись, возвращенная lookup)
+
+        Returns:
+            dict: заголовки If-None-Match и/или If-Modified-Since
+        """
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url: str, body: bytes, etag: str = None, last_modified: str = None) -> None:
+        """
+        Сохранение ответа в кэш с последующим вытеснением по размеру.
+
+        Args:
+            url: str (адрес ресурса)
+            body: bytes (тело ответа)
+            etag: str (заголовок ETag ответа)
+            last_modified: str (заголовок Last-Modified ответа)
+        """
+        compressed = zlib.compress(body)
+        now = time.time()
+        with self._lock:
+            previous = self._connection.execute("SELECT size FROM http_cache WHERE url = ?", (url,)).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO http_cache "
+                "(url, etag, last_modified, body, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, compressed, len(compressed), now, now)
+            )
+            self._total += len(compressed) - (previous[0] if previous else 0)
+            self._writes += 1
+            if self._writes >= RESYNC_WRITES:
+                self._total = self._stored_size()
+                self._writes = 0
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def refresh(self, url: str) -> None:
+        """
+        Продление записи после ответа 304 Not Modified.
+
+        Args:
+            url: str (адрес ресурса)
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "UPDATE http_cache SET stored_at = ?, accessed_at = ? WHERE url = ?", (now, now, url)
+            )
+
+    def _stored_size(self) -> int:
+        """Суммарный размер тел в файле кэша."""
+        return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+
+    def _evict(self) -> None:
+        """
+        Удаляет давно не читавшиеся записи, пока размер кэша не опустится
+        до EVICT_TARGET от лимита: следующие записи не вызывают вытеснение сразу.
+        """
+        # Другие процессы могли уже сократить кэш: сверяемся с файлом
+        self._total = self._stored_size()
+        self._writes = 0
+        target = self.max_bytes * EVICT_TARGET
+        while self._total > target:
+            rows = self._connection.execute(
+                "SELECT url, size FROM http_cache ORDER BY accessed_at LIMIT ?", (EVICT_BATCH_SIZE,)
+            ).fetchall()
+            if not rows:
+                break
+            evicted = []
+            for url, size in rows:
+                if self._total <= target:
+                    break
+                evicted.append((url,))
+                self._total -= size
+            self._connection.executemany("DELETE FROM http_cache WHERE url = ?", evicted)
+
+    def record(self, outcome: str) -> None:
+        """
+        Учет результата обращения к кэшу.
+
+        Args:
+            outcome: str ('hit', 'revalidated' или 'miss')
+        """
+        with self._lock:
+            if outcome == 'hit':
+                self.hits += 1
+            elif outcome == 'revalidated':
+                self.revalidated += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> dict:
+        """
+        Статистика работы кэша.
+
+        Returns:
+            dict: счетчики hits, revalidated, misses, доля попаданий и размер кэша
+        """
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM http_cache"
+            ).fetchone()
+            total = self.hits + self.revalidated + self.misses
+            return {
+                'hits': self.hits,
+                'revalidated': self.revalidated,
+                'misses': self.misses,
+                'hit_rate': (self.hits + self.revalidated) / total if total else 0.0,
+                'entries': entries,
+                'size_bytes': size,
+            }
@@ -0,0 +1,383 @@
+"""
+Модуль metrics.py содержит метрики парсера в формате Prometheus.
+
+Реестр процесса хранит счетчики и гистограммы с метками; render()
+возвращает их в текстовом формате экспозиции Prometheus (версия 0.0.4).
+Модуль не зависит от Django и сторонних библиотек.
+
+Обход выполняют отдельные процессы (parse_worker, рабочие процессы
+crawl_scheduler, команды загрузки), поэтому после configure(directory)
+каждый процесс периодически и при завершении записывает значения своего
+реестра в файл каталога directory (как multiprocess-режим клиента
+Prometheus), а render() суммирует файлы всех процессов со значениями
+текущего. Файлы завершившихся процессов остаются, чтобы счетчики не
+уменьшались; каталог очищается при перезапуске всех процессов.
+
+Основной функционал:
+- Counter, Histogram: потокобезопасные метрики с метками
+- timed: контекстный менеджер, измеряющий длительность в гистограмме
+- configure / flush: общий для процессов каталог метрик
+- Метрики HTTP-запросов, повторов, HTTP-кэша, стадий конвейера и записи в БД
+"""
+
+import atexit
+import copy
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Константы
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DEFAULT_FLUSH_INTERVAL = 5.0
+FILE_PREFIX = 'metrics_'
+
+_shared = {'directory': None, 'path': None, 'thread': None}
+_shared_lock = threading.Lock()
+
+logger = logging.getLogger(__name__)
+
+
+class _Metric:
+    """Базовый класс метрики с метками."""
+
+    metric_type = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        """
+        Создание метрики.
+
+        Args:
+            name: str (имя метрики)
+            documentation: str (описание для строки HELP)
+            labelnames: tuple (имена меток)
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        """Значения меток в порядке labelnames."""
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _format_labels(self, key: tuple, extra: dict = None) -> str:
+        """Метки в формате {name="value",...}."""
+        pairs = list(zip(self.labelnames, key)) + list((extra or {}).items())
+        if not pairs:
+            return ''
+        escaped = (f'{name}="{_escape(value)}"' for name, value in pairs)
+        return '{' + ','.join(escaped) + '}'
+
+    def render(self, others: list = ()) -> list:
+        """
+        Строки метрики в текстовом формате Prometheus.
+
+        Args:
+            others: list (значения метрики из других процессов в формате snapshot)
+        """
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.metric_type}']
+        values = dict(self.snapshot())
+        for items in others:
+            for key, value in items:
+                key = tuple(key)
+                values[key] = self._add(values[key], value) if key in values else value
+        lines.extend(self._render_samples(sorted(values.items())))
+        return lines
+
+    def snapshot(self) -> list:
+        """Копия значений метрики: список пар (значения меток, значение)."""
+        with self._lock:
+            return copy.deepcopy(list(self._values.items()))
+
+    def reset(self) -> None:
+        """Сброс значений метрики."""
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    """Монотонно растущий счетчик."""
+
+    metric_type = 'counter'
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        """
+        Увеличение счетчика.
+
+        Args:
+            amount: float (приращение)
+            **labels: значения меток
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        """Текущее значение счетчика для меток."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    @staticmethod
+    def _add(value: float, other: float) -> float:
+        """Сумма значений счетчика разных процессов."""
+        return value + other
+
+    def _render_samples(self, items: list) -> list:
+        """Строки значений счетчика."""
+        return [f'{self.name}{self._format_labels(key)} {_number(value)}' for key, value in items]
+
+
+class Histogram(_Metric):
+    """Гистограмма наблюдений с накопительными корзинами."""
+
+    metric_type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (),
+                 buckets: tuple = LATENCY_BUCKETS):
+        """
+        Создание гистограммы.
+
+        Args:
+            name: str (имя метрики)
+            documentation: str (описание для строки HELP)
+            labelnames: tuple (имена меток)
+            buckets: tuple (верхние границы корзин по возрастанию)
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        """
+        Добавление наблюдения.
+
+        Args:
+            value: float (наблюдаемое значение)
+            **labels: значения меток
+        """
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][index] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    def get(self, **labels) -> tuple:
+        """Сумма и количество наблюдений для меток."""
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return (state[1], state[2]) if state else (0.0, 0)
+
+    @staticmethod
+    def _add(value: list, other: list) -> list:
+        """Сумма корзин, сумм и количеств наблюдений разных процессов."""
+        return [[a + b for a, b in zip(value[0], other[0])], value[1] + other[1], value[2] + other[2]]
+
+    def _render_samples(self, items: list) -> list:
+        """Строки корзин, суммы и количества наблюдений."""
+        lines = []
+        for key, (bucket_counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                lines.append(f'{self.name}_bucket{self._format_labels(key, {"le": _number(bound)})} {cumulative}')
+            lines.append(f'{self.name}_bucket{self._format_labels(key, {"le": "+Inf"})} {count}')
+            lines.append(f'{self.name}_sum{self._format_labels(key)} {_number(total)}')
+            lines.append(f'{self.name}_count{self._format_labels(key)} {count}')
+        return lines
+
+
+class Registry:
+    """Реестр метрик процесса."""
+
+    def __init__(self):
+        """Создание пустого реестра."""
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """
+        Регистрация метрики.
+
+        Args:
+            metric: _Metric (счетчик или гистограмма)
+
+        Returns:
+            _Metric: та же метрика
+        """
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def render(self, others: list = ()) -> str:
+        """
+        Все метрики в текстовом формате Prometheus.
+
+        Args:
+            others: list (снимки реестров других процессов в формате snapshot)
+
+        Returns:
+            str: текст экспозиции
+        """
+        with self._lock:
+            metrics = list(self._metrics)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render([other[metric.name] for other in others if metric.name in other]))
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self) -> dict:
+        """
+        Значения всех метрик для записи в файл.
+
+        Returns:
+            dict: имя метрики → список пар (значения меток, значение)
+        """
+        with self._lock:
+            metrics = list(self._metrics)
+        return {metric.name: metric.snapshot() for metric in metrics}
+
+    def reset(self) -> None:
+        """Сброс значений всех метрик."""
+        with self._lock:
+            metrics = list(self._metrics)
+        for metric in metrics:
+            metric.reset()
+
+
+def _escape(value: str) -> str:
+    """Экранирование значения метки."""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    """Число в формате Prometheus без лишних нулей."""
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+REGISTRY = Registry()
+
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    'hh_http_requests_total', 'HTTP-запросы к API HH.ru по типу и результату', ('endpoint', 'status')))
+HTTP_LATENCY = REGISTRY.register(Histogram(
+    'hh_http_request_duration_seconds', 'Длительность HTTP-запросов к API HH.ru', ('endpoint',)))
+HTTP_RETRIES = REGISTRY.register(Counter(
+    'hh_http_retries_total', 'Повторы HTTP-запросов по причине', ('endpoint', 'reason')))
+CACHE_LOOKUPS = REGISTRY.register(Counter(
+    'hh_http_cache_lookups_total', 'Обращения к HTTP-кэшу детальной информации', ('outcome',)))
+STAGE_ITEMS = REGISTRY.register(Counter(
+    'hh_pipeline_items_total', 'Вакансии, прошедшие стадию конвейера', ('stage',)))
+STAGE_DURATION = REGISTRY.register(Histogram(
+    'hh_pipeline_stage_duration_seconds', 'Длительность стадий конвейера на пакет', ('stage',)))
+DB_WRITE_DURATION = REGISTRY.register(Histogram(
+    'hh_db_write_duration_seconds', 'Длительность записи вакансий в базу данных', ('mode',)))
+DB_ROWS = REGISTRY.register(Counter(
+    'hh_db_rows_total', 'Записи вакансий по результату сохранения', ('result',)))
+
+
+@contextmanager
+def timed(histogram: Histogram, **labels):
+    """
+    Измерение длительности блока кода.
+
+    Args:
+        histogram: Histogram (гистограмма для наблюдения)
+        **labels: значения меток
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.observe(time.perf_counter() - started, **labels)
+
+
+def configure(directory, flush_interval: float = DEFAULT_FLUSH_INTERVAL) -> None:
+    """
+    Включение общего для процессов каталога метрик.
+
+    Значения реестра процесса записываются в собственный файл каталога
+    фоновым потоком раз в flush_interval секунд и при завершении процесса.
+    Повторный вызов в том же процессе ничего не меняет.
+
+    Args:
+        directory: str или Path (каталог файлов метрик)
+        flush_interval: float (период записи, секунд)
+    """
+    with _shared_lock:
+        if _shared['directory'] is not None:
+            return
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        # Время запуска в имени: процесс с тем же pid не перезапишет файл завершившегося
+        _shared['directory'] = directory
+        _shared['path'] = directory / f'{FILE_PREFIX}{os.getpid()}_{time.time_ns()}.json'
+
+        thread = threading.Thread(target=_flush_loop, args=(flush_interval,), name='metrics-flush', daemon=True)
+        _shared['thread'] = thread
+        thread.start()
+    atexit.register(flush)
+
+
+def flush() -> None:
+    """
+    Запись значений реестра процесса в его файл общего каталога.
+
+    Пустой реестр не записывается, чтобы служебные команды не оставляли файлов.
+    """
+    path = _shared['path']
+    if path is None:
+        return
+    snapshot = REGISTRY.snapshot()
+    if not any(snapshot.values()):
+        return
+    temporary = path.with_suffix('.tmp')
+    try:
+        temporary.write_text(json.dumps(snapshot), encoding='utf-8')
+        os.replace(temporary, path)
+    except OSError as e:
+        logger.warning("Не удалось записать метрики в %s: %s", path, e)
+
+
+def _flush_loop(interval: float) -> None:
+    """Периодическая запись метрик процесса."""
+    while True:
+        time.sleep(interval)
+        flush()
+
+
+def _read_other_processes() -> list:
+    """Снимки реестров других процессов из общего каталога."""
+    directory = _shared['directory']
+    if directory is None:
+        return []
+    snapshots = []
+    for path in directory.glob(f'{FILE_PREFIX}*.json'):
+        if path == _shared['path']:
+            continue
+        try:
+            snapshots.append(json.loads(path.read_text(encoding='utf-8')))
+        except (OSError, ValueError) as e:
+            logger.warning("Пропущен файл метрик %s: %s", path, e)
+    return snapshots
+
+
+def render() -> str:
+    """
+    Метрики всех процессов в текстовом формате Prometheus.
+
+    Значения текущего процесса берутся из реестра, остальных — из файлов
+    общего каталога (если он настроен через configure).
+
+    Returns:
+        str: текст экспозиции
+    """
+    return REGISTRY.render(_read_other_processes())
@@ -0,0 +1,185 @@
+"""
+Модуль partitioning.py содержит режим обхода выдачи HH.ru по непересекающимся срезам.
+
+API HH.ru отдает не более MAX_VACANCY_COUNT результатов на один поисковый
+запрос. Чтобы собрать больше, запрос делится на срезы по регионам и окнам
+даты публикации; окно делится пополам, пока количество вакансий в нем
+не станет меньше лимита. Срезы обходятся параллельно, результаты
+объединяются с устранением дубликатов по ссылке.
+
+Основной функционал:
+- plan_slices: построение списка срезов для запроса
+- iter_partitioned_pages: параллельный обход срезов с потоковой выдачей страниц
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from DjangoProject_HH_parser.Services.hh_client import MAX_VACANCY_COUNT, MAX_PARALLEL_SLICES, DEFAULT_AREA
+
+# Константы
+DEFAULT_PERIOD_DAYS = 30  # максимальная глубина поиска API HH.ru
+MIN_WINDOW = timedelta(minutes=30)
+QUEUE_SIZE = 8
+_DONE = object()
+
+logger = logging.getLogger(__name__)
+
+
+def _format_date(value) -> str:
+    """Форматирует дату в ISO 8601 для параметров date_from/date_to."""
+    return value.replace(microsecond=0).isoformat()
+
+
+def plan_slices(parser, search_query: str, areas=(DEFAULT_AREA,), period_days: int = DEFAULT_PERIOD_DAYS) -> list:
+    """
+    Построение непересекающихся срезов выдачи, каждый из которых меньше лимита пагинации.
+
+    Args:
+        parser: HHClient (клиент для запросов количества вакансий)
+        search_query: str (поисковый запрос)
+        areas: iterable (идентификаторы регионов HH.ru)
+        period_days: int (глубина поиска в днях)
+
+    Returns:
+        list: список словарей параметров среза (area, date_from, date_to) с ожидаемым found
+    """
+    date_to = datetime.now(timezone.utc)
+    date_from = date_to - timedelta(days=period_days)
+    slices = []
+
+    for area in areas:
+        slices.extend(_split_window(parser, search_query, area, date_from, date_to))
+
+    return slices
+
+
+def _split_window(parser, search_query: str, area: int, date_from, date_to) -> list:
+    """
+    Рекурсивно делит окно дат пополам, пока выдача не помещается в лимит.
+
+    Args:
+        parser: HHClient (клиент для запросов количества вакансий)
+        search_query: str (поисковый запрос)
+        area: int (идентификатор региона)
+        date_from: datetime (начало окна)
+        date_to: datetime (конец окна)
+
+    Returns:
+        list: срезы внутри окна
+    """
+    params = {
+        'area': area,
+        'date_from': _format_date(date_from),
+        'date_to': _format_date(date_to),
+    }
+    found = parser.count_vacancies(search_query, params)
+
+    if not found:
+        return []
+
+    if found <= MAX_VACANCY_COUNT or date_to - date_from <= MIN_WINDOW:
+        if found > MAX_VACANCY_COUNT:
+            logger.warning("Срез %s содержит %s вакансий, будет получено %s", params, found, MAX_VACANCY_COUNT)
+        return [{'params': params, 'found': found}]
+
+    middle = date_from + (date_to - date_from) / 2
+    return (_split_window(parser, search_query, area, date_from, middle) +
+            _split_window(parser, search_query, area, middle, date_to))
+
+
+def iter_partitioned_pages(parser, search_query: str, vacancy_count: int, progress_callback=None,
+                           areas=(DEFAULT_AREA,), period_days: int = DEFAULT_PERIOD_DAYS,
+                           max_parallel: int = MAX_PARALLEL_SLICES, seen=None):
+    """
+    Генератор страниц вакансий, собранных параллельным обходом срезов.
+
+    Срезы обрабатываются в пуле из max_parallel потоков; страницы попадают
+    в ограниченную очередь и выдаются потребителю без дубликатов по ссылке.
+    Интерфейс совпадает с HHClient.iter_vacancy_pages.
+
+    Args:
+        parser: HHClient (клиент API вакансий)
+        search_query: str (поисковый запрос)
+        vacancy_count: int (общее количество вакансий для получения)
+        progress_callback: callable (получает суммарные pages_fetched и items_parsed)
+        areas: iterable (идентификаторы регионов HH.ru)
+        period_days: int (глубина поиска в днях)
+        max_parallel: int (количество одновременно обходимых срезов)
+        seen: SeenIds (общий учет вакансий нескольких обходов, см. HHClient.iter_vacancy_pages)
+
+    Yields:
+        list: список уникальных вакансий очередной страницы
+    """
+    slices = plan_slices(parser, search_query, areas, period_days)
+    logger.info("Запрос '%s' разбит на %s срезов", search_query, len(slices))
+    if not slices:
+        return
+
+    pages = queue.Queue(maxsize=QUEUE_SIZE)
+    stop_event = threading.Event()
+    totals = {'pages_fetched': 0, 'items_parsed': 0}
+    totals_lock = threading.Lock()
+
+    def put(item) -> None:
+        while not stop_event.is_set():
+            try:
+                pages.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def crawl_slice(slice_info: dict) -> None:
+        try:
+            slice_count = min(slice_info['found'], MAX_VACANCY_COUNT)
+            for page_vacancies in parser.iter_vacancy_pages(search_query, slice_count,
+                                                            extra_params=slice_info['params'],
+                                                            stop_event=stop_event, seen=seen):
+                with totals_lock:
+                    totals['pages_fetched'] += 1
+                    totals['items_parsed'] += len(page_vacancies)
+                put(page_vacancies)
+        except Exception as e:
+            logger.error("Ошибка обхода среза %s: %s", slice_info['params'], e)
+        finally:
+            put(_DONE)
+
+    seen_links = set()
+    collected = 0
+    finished = 0
+    executor = ThreadPoolExecutor(max_workers=max(1, max_parallel), thread_name_prefix='hh-slice')
+    try:
+        for slice_info in slices:
+            executor.submit(crawl_slice, slice_info)
+
+        while finished < len(slices) and collected < vacancy_count:
+            item = pages.get()
+            if item is _DONE:
+                finished += 1
+                continue
+
+            unique = []
+            for vacancy in item:
+                link = vacancy.get('link')
+                if link in seen_links:
+                    continue
+                seen_links.add(link)
+                unique.append(vacancy)
+
+            unique = unique[:vacancy_count - collected]
+            collected += len(unique)
+
+            if progress_callback:
+                with totals_lock:
+                    progress_callback(pages_fetched=totals['pages_fetched'], items_parsed=collected)
+
+            if unique:
+                yield unique
+    finally:
+        stop_event.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    logger.info("Всего собрано уникальных вакансий: %s (получено %s с учетом дубликатов)",
+                collected, totals['items_parsed'])
@@ -0,0 +1,273 @@
+"""
+Модуль payload_archive.py содержит архив исходных ответов API HH.ru.
+
+Каждый ответ поиска и детальной информации дописывается в сегментный файл
+в сжатом виде (zlib), а в соседний файл индекса — запись фиксированного
+размера со смещением ответа. Сегменты только дописываются: каждый процесс
+пишет в свои файлы, заполненный сегмент закрывается и больше не меняется.
+Архив позволяет заново нормализовать вакансии (команда reprocess) без
+повторного обхода API. Модуль не зависит от Django.
+
+Формат:
+- <name>.seg: подряд идущие записи zlib(url + b'\\n' + тело ответа)
+- <name>.idx: записи INDEX_ENTRY (тип, id вакансии, время получения, смещение, длина)
+
+Основной функционал:
+- PayloadArchive: потокобезопасная запись ответов с ротацией сегментов
+- ArchiveReader: чтение индекса и ответов через отображение файлов в память (mmap)
+"""
+
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from datetime import datetime
+from urllib.parse import urlsplit
+
+# Константы
+KIND_SEARCH = 1
+KIND_DETAIL = 2
+KIND_NAMES = {KIND_SEARCH: 'search', KIND_DETAIL: 'detail'}
+INDEX_ENTRY = struct.Struct('<BQdQI')  # тип, id вакансии, время получения, смещение, длина
+SEGMENT_SUFFIX = '.seg'
+INDEX_SUFFIX = '.idx'
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+DEFAULT_COMPRESSION_LEVEL = 6
+
+
+def vacancy_id_from_url(url: str) -> int:
+    """
+    Идентификатор вакансии из адреса детальной информации (/vacancies/{id}).
+
+    Args:
+        url: str (адрес запроса)
+
+    Returns:
+        int: идентификатор или 0, если адрес его не содержит
+    """
+    tail = urlsplit(url).path.rstrip('/').rsplit('/', 1)[-1]
+    return int(tail) if tail.isdigit() else 0
+
+
+class PayloadArchive:
+    """
+    Дописываемый архив сжатых ответов API.
+
+    Запись в сегмент и индекс выполняется под блокировкой, поэтому один
+    экземпляр используется всеми потоками загрузки. После fork или в
+    другом процессе открывается новый сегмент с pid процесса в имени.
+    """
+
+    def __init__(self, path: str, max_segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+                 compression_level: int = DEFAULT_COMPRESSION_LEVEL) -> None:
+        """
+        Подготовка каталога архива; сегмент создается при первой записи.
+
+        Args:
+            path: str (каталог архива)
+            max_segment_bytes: int (размер сегмента, после которого открывается следующий)
+            compression_level: int (уровень сжатия zlib)
+        """
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.max_segment_bytes = max_segment_bytes
+        self.compression_level = compression_level
+        self._lock = threading.Lock()
+        self._pid = None
+        self._sequence = 0
+        self._segment = None
+        self._index = None
+        self._offset = 0
+
+    def append(self, kind: int, url: str, body: bytes, vacancy_id: int = 0) -> None:
+        """
+        Дописывание ответа в текущий сегмент.
+
+        Args:
+            kind: int (KIND_SEARCH или KIND_DETAIL)
+            url: str (адрес запроса с параметрами)
+            body: bytes (тело ответа без изменений)
+            vacancy_id: int (идентификатор вакансии для ответа детальной информации)
+        """
+        record = zlib.compress(url.encode('utf-8') + b'\n' + body, self.compression_level)
+        with self._lock:
+            if self._pid != os.getpid() or self._offset >= self.max_segment_bytes:
+                self._open_segment()
+            self._segment.write(record)
+            self._segment.flush()
+            # Запись индекса следует за данными: читатель не увидит ссылку на недописанный ответ
+            self._index.write(INDEX_ENTRY.pack(kind, vacancy_id, time.time(), self._offset, len(record)))
+            self._index.flush()
+            self._offset += len(record)
+
+    def append_search(self, response) -> None:
+        """
+        Архивирование страницы поисковой выдачи.
+
+        Args:
+            response: requests.Response (успешный ответ поиска)
+        """
+        self.append(KIND_SEARCH, response.url, response.content)
+
+    def append_detail(self, response) -> None:
+        """
+        Архивирование детальной информации о вакансии.
+
+        Args:
+            response: requests.Response (успешный ответ /vacancies/{id})
+        """
+        self.append(KIND_DETAIL, response.url, response.content, vacancy_id_from_url(response.url))
+
+    def close(self) -> None:
+        """Закрытие текущего сегмента."""
+        with self._lock:
+            self._close_segment()
+
+    def _open_segment(self) -> None:
+        """Закрытие текущего и создание нового сегмента процесса."""
+        self._close_segment()
+        pid = os.getpid()
+        if self._pid != pid:
+            self._pid = pid
+            self._sequence = 0
+        self._sequence += 1
+        stamp = datetime.now().strftime('%Y%m%d%H%M%S')
+        name = os.path.join(self.path, f'segment-{stamp}-{pid}-{self._sequence:04d}')
+        self._segment = open(name + SEGMENT_SUFFIX, 'ab')
+        self._index = open(name + INDEX_SUFFIX, 'ab')
+        self._offset = self._segment.tell()
+
+    def _close_segment(self) -> None:
+        """Закрытие файлов текущего сегмента."""
+        for file in (self._segment, self._index):
+            if file is not None:
+                file.close()
+        self._segment = None
+        self._index = None
+
+
+class ArchiveReader:
+    """
+    Чтение архива ответов.
+
+    Файлы сегментов отображаются в память при первом обращении; запись
+    индекса, указывающая за конец сегмента (процесс записи прерван),
+    пропускается.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Открытие каталога архива.
+
+        Args:
+            path: str (каталог архива)
+        """
+        self.path = path
+        self._maps = {}
+
+    def segments(self) -> list:
+        """
+        Имена сегментов архива в порядке создания.
+
+        Returns:
+            list: имена сегментов без расширения
+        """
+        if not os.path.isdir(self.path):
+            return []
+        names = (name[:-len(SEGMENT_SUFFIX)] for name in os.listdir(self.path) if name.endswith(SEGMENT_SUFFIX))
+        return sorted(names)
+
+    def iter_entries(self, kind: int = None):
+        """
+        Генератор записей индекса.
+
+        Args:
+            kind: int (тип ответа; None — все)
+
+        Yields:
+            tuple: (сегмент, тип, id вакансии, время получения, смещение, длина)
+        """
+        for segment in self.segments():
+            segment_size = os.path.getsize(os.path.join(self.path, segment + SEGMENT_SUFFIX))
+            with open(os.path.join(self.path, segment + INDEX_SUFFIX), 'rb') as file:
+                data = file.read()
+            # Недописанная последняя запись индекса отбрасывается
+            data = data[:len(data) - len(data) % INDEX_ENTRY.size]
+            for entry_kind, vacancy_id, fetched_at, offset, length in INDEX_ENTRY.iter_unpack(data):
+                if kind is not None and entry_kind != kind:
+                    continue
+                if offset + length > segment_size:
+                    continue
+                yield segment, entry_kind, vacancy_id, fetched_at, offset, length
+
+    def latest_details(self) -> dict:
+        """
+        Последний по времени получения ответ детальной информации каждой вакансии.
+
+        Returns:
+            dict: id вакансии → (сегмент, смещение, длина)
+        """
+        latest = {}
+        for segment, _, vacancy_id, fetched_at, offset, length in self.iter_entries(KIND_DETAIL):
+            if not vacancy_id:
+                continue
+            current = latest.get(vacancy_id)
+            if current is None or fetched_at >= current[0]:
+                latest[vacancy_id] = (fetched_at, (segment, offset, length))
+        return {vacancy_id: location for vacancy_id, (_, location) in latest.items()}
+
+    def read(self, segment: str, offset: int, length: int) -> tuple:
+        """
+        Чтение ответа по его расположению в сегменте.
+
+        Args:
+            segment: str (имя сегмента)
+            offset: int (смещение записи)
+            length: int (длина сжатой записи)
+
+        Returns:
+            tuple: (url, тело ответа в байтах)
+        """
+        data = self._map(segment)
+        url, _, body = zlib.decompress(data[offset:offset + length]).partition(b'\n')
+        return url.decode('utf-8'), body
+
+    def stats(self) -> dict:
+        """
+        Количество сегментов, ответов по типам и размер архива.
+
+        Returns:
+            dict: segments, search, detail, bytes
+        """
+        result = {'segments': 0, 'search': 0, 'detail': 0, 'bytes': 0}
+        for segment in self.segments():
+            result['segments'] += 1
+            result['bytes'] += os.path.getsize(os.path.join(self.path, segment + SEGMENT_SUFFIX))
+        for entry in self.iter_entries():
+            name = KIND_NAMES.get(entry[1])
+            if name:
+                result[name] += 1
+        return result
+
+    def close(self) -> None:
+        """Освобождение отображений сегментов."""
+        for data in self._maps.values():
+            data.close()
+        self._maps.clear()
+
+    def _map(self, segment: str) -> mmap.mmap:
+        """Отображение сегмента в память (только чтение)."""
+        data = self._maps.get(segment)
+        if data is None:
+            with open(os.path.join(self.path, segment + SEGMENT_SUFFIX), 'rb') as file:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = data
+        return data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,101 @@
+"""
+Модуль rate_limiter.py содержит ограничитель частоты запросов к API HH.ru.
+
+Основной класс:
+- RateLimiter: потокобезопасный адаптивный ограничитель по алгоритму
+  token bucket, общий для поисковых запросов и запросов детальной информации.
+"""
+
+import threading
+import time
+
+# Константы
+DEFAULT_RATE = 20.0  # запросов в секунду
+DEFAULT_BURST = 10
+DEFAULT_MIN_RATE = 0.5
+DECREASE_FACTOR = 0.5
+INCREASE_STEP = 1.0  # прирост скорости после успешного запроса, запросов в секунду
+
+
+class RateLimiter:
+    """
+    Потокобезопасный адаптивный ограничитель частоты запросов (token bucket).
+
+    Корзина пополняется со скоростью rate токенов в секунду и вмещает
+    не более burst токенов. Каждый запрос забирает один токен; если токенов
+    нет, поток ждет их появления.
+
+    Скорость подстраивается под ответы API: при перегрузке (429/5xx) она
+    уменьшается вдвое, а все потоки приостанавливаются на время Retry-After;
+    после успешных запросов скорость линейно возвращается к max_rate.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST,
+                 min_rate: float = DEFAULT_MIN_RATE) -> None:
+        """
+        Инициализация ограничителя.
+
+        Args:
+            rate: float (максимальная скорость пополнения, запросов в секунду)
+            burst: int (максимальное количество запросов подряд без ожидания)
+            min_rate: float (нижняя граница скорости при снижении)
+        """
+        if rate <= 0:
+            raise ValueError("rate должен быть положительным")
+        self.max_rate = float(rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.rate = self.max_rate
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Пополняет корзину токенами за прошедшее время."""
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+    def acquire(self) -> None:
+        """
+        Забирает один токен, при необходимости ожидая его появления.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def penalize(self, pause: float = 0.0) -> None:
+        """
+        Реакция на перегрузку API: снижает скорость и приостанавливает запросы.
+
+        Args:
+            pause: float (пауза для всех потоков, секунды, например из Retry-After)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * DECREASE_FACTOR)
+            self._tokens = 0.0
+            self._blocked_until = max(self._blocked_until, now + pause)
+            # Токены не копятся во время паузы
+            self._updated_at = max(self._updated_at, self._blocked_until)
+
+    def reward(self) -> None:
+        """
+        Реакция на успешный запрос: постепенно возвращает скорость к максимальной.
+        """
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill(time.monotonic())
+                self.rate = min(self.max_rate, self.rate + INCREASE_STEP)
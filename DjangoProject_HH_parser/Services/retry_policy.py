@@ -0,0 +1,109 @@
+"""
+Модуль retry_policy.py содержит политику повторных запросов к API HH.ru.
+
+Основной класс:
+- RetryPolicy: определяет, какие ответы и ошибки повторять, и вычисляет
+  задержку перед повтором (заголовок Retry-After или экспоненциальная
+  задержка со случайным разбросом).
+
+Значение Retry-After соблюдается полностью: max_delay ограничивает только
+экспоненциальную задержку. Если сервер просит ждать дольше
+max_retry_after, запрос не повторяется.
+"""
+
+import random
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+# Константы
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 30.0
+DEFAULT_MAX_RETRY_AFTER = 600.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """
+    Политика повторов с экспоненциальной задержкой.
+
+    Повторяются ответы 429 и 5xx, а также сетевые ошибки; количество
+    повторов одного запроса ограничено max_retries.
+    """
+
+    def __init__(self, max_retries: int = DEFAULT_MAX_RETRIES, base_delay: float = DEFAULT_BASE_DELAY,
+                 max_delay: float = DEFAULT_MAX_DELAY,
+                 max_retry_after: float = DEFAULT_MAX_RETRY_AFTER) -> None:
+        """
+        Инициализация политики.
+
+        Args:
+            max_retries: int (максимальное количество повторов одного запроса)
+            base_delay: float (задержка перед первым повтором, секунды)
+            max_delay: float (верхняя граница экспоненциальной задержки, секунды)
+            max_retry_after: float (наибольшая соблюдаемая задержка Retry-After, секунды)
+        """
+        self.max_retries = max(0, int(max_retries))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+
+    def should_retry_status(self, status_code: int) -> bool:
+        """
+        Проверяет, нужно ли повторять запрос с данным кодом ответа.
+
+        Args:
+            status_code: int (HTTP-код ответа)
+
+        Returns:
+            bool: True для 429 и временных ошибок сервера
+        """
+        return status_code in RETRY_STATUSES
+
+    def get_delay(self, attempt: int, retry_after: str = None) -> float:
+        """
+        Вычисляет задержку перед повтором.
+
+        Задержка из Retry-After не сокращается: повтор раньше срока,
+        указанного сервером, снова получит отказ.
+
+        Args:
+            attempt: int (номер повтора, начиная с 0)
+            retry_after: str (значение заголовка Retry-After, если есть)
+
+        Returns:
+            float: задержка в секундах или None, если сервер просит ждать
+                дольше max_retry_after и повторять запрос не нужно
+        """
+        parsed = self.parse_retry_after(retry_after)
+        if parsed is not None:
+            return parsed if parsed <= self.max_retry_after else None
+
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        # Случайный разброс, чтобы параллельные потоки не повторяли запросы синхронно
+        return delay * random.uniform(0.5, 1.0)
+
+    @staticmethod
+    def parse_retry_after(value: str):
+        """
+        Разбор заголовка Retry-After в секундах или в формате HTTP-даты.
+
+        Args:
+            value: str (значение заголовка)
+
+        Returns:
+            float: задержка в секундах или None, если заголовок отсутствует или некорректен
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -75,4 +75,46 @@ STATICFILES_DIRS = [
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
 MEDIA_URL = '/media/'
-MEDIA_ROOT = BASE_DIR / 'media'
\ No newline at end of file
+MEDIA_ROOT = BASE_DIR / 'media'
+
+# Дисковый HTTP-кэш детальной информации о вакансиях
+HH_HTTP_CACHE = {
+    'ENABLED': True,
+    'PATH': BASE_DIR / '.hh_cache' / 'http_cache.sqlite3',
+    'TTL': 30 * 60,
+    'MAX_BYTES': 256 * 1024 * 1024,
+}
+
+# Архив исходных ответов API HH.ru для повторной нормализации (manage.py reprocess)
+HH_PAYLOAD_ARCHIVE = {
+    'ENABLED': True,
+    'PATH': BASE_DIR / '.hh_archive',
+    'SEGMENT_BYTES': 64 * 1024 * 1024,
+}
+
+# Общий каталог метрик Prometheus: процессы обхода и веб-сервер пишут в него свои значения,
+# GET /metrics суммирует их (каталог очищается при перезапуске всех процессов)
+HH_METRICS = {
+    'ENABLED': True,
+    'PATH': BASE_DIR / '.hh_metrics',
+    'FLUSH_INTERVAL': 5.0,
+}
+
+# Курсы валют к рублю для аналитики зарплат (дополняют значения по умолчанию)
+HH_CURRENCY_RATES = {}
+
+# Журналирование: уровень задается переменной окружения HH_LOG_LEVEL (DEBUG выводит каждую вакансию)
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'default': {'format': '%(asctime)s %(levelname)s %(name)s: %(message)s'},
+    },
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler', 'formatter': 'default'},
+    },
+    'loggers': {
+        'hhparser': {'handlers': ['console'], 'level': os.environ.get('HH_LOG_LEVEL', 'INFO')},
+        'DjangoProject_HH_parser': {'handlers': ['console'], 'level': os.environ.get('HH_LOG_LEVEL', 'INFO')},
+    },
+}
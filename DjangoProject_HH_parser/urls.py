@@ -1,7 +1,9 @@
 from django.contrib import admin
 from django.urls import path
 from hhparser.views import (IndexView, ParserView, VacancyListView, StatisticsView,
-                           GenerateLetterView, GetVacanciesView, FilterVacanciesView)
+                           GenerateLetterView, GetVacanciesView, FilterVacanciesView,
+                           ParseJobStatusView, SalaryAnalyticsView, TopSkillsView, VacancyDetailView,
+                           VacancyHistoryView, MetricsView)
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -12,4 +14,10 @@ urlpatterns = [
     path('api/vacancies/', GetVacanciesView.as_view(), name='api_vacancies'),
     path('api/filter-vacancies/', FilterVacanciesView.as_view(), name='filter_vacancies'),
     path('api/statistics/', StatisticsView.as_view(), name='api_statistics'),
+    path('api/parser/jobs/<int:job_id>/', ParseJobStatusView.as_view(), name='api_parse_job'),
+    path('api/analytics/salary/', SalaryAnalyticsView.as_view(), name='api_salary_analytics'),
+    path('api/skills/top/', TopSkillsView.as_view(), name='api_top_skills'),
+    path('api/vacancies/<int:vacancy_id>/', VacancyDetailView.as_view(), name='api_vacancy_detail'),
+    path('api/vacancies/<int:vacancy_id>/history/', VacancyHistoryView.as_view(), name='api_vacancy_history'),
+    path('metrics', MetricsView.as_view(), name='metrics'),
 ]
\ No newline at end of file
@@ -1,10 +1,69 @@
 from django.contrib import admin
-from hhparser.models import Vacancy
+from hhparser.models import Vacancy, VacancyRevision, ParseJob, CrawlState, Skill, SavedSearch, SavedSearchRun
+
+
+class VacancyRevisionInline(admin.TabularInline):
+    model = VacancyRevision
+    extra = 0
+    can_delete = False
+    fields = ['changed_at', 'changes']
+    readonly_fields = fields
+    ordering = ['-changed_at']
+
 
 @admin.register(Vacancy)
 class VacancyAdmin(admin.ModelAdmin):
     list_display = ['title', 'company', 'salary', 'experience', 'employment', 'created_at']
-    list_filter = ['experience', 'employment', 'created_at']
+    list_filter = ['experience', 'employment', 'currency', 'created_at']
     search_fields = ['title', 'company', 'description']
-    readonly_fields = ['created_at']
+    readonly_fields = ['created_at', 'content_hash']
+    inlines = [VacancyRevisionInline]
+
+
+
+
+@admin.register(ParseJob)
+class ParseJobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'query', 'status', 'pages_fetched', 'items_parsed', 'rows_saved', 'created_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['query']
+    readonly_fields = ['created_at', 'updated_at', 'finished_at']
+
+
+@admin.register(CrawlState)
+class CrawlStateAdmin(admin.ModelAdmin):
+    list_display = ['query_key', 'last_published_at', 'runs', 'updated_at']
+    search_fields = ['query_key']
+    readonly_fields = ['updated_at']
+
+
+@admin.register(Skill)
+class SkillAdmin(admin.ModelAdmin):
+    list_display = ['name', 'vacancy_count']
+    search_fields = ['name', 'key']
+    readonly_fields = ['key', 'vacancy_count']
+
+
+class SavedSearchRunInline(admin.TabularInline):
+    model = SavedSearchRun
+    extra = 0
+    can_delete = False
+    fields = ['started_at', 'status', 'duration_seconds', 'items_parsed', 'items_found', 'rows_saved', 'error']
+    readonly_fields = fields
+    ordering = ['-started_at']
+
+
+@admin.register(SavedSearch)
+class SavedSearchAdmin(admin.ModelAdmin):
+    list_display = ['__str__', 'query', 'is_active', 'interval_minutes', 'last_run_at', 'next_run_at']
+    list_filter = ['is_active', 'incremental']
+    search_fields = ['name', 'query']
+    readonly_fields = ['last_run_at', 'created_at']
+    inlines = [SavedSearchRunInline]
+
 
+@admin.register(SavedSearchRun)
+class SavedSearchRunAdmin(admin.ModelAdmin):
+    list_display = ['saved_search', 'status', 'started_at', 'duration_seconds', 'items_parsed', 'rows_saved']
+    list_filter = ['status', 'started_at']
+    readonly_fields = ['started_at', 'finished_at']
@@ -0,0 +1,19 @@
+from django.apps import AppConfig
+
+
+class HhparserConfig(AppConfig):
+    name = 'hhparser'
+    verbose_name = 'HH Parser'
+
+    def ready(self) -> None:
+        """
+        Подключает обработчики сигналов поисковых индексов, кластеров дубликатов и снимка статистики
+        и общий для процессов каталог метрик (настройка HH_METRICS).
+        """
+        from django.conf import settings
+        from hhparser.services import dedup, search, skills, statistics  # noqa: F401
+        from DjangoProject_HH_parser.Services import metrics
+
+        config = getattr(settings, 'HH_METRICS', {})
+        if config.get('ENABLED'):
+            metrics.configure(config['PATH'], config.get('FLUSH_INTERVAL', metrics.DEFAULT_FLUSH_INTERVAL))
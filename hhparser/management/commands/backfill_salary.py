@@ -0,0 +1,55 @@
+"""
+Команда backfill_salary заполняет числовые поля зарплаты у существующих вакансий.
+
+Границы восстанавливаются из текстового поля Vacancy.salary для записей,
+сохраненных до появления полей salary_from, salary_to и currency.
+
+Пример:
+    python manage.py backfill_salary --batch-size 1000
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from hhparser.models import Vacancy
+from hhparser.services.salary import salary_bounds_from_text
+
+
+class Command(BaseCommand):
+    """Заполнение salary_from, salary_to и currency из текста зарплаты."""
+
+    help = "Заполняет числовые поля зарплаты из текстового поля salary"
+
+    def add_arguments(self, parser) -> None:
+        """Регистрация аргументов командной строки."""
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help="Количество записей в одной транзакции")
+        parser.add_argument('--all', action='store_true',
+                            help="Пересчитать все записи, а не только незаполненные")
+
+    def handle(self, *args, **options) -> None:
+        """Выполнение команды пакетами по первичному ключу."""
+        batch_size = options['batch_size']
+        queryset = Vacancy.objects.all()
+        if not options['all']:
+            queryset = queryset.filter(salary_from__isnull=True, salary_to__isnull=True, currency='')
+
+        updated = 0
+        last_id = 0
+        while True:
+            batch = list(queryset.filter(id__gt=last_id).order_by('id').only('id', 'salary')[:batch_size])
+            if not batch:
+                break
+
+            for vacancy in batch:
+                bounds = salary_bounds_from_text(vacancy.salary)
+                vacancy.salary_from = bounds['salary_from']
+                vacancy.salary_to = bounds['salary_to']
+                vacancy.currency = bounds['currency']
+
+            with transaction.atomic():
+                Vacancy.objects.bulk_update(batch, ['salary_from', 'salary_to', 'currency'])
+
+            updated += len(batch)
+            last_id = batch[-1].id
+
+        self.stdout.write(self.style.SUCCESS(f"Обновлено вакансий: {updated}"))
@@ -0,0 +1,148 @@
+"""
+Команда benchmark_filters измеряет стоимость фильтрации одной вакансии.
+
+Сравнивает компиляцию фильтров на каждую запись (как в прежних реализациях)
+с однократно скомпилированным CompiledFilter для словарей и записей
+VacancyRecord, а также проверяет, что предикат и условие Q дают одинаковый
+результат на вакансиях из базы данных. Описания синтетических вакансий
+собираются из предложений DESCRIPTION_SENTENCES до DESCRIPTION_LENGTH
+символов, как у реальных вакансий; ключевые слова проверяются запросом из
+нескольких терминов и запросом из LONG_QUERY_TERMS терминов.
+
+Пример:
+    python manage.py benchmark_filters --rows 100000
+"""
+
+import random
+import time
+from django.core.management.base import BaseCommand
+from hhparser.models import Vacancy
+from hhparser.services.filters import compile_filters, VacancyRecord, KEYWORD_FIELDS
+from hhparser.services.descriptions import load_descriptions
+
+# Константы
+DEFAULT_ROWS = 50000
+BENCHMARK_FILTERS = {
+    'keywords': 'python',
+    'min_salary': '150000',
+    'employment': 'full',
+    'min_experience_years': '2',
+}
+SHORT_QUERY = 'python AND (kafka OR postgresql) NOT senior'
+LONG_QUERY_TERMS = 40
+DESCRIPTION_LENGTH = 2500
+DESCRIPTION_SENTENCES = (
+    'Мы ищем опытного разработчика в команду платформы данных.',
+    'Вам предстоит проектировать и развивать высоконагруженные сервисы.',
+    'Участие в код-ревью, написание тестов и технической документации.',
+    'Опыт коммерческой разработки на Python от трех лет.',
+    'Уверенное знание SQL, опыт оптимизации запросов в PostgreSQL.',
+    'Понимание принципов построения микросервисной архитектуры.',
+    'Будет плюсом опыт работы с Kafka, Redis и очередями сообщений.',
+    'Работа в аккредитованной ИТ-компании, официальное оформление по ТК РФ.',
+    'Гибкий график, возможность удаленной работы или гибридного формата.',
+    'Добровольное медицинское страхование со стоматологией после испытательного срока.',
+    'Компенсация обучения, конференций и профессиональной литературы.',
+    'Взаимодействие с аналитиками, тестировщиками и менеджерами продукта.',
+    'Настройка процессов непрерывной интеграции и доставки в GitLab CI.',
+    'Контейнеризация приложений с помощью Docker и развертывание в Kubernetes.',
+    'Мониторинг и разбор инцидентов, повышение отказоустойчивости систем.',
+    'Наставничество для младших сотрудников и участие в найме.',
+)
+
+
+class Command(BaseCommand):
+    """Микробенчмарк движка фильтров."""
+
+    help = "Измеряет время фильтрации одной вакансии в памяти и сверяет предикат с Q"
+
+    def add_arguments(self, parser) -> None:
+        """Регистрация аргументов командной строки."""
+        parser.add_argument('--rows', type=int, default=DEFAULT_ROWS,
+                            help="Количество синтетических вакансий")
+        parser.add_argument('--db-rows', type=int, default=5000,
+                            help="Количество вакансий из базы для сверки предиката и Q")
+
+    def handle(self, *args, **options) -> None:
+        """Выполнение команды."""
+        rows = [self._make_row(index) for index in range(options['rows'])]
+        records = [VacancyRecord.from_dict(row) for row in rows]
+        compiled = compile_filters(BENCHMARK_FILTERS)
+        short_query = compile_filters({'keywords': SHORT_QUERY})
+        long_query = compile_filters({'keywords': self._long_query()})
+
+        results = [
+            ('компиляция на каждую запись', lambda: [row for row in rows
+                                                     if compile_filters(BENCHMARK_FILTERS)(row)]),
+            ('CompiledFilter, dict', lambda: compiled.filter(rows)),
+            ('CompiledFilter, VacancyRecord', lambda: compiled.filter(records)),
+            ('ключевые слова, 3 термина', lambda: short_query.filter(records)),
+            (f'ключевые слова, {LONG_QUERY_TERMS} терминов', lambda: long_query.filter(records)),
+        ]
+        for name, run in results:
+            started = time.perf_counter()
+            matched = len(run())
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f"{name:32} {elapsed * 1e9 / len(rows):8.0f} нс/запись, совпало {matched}")
+
+        for predicate in (compiled, short_query, long_query):
+            self._check_database(predicate, options['db_rows'])
+
+    def _check_database(self, compiled, limit: int) -> None:
+        """Сравнение результатов предиката и Q на вакансиях из базы данных."""
+        ids = list(Vacancy.objects.order_by('id').values_list('id', flat=True)[:limit])
+        if not ids:
+            self.stdout.write("В базе нет вакансий для сверки предиката и Q")
+            return
+
+        queryset = Vacancy.objects.filter(id__in=ids)
+        # Предикат проверяет полное описание, как конвейер парсинга и индекс FTS5
+        full_texts = load_descriptions(ids)
+        in_memory = set()
+        for row in queryset.values('id', 'salary_from', 'salary_to', 'experience', 'employment', *KEYWORD_FIELDS):
+            row['description'] = full_texts.get(row['id'], row['description'])
+            if compiled(row):
+                in_memory.add(row['id'])
+        in_database = set(compiled.apply(queryset).values_list('id', flat=True))
+        if in_memory == in_database:
+            self.stdout.write(self.style.SUCCESS(f"Предикат и Q совпадают на {len(ids)} вакансиях"))
+        else:
+            self.stdout.write(self.style.ERROR(
+                f"Расхождение предиката и Q: {len(in_memory ^ in_database)} из {len(ids)} вакансий"
+            ))
+
+    def _make_row(self, index: int) -> dict:
+        """Синтетическая вакансия со случайными полями."""
+        salary_from = random.choice([None, random.randint(50, 300) * 1000])
+        salary_to = random.choice([None, random.randint(100, 500) * 1000])
+        return {
+            'title': random.choice(['Python разработчик', 'Java developer', 'Аналитик данных']),
+            'company': f"Компания {index % 500}",
+            'salary': 'Не указана',
+            'salary_from': salary_from,
+            'salary_to': salary_to,
+            'description': self._make_description(),
+            'experience': random.choice(['no', '1-3', '3-6', '6+']),
+            'employment': random.choice(['full', 'part', 'remote', 'project']),
+            'skills': random.choice(['Python, SQL', 'Java, Spring', 'Excel']),
+            'link': f"https://hh.ru/vacancy/{index}",
+        }
+
+    def _make_description(self) -> str:
+        """Описание вакансии длиной около DESCRIPTION_LENGTH символов из случайных предложений."""
+        sentences = []
+        length = 0
+        while length < DESCRIPTION_LENGTH:
+            sentence = random.choice(DESCRIPTION_SENTENCES)
+            sentences.append(sentence)
+            length += len(sentence) + 1
+        return ' '.join(sentences)
+
+    def _long_query(self) -> str:
+        """Запрос OR из LONG_QUERY_TERMS терминов, большинство которых не встречается в описаниях."""
+        terms = ['kotlin', 'golang', 'rust', 'scala', 'haskell', 'erlang', 'elixir', 'clojure', 'delphi',
+                 'cobol', 'fortran', 'perl', 'ruby', 'swift', 'dart', 'flutter', 'unity', 'unreal',
+                 'verilog', 'labview', 'matlab', 'sas', 'spss', 'sap', 'abap', '1с', 'bitrix',
+                 'wordpress', 'magento', 'drupal', 'joomla', 'tableau', 'qlik', 'figma', 'photoshop',
+                 'бухгалтер', 'юрист', 'логист', 'повар', 'django']
+        return ' OR '.join(terms[:LONG_QUERY_TERMS])
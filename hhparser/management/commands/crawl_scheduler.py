@@ -0,0 +1,58 @@
+"""
+Команда crawl_scheduler запускает сохраненные поиски по расписанию.
+
+Поиски, время запуска которых наступило, выполняются параллельно в рабочих
+процессах; история запусков сохраняется в SavedSearchRun. Без --once команда
+работает непрерывно и проверяет расписание каждые --poll-interval секунд.
+
+Пример:
+    python manage.py crawl_scheduler --workers 4
+    python manage.py crawl_scheduler --once
+"""
+
+import time
+from django.core.management.base import BaseCommand
+from hhparser.services.scheduler import run_due_searches, DEFAULT_WORKERS
+
+# Константы
+DEFAULT_POLL_INTERVAL = 30
+
+
+class Command(BaseCommand):
+    """Планировщик обхода сохраненных поисков."""
+
+    help = "Выполняет сохраненные поиски, время запуска которых наступило"
+
+    def add_arguments(self, parser) -> None:
+        """Регистрация аргументов командной строки."""
+        parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                            help="Количество рабочих процессов")
+        parser.add_argument('--poll-interval', type=int, default=DEFAULT_POLL_INTERVAL,
+                            help="Пауза между проверками расписания, секунд")
+        parser.add_argument('--once', action='store_true',
+                            help="Выполнить поиски, время которых наступило, и завершиться")
+
+    def handle(self, *args, **options) -> None:
+        """Выполнение команды."""
+        while True:
+            results = run_due_searches(workers=options['workers'], on_result=self._report)
+            if options['once']:
+                self.stdout.write(self.style.SUCCESS(f"Выполнено поисков: {len(results)}"))
+                return
+            try:
+                time.sleep(options['poll_interval'])
+            except KeyboardInterrupt:
+                self.stdout.write("Планировщик остановлен")
+                return
+
+    def _report(self, result: dict) -> None:
+        """Вывод результата одного запуска."""
+        if result.get('status') == 'done':
+            self.stdout.write(self.style.SUCCESS(
+                f"Поиск #{result['search_id']}: обработано {result['items_parsed']}, "
+                f"сохранено {result['rows_saved']} за {result['duration_seconds']} с"
+            ))
+        else:
+            self.stdout.write(self.style.ERROR(
+                f"Поиск #{result['search_id']}: ошибка {result.get('error', '')}"
+            ))
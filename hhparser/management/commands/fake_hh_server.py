@@ -0,0 +1,58 @@
+"""
+Команда fake_hh_server запускает локальную замену API HH.ru.
+
+Сервер отдает синтетические (или записанные в --recorded) вакансии по
+адресам /vacancies и /vacancies/{id} с настраиваемой задержкой и долей
+ответов 429. Работает до прерывания (Ctrl+C).
+
+Пример:
+    python manage.py fake_hh_server --port 8765 --latency 0.05 --error-rate 0.02
+"""
+
+from django.core.management.base import BaseCommand
+from DjangoProject_HH_parser.Services.fake_hh_server import FakeHHServer, DEFAULT_VACANCY_COUNT
+
+
+class Command(BaseCommand):
+    """Локальный сервер, имитирующий API HH.ru."""
+
+    help = "Запускает локальную замену API HH.ru с синтетическими вакансиями"
+
+    def add_arguments(self, parser) -> None:
+        """Регистрация аргументов командной строки."""
+        parser.add_argument('--host', default='127.0.0.1', help="Адрес прослушивания")
+        parser.add_argument('--port', type=int, default=8765, help="Порт")
+        parser.add_argument('--vacancies', type=int, default=DEFAULT_VACANCY_COUNT,
+                            help="Количество синтетических вакансий")
+        parser.add_argument('--recorded', default=None,
+                            help="Каталог JSON-файлов с записанными ответами /vacancies/{id}")
+        parser.add_argument('--latency', type=float, default=0.0,
+                            help="Задержка ответа, секунд")
+        parser.add_argument('--jitter', type=float, default=0.0,
+                            help="Случайная добавка к задержке, секунд")
+        parser.add_argument('--error-rate', type=float, default=0.0,
+                            help="Доля ответов 429")
+        parser.add_argument('--retry-after', default=None,
+                            help="Значение заголовка Retry-After в ответах 429")
+        parser.add_argument('--seed', type=int, default=0, help="Зерно генератора")
+
+    def handle(self, *args, **options) -> None:
+        """Выполнение команды."""
+        server = FakeHHServer(
+            vacancy_count=options['vacancies'],
+            latency=options['latency'],
+            jitter=options['jitter'],
+            error_rate=options['error_rate'],
+            retry_after=options['retry_after'],
+            seed=options['seed'],
+            recorded_dir=options['recorded'],
+            host=options['host'],
+            port=options['port'],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Сервер запущен: {server.search_url}"))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            self.stdout.write(f"Сервер остановлен, запросов: {server.stats()}")
+        finally:
+            server.stop()
@@ -0,0 +1,43 @@
+"""
+Команда generate_vacancies заполняет базу синтетическими вакансиями.
+
+Вакансии сохраняются через HHApiParser.save_to_database вместе с поисковым
+индексом, индексом навыков и кластерами дубликатов. Одинаковые --seed и
+--start воспроизводят те же вакансии (повторный запуск обновляет их).
+
+Пример:
+    python manage.py generate_vacancies --count 50000
+"""
+
+from django.core.management.base import BaseCommand
+from hhparser.services.datagen import generate_vacancies, DEFAULT_BATCH_SIZE
+from hhparser.services.statistics import invalidate_statistics
+
+
+class Command(BaseCommand):
+    """Генератор синтетических вакансий."""
+
+    help = "Заполняет таблицу вакансий синтетическими данными для бенчмарков"
+
+    def add_arguments(self, parser) -> None:
+        """Регистрация аргументов командной строки."""
+        parser.add_argument('--count', type=int, default=10000,
+                            help="Количество вакансий")
+        parser.add_argument('--seed', type=int, default=0,
+                            help="Зерно генератора")
+        parser.add_argument('--start', type=int, default=0,
+                            help="Порядковый номер первой вакансии")
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help="Количество вакансий в одной транзакции")
+
+    def handle(self, *args, **options) -> None:
+        """Выполнение команды."""
+        saved = generate_vacancies(
+            options['count'],
+            seed=options['seed'],
+            start=options['start'],
+            batch_size=options['batch_size'],
+            progress=lambda processed: self.stdout.write(f"Обработано {processed}/{options['count']}"),
+        )
+        invalidate_statistics()
+        self.stdout.write(self.style.SUCCESS(f"Сохранено или обновлено вакансий: {saved}"))
@@ -0,0 +1,74 @@
+"""
+Команда hh_crawl обходит несколько поисковых запросов параллельно и сохраняет вакансии.
+
+Обход выполняет hh_crawl.iter_query_pages (общие пул соединений и
+ограничитель частоты, вакансии из нескольких запросов загружаются один раз),
+сохранение — HHApiParser.save_to_database пакетами. Без Django те же
+параметры принимает python -m DjangoProject_HH_parser.Services.hh_crawl.
+
+Пример:
+    python manage.py hh_crawl python golang "data engineer" --count 500 --parallel 3
+    python manage.py hh_crawl --queries-file queries.txt --no-save --output vacancies.jsonl
+
+С --output - стандартный вывод содержит только строки JSON Lines, а итоги
+команды выводятся в stderr.
+"""
+
+import sys
+from django.core.management.base import BaseCommand, CommandError
+from hhparser.services.pipeline import chunked, DEFAULT_CHUNK_SIZE
+from DjangoProject_HH_parser.Services.hh_crawl import (DeferredInterrupt, add_crawl_arguments, client_options,
+                                                       iter_query_pages, read_queries, write_vacancies)
+from DjangoProject_HH_parser.Services.hh_parser import HHApiParser
+
+
+class Command(BaseCommand):
+    """Параллельный обход нескольких поисковых запросов."""
+
+    help = "Обходит несколько поисковых запросов HH.ru параллельно и сохраняет вакансии"
+
+    def add_arguments(self, parser) -> None:
+        """Регистрация аргументов командной строки."""
+        add_crawl_arguments(parser)
+        parser.add_argument('--no-save', action='store_true',
+                            help="Не сохранять вакансии в базу данных")
+
+    def handle(self, *args, **options) -> None:
+        """Выполнение команды."""
+        queries = read_queries(options)
+        if not queries:
+            raise CommandError("Не заданы поисковые запросы")
+
+        parser = HHApiParser(**client_options(options))
+        output = options['output']
+        stream = open(output, 'w', encoding='utf-8') if output and output != '-' else None
+        counts = dict.fromkeys(queries, 0)
+        saved = 0
+
+        def pages():
+            for search_query, vacancies in iter_query_pages(parser, queries, options['count'],
+                                                            options['parallel']):
+                counts[search_query] += len(vacancies)
+                if output:
+                    with DeferredInterrupt():
+                        write_vacancies(stream or sys.stdout, search_query, vacancies)
+                yield vacancies
+
+        try:
+            vacancies = (vacancy for page in pages() for vacancy in page)
+            for chunk in chunked(vacancies, DEFAULT_CHUNK_SIZE):
+                if not options['no_save']:
+                    saved += parser.save_to_database(chunk)
+        finally:
+            if stream is not None:
+                stream.close()
+            elif output:
+                sys.stdout.flush()
+
+        # Стандартный вывод занят вакансиями в формате JSON Lines
+        report = self.stderr if output == '-' else self.stdout
+        for search_query, count in counts.items():
+            report.write(f"Запрос '{search_query}': {count} вакансий")
+        report.write(self.style.SUCCESS(
+            f"Всего уникальных вакансий: {sum(counts.values())}, сохранено: {saved}"
+        ))
@@ -0,0 +1,71 @@
+"""
+Команда ingest_dump загружает дампы вакансий HH.ru без обращения к API.
+
+Принимает файлы JSON Lines, массивы JSON и ответы поиска, в том числе
+сжатые gzip. Вакансии нормализуются так же, как при обходе API, и
+сохраняются пакетами, индекс навыков синхронизируется крупными пакетами
+по SKILL_SYNC_SIZE вакансий; поисковый индекс и кластеры дубликатов
+обновляются один раз после загрузки всех файлов и только для записанных
+вакансий. --full-rebuild перестраивает их по всей
+таблице, --no-rebuild откладывает обновление (например, до загрузки
+следующих дампов с последующим rebuild_search_index и rebuild_duplicate_clusters).
+
+Пример:
+    python manage.py ingest_dump partners/vacancies-*.jsonl.gz --workers 8
+"""
+
+import os
+import time
+from django.core.management.base import BaseCommand, CommandError
+from hhparser.services.ingest import (ingest_dumps, update_derived_indexes, rebuild_derived_indexes,
+                                      DEFAULT_BATCH_SIZE)
+
+
+class Command(BaseCommand):
+    """Загрузка дампов вакансий."""
+
+    help = "Загружает вакансии из JSON/JSON Lines дампов HH.ru без запросов к API"
+
+    def add_arguments(self, parser) -> None:
+        """Регистрация аргументов командной строки."""
+        parser.add_argument('paths', nargs='+', help="Файлы дампов (.json, .jsonl, .ndjson, также .gz)")
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help="Количество рабочих процессов нормализации")
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help="Количество вакансий в одном пакете записи")
+        rebuild = parser.add_mutually_exclusive_group()
+        rebuild.add_argument('--no-rebuild', action='store_true',
+                             help="Не обновлять поисковый индекс и кластеры дубликатов")
+        rebuild.add_argument('--full-rebuild', action='store_true',
+                             help="Перестроить поисковый индекс и кластеры дубликатов по всей таблице")
+
+    def handle(self, *args, **options) -> None:
+        """Выполнение команды."""
+        missing = [path for path in options['paths'] if not os.path.isfile(path)]
+        if missing:
+            raise CommandError(f"Файлы не найдены: {', '.join(missing)}")
+
+        started = time.perf_counter()
+        result = ingest_dumps(
+            options['paths'],
+            workers=options['workers'],
+            batch_size=options['batch_size'],
+            progress=lambda current: self.stdout.write(f"Прочитано {current['read']}, сохранено {current['saved']}"),
+        )
+        elapsed = time.perf_counter() - started
+        rate = result['read'] / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"Прочитано: {result['read']}, сохранено или обновлено: {result['saved']}, "
+            f"пропущено: {result['skipped']} ({rate:.0f} вакансий/с)"))
+
+        if options['no_rebuild']:
+            self.stdout.write("Индексы не обновлены: выполните rebuild_search_index "
+                              "и rebuild_duplicate_clusters")
+            return
+        started = time.perf_counter()
+        if options['full_rebuild']:
+            updated = rebuild_derived_indexes()
+        else:
+            updated = update_derived_indexes(result['written_ids'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Индексы обновлены за {time.perf_counter() - started:.1f} с: {updated}"))
@@ -0,0 +1,50 @@
+"""
+Команда migrate_descriptions переносит описания вакансий в VacancyDescription.
+
+Для вакансий, сохраненных до появления отдельной таблицы описаний, текст
+из Vacancy.description сжимается в VacancyDescription, а в строке
+вакансии остается краткое описание. Повторный запуск обрабатывает только
+вакансии без VacancyDescription.
+
+Пример:
+    python manage.py migrate_descriptions --batch-size 1000
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from hhparser.models import Vacancy
+from hhparser.services.descriptions import description_preview, store_descriptions, STORE_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    """Перенос описаний в сжатую таблицу."""
+
+    help = "Переносит полные описания вакансий в таблицу VacancyDescription"
+
+    def add_arguments(self, parser) -> None:
+        """Регистрация аргументов командной строки."""
+        parser.add_argument('--batch-size', type=int, default=STORE_BATCH_SIZE,
+                            help="Количество записей в одной транзакции")
+
+    def handle(self, *args, **options) -> None:
+        """Выполнение команды пакетами по первичному ключу."""
+        batch_size = options['batch_size']
+        queryset = Vacancy.objects.filter(full_description__isnull=True)
+
+        migrated = 0
+        last_id = 0
+        while True:
+            batch = list(queryset.filter(id__gt=last_id).order_by('id').only('id', 'description')[:batch_size])
+            if not batch:
+                break
+
+            with transaction.atomic():
+                store_descriptions({vacancy.id: (vacancy.description, '') for vacancy in batch})
+                for vacancy in batch:
+                    vacancy.description = description_preview(vacancy.description)
+                Vacancy.objects.bulk_update(batch, ['description'])
+
+            migrated += len(batch)
+            last_id = batch[-1].id
+
+        self.stdout.write(self.style.SUCCESS(f"Перенесено описаний: {migrated}"))
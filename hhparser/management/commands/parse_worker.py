@@ -0,0 +1,47 @@
+"""
+Команда parse_worker выполняет фоновые задачи парсинга из очереди ParseJob.
+
+Задачи создает ParserView (POST /parser/); обработчик захватывает их из
+базы данных, поэтому задачи не теряются при перезапуске веб-сервера, а
+лимит --max-concurrent соблюдается для всех запущенных обработчиков.
+Задачи остановленного обработчика через services.jobs.STALE_AFTER
+помечаются как завершенные с ошибкой.
+
+Пример:
+    python manage.py parse_worker --threads 2
+    python manage.py parse_worker --once
+"""
+
+from django.core.management.base import BaseCommand
+from hhparser.services.jobs import run_worker, MAX_CONCURRENT_JOBS, POLL_INTERVAL
+
+
+class Command(BaseCommand):
+    """Обработчик очереди задач парсинга."""
+
+    help = "Выполняет задачи парсинга, поставленные через веб-интерфейс и API"
+
+    def add_arguments(self, parser) -> None:
+        """Регистрация аргументов командной строки."""
+        parser.add_argument('--threads', type=int, default=MAX_CONCURRENT_JOBS,
+                            help="Количество задач, выполняемых этим обработчиком одновременно")
+        parser.add_argument('--max-concurrent', type=int, default=MAX_CONCURRENT_JOBS,
+                            help="Общий лимит выполняемых задач всех обработчиков")
+        parser.add_argument('--poll-interval', type=float, default=POLL_INTERVAL,
+                            help="Пауза между проверками очереди, секунд")
+        parser.add_argument('--once', action='store_true',
+                            help="Выполнить задачи, находящиеся в очереди, и завершиться")
+
+    def handle(self, *args, **options) -> None:
+        """Выполнение команды."""
+        try:
+            completed = run_worker(
+                threads=options['threads'],
+                max_concurrent=options['max_concurrent'],
+                poll_interval=options['poll_interval'],
+                once=options['once'],
+            )
+        except KeyboardInterrupt:
+            self.stdout.write("Обработчик остановлен")
+            return
+        self.stdout.write(self.style.SUCCESS(f"Выполнено задач: {completed}"))
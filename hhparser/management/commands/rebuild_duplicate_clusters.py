@@ -0,0 +1,35 @@
+"""
+Команда rebuild_duplicate_clusters пересчитывает кластеры дубликатов вакансий.
+
+Строит сигнатуры MinHash и корзины LSH для всех вакансий заново; нужна
+для вакансий, сохраненных до появления поиска дубликатов, и после
+изменения текстов вакансий (инкрементальное обновление только объединяет кластеры).
+
+Пример:
+    python manage.py rebuild_duplicate_clusters --batch-size 1000
+"""
+
+from django.core.management.base import BaseCommand
+from hhparser.models import Vacancy
+from hhparser.services.dedup import rebuild_clusters, BATCH_SIZE
+from hhparser.services.statistics import invalidate_statistics
+
+
+class Command(BaseCommand):
+    """Полный пересчет кластеров дубликатов."""
+
+    help = "Пересчитывает сигнатуры MinHash и кластеры почти дубликатов вакансий"
+
+    def add_arguments(self, parser) -> None:
+        """Регистрация аргументов командной строки."""
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE,
+                            help="Количество вакансий в одной транзакции")
+
+    def handle(self, *args, **options) -> None:
+        """Выполнение команды."""
+        processed = rebuild_clusters(batch_size=options['batch_size'])
+        invalidate_statistics()
+        clusters = Vacancy.objects.values('cluster_id').distinct().count()
+        self.stdout.write(self.style.SUCCESS(
+            f"Обработано вакансий: {processed}, уникальных после объединения дубликатов: {clusters}"
+        ))
@@ -0,0 +1,29 @@
+"""
+Команда rebuild_search_index перестраивает полнотекстовый индекс вакансий.
+
+Индекс создается и заполняется автоматически после migrate; команда
+нужна, если таблица индекса была создана до этого (поиск не перестраивает
+ее в запросе пользователя), или после массовых изменений вакансий в обход ORM.
+
+Пример:
+    python manage.py rebuild_search_index
+"""
+
+from django.core.management.base import BaseCommand
+from hhparser.services.search import get_backend, rebuild_index
+
+
+class Command(BaseCommand):
+    """Полное перестроение индекса FTS5."""
+
+    help = "Перестраивает полнотекстовый индекс вакансий (SQLite FTS5)"
+
+    def handle(self, *args, **options) -> None:
+        """Выполнение команды."""
+        backend = get_backend()
+        if backend != 'fts5':
+            self.stdout.write(f"Бэкенд поиска '{backend}' не использует отдельный индекс")
+            return
+
+        indexed = rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f"Проиндексировано вакансий: {indexed}"))
@@ -0,0 +1,29 @@
+"""
+Команда rebuild_skill_index перестраивает индекс навыков вакансий.
+
+Заполняет таблицы Skill, VacancySkill и SkillPair по текстовому полю
+Vacancy.skills; нужна для вакансий, сохраненных до появления индекса,
+и после массовых изменений в обход ORM.
+
+Пример:
+    python manage.py rebuild_skill_index --batch-size 1000
+"""
+
+from django.core.management.base import BaseCommand
+from hhparser.services.skills import rebuild_skill_index, SYNC_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    """Полное перестроение индекса навыков."""
+
+    help = "Перестраивает индекс навыков и счетчики совместной встречаемости"
+
+    def add_arguments(self, parser) -> None:
+        """Регистрация аргументов командной строки."""
+        parser.add_argument('--batch-size', type=int, default=SYNC_BATCH_SIZE,
+                            help="Количество вакансий в одной транзакции")
+
+    def handle(self, *args, **options) -> None:
+        """Выполнение команды."""
+        processed = rebuild_skill_index(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Обработано вакансий: {processed}"))
@@ -0,0 +1,47 @@
+"""
+Команда reprocess пересоздает вакансии из архива ответов API HH.ru.
+
+Используется после изменения нормализации (normalize_vacancy): записи
+Vacancy обновляются по последним архивным ответам без обращения к API.
+Поисковый индекс, индекс навыков и кластеры дубликатов обновляются
+при сохранении.
+
+Пример:
+    python manage.py reprocess --workers 4
+"""
+
+import os
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from hhparser.services.reprocess import reprocess_archive, DEFAULT_BATCH_SIZE
+from hhparser.services.statistics import invalidate_statistics
+
+
+class Command(BaseCommand):
+    """Повторная нормализация вакансий из архива."""
+
+    help = "Пересоздает вакансии из архива ответов API без сетевых запросов"
+
+    def add_arguments(self, parser) -> None:
+        """Регистрация аргументов командной строки."""
+        parser.add_argument('--archive', default=None,
+                            help="Каталог архива (по умолчанию HH_PAYLOAD_ARCHIVE['PATH'])")
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help="Количество рабочих процессов")
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help="Количество ответов в одном пакете")
+
+    def handle(self, *args, **options) -> None:
+        """Выполнение команды."""
+        archive_path = options['archive'] or getattr(settings, 'HH_PAYLOAD_ARCHIVE', {}).get(
+            'PATH', os.path.join(settings.BASE_DIR, '.hh_archive'))
+        result = reprocess_archive(
+            str(archive_path),
+            workers=options['workers'],
+            batch_size=options['batch_size'],
+            progress=lambda processed: self.stdout.write(f"Обработано ответов: {processed}"),
+        )
+        invalidate_statistics()
+        self.stdout.write(self.style.SUCCESS(
+            f"Вакансий в архиве: {result['archived']}, сохранено: {result['saved']}, "
+            f"пропущено: {result['skipped']}"))
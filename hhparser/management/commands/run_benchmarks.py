@@ -0,0 +1,155 @@
+"""
+Команда run_benchmarks запускает воспроизводимые бенчмарки парсера и представлений.
+
+Замеры выполняются на отдельной базе данных (как у тестов Django), которая
+заполняется --rows синтетическими вакансиями; парсер работает с локальным
+FakeHHServer вместо api.hh.ru. Результаты сохраняются в JSON (--output) и
+могут сравниваться с результатами предыдущего коммита (--compare).
+
+Пример:
+    python manage.py run_benchmarks --rows 20000 --output bench/$(git rev-parse --short HEAD).json
+    python manage.py run_benchmarks --only parse_vacancies --latency 0.05 --error-rate 0.05
+    python manage.py run_benchmarks --compare bench/previous.json --fail-on-regression
+"""
+
+import json
+import logging
+import os
+import tempfile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from hhparser.models import Vacancy
+from hhparser.services.benchmarks import (run_benchmarks, compare_results, flatten_results, BENCHMARKS,
+                                          DEFAULT_REPEAT, DEFAULT_PARSE_COUNT, DEFAULT_SAVE_COUNT,
+                                          DEFAULT_RATE, REGRESSION_THRESHOLD)
+from hhparser.services.datagen import generate_vacancies
+from hhparser.services.statistics import invalidate_statistics
+
+# Константы
+DEFAULT_ROWS = 10000
+SQLITE_BENCHMARK_DB = os.path.join(tempfile.gettempdir(), 'hh_parser_benchmark.sqlite3')
+
+
+class Command(BaseCommand):
+    """Набор бенчмарков с результатами в JSON."""
+
+    help = "Измеряет парсер на локальном сервере и представления на синтетической базе"
+
+    def add_arguments(self, parser) -> None:
+        """Регистрация аргументов командной строки."""
+        parser.add_argument('--rows', type=int, default=DEFAULT_ROWS,
+                            help="Количество вакансий в базе бенчмарков")
+        parser.add_argument('--only', default='',
+                            help=f"Бенчмарки через запятую: {', '.join(BENCHMARKS)}")
+        parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                            help="Количество замеров каждого запроса к представлению")
+        parser.add_argument('--parse-count', type=int, default=DEFAULT_PARSE_COUNT,
+                            help="Количество вакансий для parse_vacancies")
+        parser.add_argument('--save-count', type=int, default=DEFAULT_SAVE_COUNT,
+                            help="Количество вакансий для save_to_database")
+        parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                            help="Ограничение запросов в секунду к локальному серверу")
+        parser.add_argument('--latency', type=float, default=0.0,
+                            help="Задержка ответа локального сервера, секунд")
+        parser.add_argument('--jitter', type=float, default=0.0,
+                            help="Случайная добавка к задержке, секунд")
+        parser.add_argument('--error-rate', type=float, default=0.0,
+                            help="Доля ответов 429 локального сервера")
+        parser.add_argument('--retry-after', default=None,
+                            help="Значение заголовка Retry-After в ответах 429")
+        parser.add_argument('--recorded', default=None,
+                            help="Каталог записанных ответов /vacancies/{id} для локального сервера")
+        parser.add_argument('--output', default=None,
+                            help="Файл для сохранения результатов в JSON")
+        parser.add_argument('--compare', default=None,
+                            help="Файл результатов предыдущего запуска для сравнения")
+        parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                            help="Доля замедления, считающаяся регрессией")
+        parser.add_argument('--fail-on-regression', action='store_true',
+                            help="Завершиться с ошибкой при регрессии")
+        parser.add_argument('--keepdb', action='store_true',
+                            help="Не удалять базу бенчмарков после запуска")
+
+    def handle(self, *args, **options) -> None:
+        """Выполнение команды."""
+        if options['repeat'] < 1:
+            raise CommandError("--repeat должен быть не меньше 1")
+        names = [name.strip() for name in options['only'].split(',') if name.strip()] or None
+        unknown = set(names or ()) - set(BENCHMARKS)
+        if unknown:
+            raise CommandError(f"Неизвестные бенчмарки: {', '.join(sorted(unknown))}")
+        server_options = {
+            'latency': options['latency'],
+            'jitter': options['jitter'],
+            'error_rate': options['error_rate'],
+            'retry_after': options['retry_after'],
+            'recorded_dir': options['recorded'],
+        }
+        if options['verbosity'] < 2:
+            # Журнал каждой страницы и пакета искажает замеры
+            logging.getLogger('DjangoProject_HH_parser').setLevel(logging.WARNING)
+
+        setup_test_environment()
+        old_name = self._create_database(options['keepdb'])
+        try:
+            self._fill_database(options['rows'])
+            report = run_benchmarks(
+                names,
+                repeat=options['repeat'],
+                parse_count=options['parse_count'],
+                save_count=options['save_count'],
+                rate=options['rate'],
+                server_options=server_options,
+                on_result=self._report,
+            )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options['keepdb'])
+            teardown_test_environment()
+
+        if options['output']:
+            directory = os.path.dirname(options['output'])
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(options['output'], 'w', encoding='utf-8') as file:
+                json.dump(report, file, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Результаты сохранены в {options['output']}"))
+
+        if options['compare']:
+            self._compare(report, options['compare'], options['threshold'], options['fail_on_regression'])
+
+    def _create_database(self, keepdb: bool) -> str:
+        """Создание базы бенчмарков; SQLite хранится на диске, а не в памяти."""
+        test_settings = connection.settings_dict.setdefault('TEST', {})
+        if connection.vendor == 'sqlite' and not test_settings.get('NAME'):
+            test_settings['NAME'] = SQLITE_BENCHMARK_DB
+        return connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=keepdb)
+
+    def _fill_database(self, rows: int) -> None:
+        """Дозаполнение базы бенчмарков синтетическими вакансиями."""
+        existing = Vacancy.objects.count()
+        if existing < rows:
+            self.stdout.write(f"Генерация вакансий: {rows - existing}")
+            generate_vacancies(rows - existing, start=existing)
+        invalidate_statistics()
+
+    def _report(self, name: str, result: dict) -> None:
+        """Вывод основных показателей бенчмарка."""
+        for key, value in flatten_results({name: result}).items():
+            unit = 'мс (медиана)' if key != name else 'с'
+            self.stdout.write(f"{key:45} {value:10.3f} {unit}")
+
+    def _compare(self, report: dict, path: str, threshold: float, fail: bool) -> None:
+        """Сравнение с результатами предыдущего запуска."""
+        with open(path, encoding='utf-8') as file:
+            previous = json.load(file)
+        rows = compare_results(report, previous, threshold)
+        commit = (previous.get('environment') or {}).get('commit') or '?'
+        self.stdout.write(f"Сравнение с {path} (коммит {commit[:12]}):")
+        for row in rows:
+            line = f"{row['name']:45} {row['previous']:10.3f} → {row['current']:10.3f}  x{row['ratio']:.2f}"
+            self.stdout.write(self.style.ERROR(line) if row['regression'] else line)
+
+        regressions = [row['name'] for row in rows if row['regression']]
+        if regressions and fail:
+            raise CommandError(f"Регрессии: {', '.join(regressions)}")
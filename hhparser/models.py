@@ -3,10 +3,21 @@
 
 Основная модель:
 - Vacancy: модель для хранения данных о вакансиях с HeadHunter
-  с полями для основной информации, опыта работы, типа занятости и навыков.
+  с полями для основной информации, зарплатной вилки, опыта работы, типа занятости и навыков.
+- VacancyDescription: полное описание вакансии (текст и HTML) в сжатом виде.
+- ParseJob: модель фоновой задачи парсинга с прогрессом выполнения.
+- CrawlState: состояние инкрементального обхода выдачи по поисковому запросу.
+- Skill, VacancySkill: нормализованные навыки и связь вакансий с ними.
+- SkillPair: предрасчитанная частота совместного упоминания двух навыков.
+- VacancyFingerprint, VacancyLshBand: сигнатуры MinHash и корзины LSH
+  для поиска почти дубликатов.
+- SavedSearch, SavedSearchRun: сохраненные поиски с расписанием обхода
+  и история их запусков.
+- VacancyRevision: изменения полей вакансии между обходами.
 """
 from django.db import models
 
+
 class Vacancy(models.Model):
     """
     Модель для хранения данных о вакансиях.
@@ -32,12 +43,24 @@ class Vacancy(models.Model):
     title = models.CharField(max_length=255, verbose_name="Название вакансии")
     company = models.CharField(max_length=255, verbose_name="Компания")
     salary = models.CharField(max_length=150, verbose_name="Зарплата", default="Не указана")
+    salary_from = models.PositiveIntegerField(null=True, blank=True, db_index=True, verbose_name="Зарплата от")
+    salary_to = models.PositiveIntegerField(null=True, blank=True, db_index=True, verbose_name="Зарплата до")
+    currency = models.CharField(max_length=3, blank=True, db_index=True, verbose_name="Валюта")
+    # Краткое описание для списков; полный текст хранится в VacancyDescription
     description = models.TextField(verbose_name="Описание", blank=True)
-    experience = models.CharField(max_length=10, choices=EXPERIENCE_CHOICES, verbose_name="Опыт работы")
-    employment = models.CharField(max_length=10, choices=EMPLOYMENT_CHOICES, verbose_name="Тип занятости")
+    experience = models.CharField(max_length=10, choices=EXPERIENCE_CHOICES, db_index=True,
+                                  verbose_name="Опыт работы")
+    employment = models.CharField(max_length=10, choices=EMPLOYMENT_CHOICES, db_index=True,
+                                  verbose_name="Тип занятости")
     skills = models.TextField(verbose_name="Навыки", blank=True)
+    key_skills = models.ManyToManyField('Skill', through='VacancySkill', related_name='vacancies',
+                                        blank=True, verbose_name="Ключевые навыки")
     link = models.URLField(verbose_name="Ссылка на вакансию", unique=True, max_length=500)
-    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True, verbose_name="Дата создания")
+    cluster_id = models.PositiveIntegerField(null=True, blank=True, db_index=True,
+                                             verbose_name="Кластер дубликатов")
+    content_hash = models.CharField(max_length=32, blank=True, editable=False,
+                                    verbose_name="Хэш содержимого")
 
     def __str__(self) -> str:
         """
@@ -65,4 +88,412 @@ class Vacancy(models.Model):
 
         verbose_name = "Вакансия"
         verbose_name_plural = "Вакансии"
-        ordering = ['-created_at']
\ No newline at end of file
+        ordering = ['-created_at']
+        indexes = [
+            # Keyset-пагинация FilterVacanciesView по (created_at, id)
+            models.Index(fields=['created_at', 'id'], name='vacancy_created_id_idx'),
+        ]
+
+
+class VacancyDescription(models.Model):
+    """
+    Модель полного описания вакансии.
+
+    Текст и очищенная HTML-разметка хранятся сжатыми (zlib) в отдельной
+    таблице и загружаются только там, где нужны целиком: в карточке
+    вакансии, поисковом индексе и поиске дубликатов (services/descriptions.py).
+    """
+    vacancy = models.OneToOneField(Vacancy, on_delete=models.CASCADE, primary_key=True,
+                                   related_name='full_description', verbose_name="Вакансия")
+    text = models.BinaryField(verbose_name="Текст (zlib)")
+    html = models.BinaryField(blank=True, default=b'', verbose_name="HTML (zlib)")
+
+    class Meta:
+        """Мета-класс для настроек модели VacancyDescription."""
+
+        verbose_name = "Описание вакансии"
+        verbose_name_plural = "Описания вакансий"
+
+
+class ParseJob(models.Model):
+    """
+    Модель фоновой задачи парсинга вакансий.
+
+    Хранит параметры запуска и прогресс выполнения задачи, чтобы клиент
+    мог опрашивать состояние парсинга, не удерживая HTTP-запрос.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'В очереди'),
+        (STATUS_RUNNING, 'Выполняется'),
+        (STATUS_DONE, 'Завершена'),
+        (STATUS_FAILED, 'Ошибка'),
+    ]
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING,
+                              verbose_name="Статус", db_index=True)
+    query = models.CharField(max_length=255, verbose_name="Поисковый запрос")
+    vacancy_count = models.PositiveIntegerField(default=50, verbose_name="Количество вакансий")
+    filters = models.JSONField(default=dict, blank=True, verbose_name="Фильтры")
+    incremental = models.BooleanField(default=False, verbose_name="Только новые вакансии")
+    pages_fetched = models.PositiveIntegerField(default=0, verbose_name="Загружено страниц")
+    items_parsed = models.PositiveIntegerField(default=0, verbose_name="Обработано вакансий")
+    rows_saved = models.PositiveIntegerField(default=0, verbose_name="Сохранено записей")
+    result = models.JSONField(null=True, blank=True, verbose_name="Результат")
+    error = models.TextField(blank=True, verbose_name="Ошибка")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Дата обновления")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="Дата завершения")
+
+    def __str__(self) -> str:
+        """
+        Строковое представление задачи.
+
+        Returns:
+            str: строка в формате "#id запрос (статус)"
+        """
+        return f"#{self.pk} {self.query} ({self.status})"
+
+    def to_dict(self) -> dict:
+        """
+        Сериализация состояния задачи для API.
+
+        Returns:
+            dict: словарь с параметрами и прогрессом задачи
+        """
+        return {
+            'job_id': self.pk,
+            'status': self.status,
+            'query': self.query,
+            'vacancy_count': self.vacancy_count,
+            'incremental': self.incremental,
+            'pages_fetched': self.pages_fetched,
+            'items_parsed': self.items_parsed,
+            'rows_saved': self.rows_saved,
+            'result': self.result,
+            'error': self.error,
+            'finished': self.status in (self.STATUS_DONE, self.STATUS_FAILED),
+        }
+
+    class Meta:
+        """Мета-класс для настроек модели ParseJob."""
+
+        verbose_name = "Задача парсинга"
+        verbose_name_plural = "Задачи парсинга"
+        ordering = ['-created_at']
+
+
+class QueueLock(models.Model):
+    """
+    Модель строки-семафора очереди задач.
+
+    Обработчики блокируют строку (SELECT ... FOR UPDATE) на время захвата
+    задачи, чтобы проверка общего лимита и смена статуса выполнялись
+    последовательно и при уровне изоляции READ COMMITTED.
+    """
+    name = models.CharField(max_length=50, unique=True, verbose_name="Очередь")
+
+    def __str__(self) -> str:
+        """
+        Строковое представление семафора.
+
+        Returns:
+            str: название очереди
+        """
+        return self.name
+
+    class Meta:
+        """Мета-класс для настроек модели QueueLock."""
+
+        verbose_name = "Семафор очереди"
+        verbose_name_plural = "Семафоры очередей"
+
+
+class CrawlState(models.Model):
+    """
+    Модель состояния инкрементального обхода по поисковому запросу.
+
+    Хранит отметку времени самой свежей публикации и идентификаторы
+    последних полученных вакансий, чтобы повторный запуск загружал
+    только новые вакансии. Если запуск остановился раньше отметки (лимит
+    количества, сбой), resume_before хранит дату самой старой полученной
+    публикации: следующий запуск продолжает обход с нее, а не с начала
+    выдачи; resume_published_at станет отметкой, когда пропуск будет
+    закрыт, а resume_ids — уже полученные вакансии пропуска.
+    """
+    query_key = models.CharField(max_length=300, unique=True, verbose_name="Ключ запроса")
+    last_published_at = models.DateTimeField(null=True, blank=True, verbose_name="Последняя публикация")
+    seen_ids = models.JSONField(default=list, blank=True, verbose_name="Известные вакансии")
+    resume_before = models.DateTimeField(null=True, blank=True, verbose_name="Продолжить с публикации")
+    resume_published_at = models.DateTimeField(null=True, blank=True,
+                                               verbose_name="Отметка после продолжения")
+    resume_ids = models.JSONField(default=list, blank=True, verbose_name="Полученные вакансии пропуска")
+    runs = models.PositiveIntegerField(default=0, verbose_name="Количество запусков")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Дата обновления")
+
+    def __str__(self) -> str:
+        """
+        Строковое представление состояния обхода.
+
+        Returns:
+            str: строка в формате "ключ (последняя публикация)"
+        """
+        return f"{self.query_key} ({self.last_published_at})"
+
+    class Meta:
+        """Мета-класс для настроек модели CrawlState."""
+
+        verbose_name = "Состояние обхода"
+        verbose_name_plural = "Состояния обхода"
+
+
+class StatisticsSnapshot(models.Model):
+    """
+    Модель материализованного снимка сводной статистики.
+
+    Снимок хранится в базе данных, поэтому общий для веб-сервера и всех
+    процессов, записывающих вакансии: сброс в любом процессе виден
+    остальным. generation увеличивается при каждом сбросе, чтобы снимок,
+    рассчитанный до сброса, не был сохранен после него.
+    """
+    key = models.CharField(max_length=50, unique=True, verbose_name="Ключ")
+    data = models.JSONField(null=True, blank=True, verbose_name="Статистика")
+    generation = models.PositiveIntegerField(default=0, verbose_name="Поколение")
+    computed_at = models.DateTimeField(null=True, blank=True, verbose_name="Дата расчета")
+
+    def __str__(self) -> str:
+        """
+        Строковое представление снимка.
+
+        Returns:
+            str: строка в формате "ключ (дата расчета)"
+        """
+        return f"{self.key} ({self.computed_at})"
+
+    class Meta:
+        """Мета-класс для настроек модели StatisticsSnapshot."""
+
+        verbose_name = "Снимок статистики"
+        verbose_name_plural = "Снимки статистики"
+
+
+class Skill(models.Model):
+    """
+    Модель нормализованного навыка.
+
+    Навык хранится один раз независимо от регистра и пробелов в написании;
+    vacancy_count поддерживается инкрементально при сохранении вакансий.
+    """
+    name = models.CharField(max_length=100, verbose_name="Название")
+    key = models.CharField(max_length=100, unique=True, verbose_name="Нормализованное название")
+    vacancy_count = models.PositiveIntegerField(default=0, db_index=True, verbose_name="Количество вакансий")
+
+    def __str__(self) -> str:
+        """
+        Строковое представление навыка.
+
+        Returns:
+            str: строка в формате "название (количество вакансий)"
+        """
+        return f"{self.name} ({self.vacancy_count})"
+
+    class Meta:
+        """Мета-класс для настроек модели Skill."""
+
+        verbose_name = "Навык"
+        verbose_name_plural = "Навыки"
+        ordering = ['-vacancy_count', 'name']
+
+
+class VacancySkill(models.Model):
+    """
+    Связь вакансии с навыком (промежуточная таблица Vacancy.key_skills).
+    """
+    vacancy = models.ForeignKey(Vacancy, on_delete=models.CASCADE, verbose_name="Вакансия")
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, verbose_name="Навык")
+
+    class Meta:
+        """Мета-класс для настроек модели VacancySkill."""
+
+        verbose_name = "Навык вакансии"
+        verbose_name_plural = "Навыки вакансий"
+        constraints = [
+            models.UniqueConstraint(fields=['vacancy', 'skill'], name='vacancy_skill_unique'),
+        ]
+
+
+class SkillPair(models.Model):
+    """
+    Модель частоты совместного упоминания навыков.
+
+    Пара хранится в обоих направлениях, чтобы связанные навыки выбирались
+    одним запросом по skill с сортировкой по count.
+    """
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='pairs', verbose_name="Навык")
+    other = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='+', verbose_name="Связанный навык")
+    count = models.PositiveIntegerField(default=0, verbose_name="Количество вакансий")
+
+    class Meta:
+        """Мета-класс для настроек модели SkillPair."""
+
+        verbose_name = "Пара навыков"
+        verbose_name_plural = "Пары навыков"
+        constraints = [
+            models.UniqueConstraint(fields=['skill', 'other'], name='skill_pair_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['skill', '-count'], name='skill_pair_top_idx'),
+        ]
+
+
+class VacancyFingerprint(models.Model):
+    """
+    Модель сигнатуры MinHash вакансии.
+
+    Сигнатура строится по названию, компании и описанию и используется
+    для оценки сходства с кандидатами, найденными через VacancyLshBand.
+    """
+    vacancy = models.OneToOneField(Vacancy, on_delete=models.CASCADE, primary_key=True,
+                                   related_name='fingerprint', verbose_name="Вакансия")
+    signature = models.BinaryField(verbose_name="Сигнатура MinHash")
+
+    class Meta:
+        """Мета-класс для настроек модели VacancyFingerprint."""
+
+        verbose_name = "Сигнатура вакансии"
+        verbose_name_plural = "Сигнатуры вакансий"
+
+
+class VacancyLshBand(models.Model):
+    """
+    Модель корзины LSH: хэш одной полосы сигнатуры вакансии.
+
+    Номер полосы входит в хэш, поэтому кандидаты в дубликаты ищутся
+    одним запросом по индексу bucket.
+    """
+    vacancy = models.ForeignKey(Vacancy, on_delete=models.CASCADE, related_name='lsh_bands',
+                                verbose_name="Вакансия")
+    bucket = models.BigIntegerField(db_index=True, verbose_name="Корзина")
+
+    class Meta:
+        """Мета-класс для настроек модели VacancyLshBand."""
+
+        verbose_name = "Корзина LSH"
+        verbose_name_plural = "Корзины LSH"
+
+
+class SavedSearch(models.Model):
+    """
+    Модель сохраненного поиска, который периодически обходит планировщик.
+
+    Запуски выполняет команда crawl_scheduler; время следующего запуска
+    сдвигается на интервал при захвате поиска планировщиком.
+    """
+    name = models.CharField(max_length=255, blank=True, verbose_name="Название")
+    query = models.CharField(max_length=255, verbose_name="Поисковый запрос")
+    filters = models.JSONField(default=dict, blank=True, verbose_name="Фильтры")
+    vacancy_count = models.PositiveIntegerField(default=200, verbose_name="Количество вакансий")
+    incremental = models.BooleanField(default=True, verbose_name="Только новые вакансии")
+    interval_minutes = models.PositiveIntegerField(default=60, verbose_name="Интервал, минут")
+    is_active = models.BooleanField(default=True, db_index=True, verbose_name="Активен")
+    next_run_at = models.DateTimeField(null=True, blank=True, db_index=True,
+                                       verbose_name="Следующий запуск")
+    last_run_at = models.DateTimeField(null=True, blank=True, verbose_name="Последний запуск")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
+
+    def __str__(self) -> str:
+        """
+        Строковое представление сохраненного поиска.
+
+        Returns:
+            str: строка в формате "название (каждые N мин)"
+        """
+        return f"{self.name or self.query} (каждые {self.interval_minutes} мин)"
+
+    class Meta:
+        """Мета-класс для настроек модели SavedSearch."""
+
+        verbose_name = "Сохраненный поиск"
+        verbose_name_plural = "Сохраненные поиски"
+        ordering = ['next_run_at']
+
+
+class SavedSearchRun(models.Model):
+    """
+    Модель запуска сохраненного поиска с длительностью и счетчиками.
+    """
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (STATUS_RUNNING, 'Выполняется'),
+        (STATUS_DONE, 'Завершен'),
+        (STATUS_FAILED, 'Ошибка'),
+    ]
+
+    saved_search = models.ForeignKey(SavedSearch, on_delete=models.CASCADE, related_name='runs',
+                                     verbose_name="Сохраненный поиск")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_RUNNING,
+                              verbose_name="Статус")
+    started_at = models.DateTimeField(auto_now_add=True, db_index=True, verbose_name="Начало")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="Окончание")
+    duration_seconds = models.FloatField(null=True, blank=True, verbose_name="Длительность, с")
+    pages_fetched = models.PositiveIntegerField(default=0, verbose_name="Загружено страниц")
+    items_parsed = models.PositiveIntegerField(default=0, verbose_name="Обработано вакансий")
+    items_found = models.PositiveIntegerField(default=0, verbose_name="Прошло фильтры")
+    rows_saved = models.PositiveIntegerField(default=0, verbose_name="Сохранено записей")
+    error = models.TextField(blank=True, verbose_name="Ошибка")
+
+    def __str__(self) -> str:
+        """
+        Строковое представление запуска.
+
+        Returns:
+            str: строка в формате "поиск: начало (статус)"
+        """
+        return f"{self.saved_search_id}: {self.started_at:%d.%m.%Y %H:%M} ({self.status})"
+
+    class Meta:
+        """Мета-класс для настроек модели SavedSearchRun."""
+
+        verbose_name = "Запуск сохраненного поиска"
+        verbose_name_plural = "Запуски сохраненных поисков"
+        ordering = ['-started_at']
+
+
+class VacancyRevision(models.Model):
+    """
+    Модель изменения вакансии при повторном сохранении.
+
+    Хранит только изменившиеся поля в виде {поле: [старое, новое]},
+    поэтому история зарплаты и других полей восстанавливается по
+    записям вакансии в порядке changed_at.
+    """
+    vacancy = models.ForeignKey(Vacancy, on_delete=models.CASCADE, related_name='revisions',
+                                verbose_name="Вакансия")
+    changed_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата изменения")
+    changes = models.JSONField(verbose_name="Изменения")
+
+    def __str__(self) -> str:
+        """
+        Строковое представление изменения.
+
+        Returns:
+            str: строка в формате "вакансия: дата (поля)"
+        """
+        return f"{self.vacancy_id}: {self.changed_at:%d.%m.%Y %H:%M} ({', '.join(self.changes)})"
+
+    class Meta:
+        """Мета-класс для настроек модели VacancyRevision."""
+
+        verbose_name = "Изменение вакансии"
+        verbose_name_plural = "Изменения вакансий"
+        ordering = ['-changed_at']
+        indexes = [
+            models.Index(fields=['vacancy', 'changed_at'], name='vacancy_revision_idx'),
+        ]
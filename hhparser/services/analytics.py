@@ -0,0 +1,251 @@
+"""
+Модуль analytics.py содержит аналитику зарплат по сохраненным вакансиям.
+
+Расчеты выполняются на массивах NumPy, построенных из числовых границ
+зарплаты (salary_from, salary_to) одним запросом к базе данных. Группы
+навыков строятся по связям VacancySkill, а не по обрезанному тексту поля
+Vacancy.skills.
+
+Основной функционал:
+- Перевод зарплат в базовую валюту по курсам из настроек
+- Перцентили (p25, медиана, p75, p90) и гистограммы с общими границами корзин
+- Группировка по опыту, типу занятости, компании или навыку
+- Распределение вакансий по исходным валютам
+"""
+
+import numpy as np
+from django.conf import settings
+from hhparser.models import Vacancy, VacancySkill
+
+# Константы
+BASE_CURRENCY = 'RUR'
+DEFAULT_CURRENCY_RATES = {
+    'RUR': 1.0,
+    'USD': 90.0,
+    'EUR': 100.0,
+    'KZT': 0.19,
+    'BYR': 28.0,
+    'UZS': 0.0072,
+    'KGS': 1.05,
+    'AZN': 53.0,
+    'GEL': 33.0,
+}
+GROUP_FIELDS = {
+    'experience': 'experience',
+    'employment': 'employment',
+    'company': 'company',
+    'skill': 'pk',
+}
+DEFAULT_BINS = 20
+DEFAULT_GROUP_LIMIT = 20
+PERCENTILES = (25, 50, 75, 90)
+
+
+def get_currency_rates() -> dict:
+    """
+    Курсы валют к базовой валюте (настройка HH_CURRENCY_RATES дополняет значения по умолчанию).
+
+    Returns:
+        dict: код валюты → стоимость единицы в BASE_CURRENCY
+    """
+    return {**DEFAULT_CURRENCY_RATES, **getattr(settings, 'HH_CURRENCY_RATES', {})}
+
+
+def load_salary_arrays(queryset, group_by: str = None) -> dict:
+    """
+    Загрузка зарплат одним запросом и построение массивов.
+
+    Зарплата вакансии — середина вилки, если указаны обе границы, иначе
+    указанная граница. Вакансии без зарплаты и с неизвестной валютой исключаются.
+
+    Args:
+        queryset: QuerySet (вакансии для анализа)
+        group_by: str (ключ GROUP_FIELDS или None)
+
+    Returns:
+        dict: массивы salary (в базовой валюте), raw_salary, currency и список groups
+    """
+    fields = ['salary_from', 'salary_to', 'currency']
+    if group_by:
+        fields.append(GROUP_FIELDS[group_by])
+
+    rows = list(
+        queryset
+        .exclude(salary_from__isnull=True, salary_to__isnull=True)
+        .values_list(*fields)
+    )
+    if not rows:
+        return {'salary': np.empty(0), 'raw_salary': np.empty(0),
+                'currency': np.empty(0, dtype=object), 'groups': []}
+
+    columns = list(zip(*rows))
+    salary_from = np.array(columns[0], dtype=float)
+    salary_to = np.array(columns[1], dtype=float)
+    currency = np.array(columns[2], dtype=object)
+
+    # None превращается в nan; nanmean по строке дает середину вилки или единственную границу
+    raw_salary = np.nanmean(np.vstack([salary_from, salary_to]), axis=0)
+
+    rates = get_currency_rates()
+    rate = np.array([rates.get(code, np.nan) for code in currency], dtype=float)
+    salary = raw_salary * rate
+
+    known = ~np.isnan(salary)
+    groups = [value for value, keep in zip(columns[3], known) if keep] if group_by else []
+
+    return {
+        'salary': salary[known],
+        'raw_salary': raw_salary[known],
+        'currency': currency[known],
+        'groups': groups,
+    }
+
+
+def describe(values: np.ndarray, bin_edges: np.ndarray) -> dict:
+    """
+    Сводные показатели и гистограмма для массива зарплат.
+
+    Args:
+        values: np.ndarray (зарплаты в базовой валюте)
+        bin_edges: np.ndarray (границы корзин гистограммы)
+
+    Returns:
+        dict: count, mean, min, max, p25, median, p75, p90, histogram
+    """
+    if not len(values):
+        return {'count': 0}
+
+    p25, median, p75, p90 = np.percentile(values, PERCENTILES)
+    histogram, _ = np.histogram(np.clip(values, bin_edges[0], bin_edges[-1]), bins=bin_edges)
+    return {
+        'count': int(len(values)),
+        'mean': round(float(values.mean())),
+        'min': round(float(values.min())),
+        'max': round(float(values.max())),
+        'p25': round(float(p25)),
+        'median': round(float(median)),
+        'p75': round(float(p75)),
+        'p90': round(float(p90)),
+        'histogram': histogram.tolist(),
+    }
+
+
+def _group_indices(groups: list, group_by: str, queryset=None) -> dict:
+    """
+    Индексы элементов массива для каждой группы.
+
+    Для группировки по навыку groups содержит идентификаторы вакансий, а
+    навыки загружаются одним запросом по связям VacancySkill; одна вакансия
+    входит в группы всех своих навыков.
+
+    Args:
+        groups: list (значения поля группировки по вакансиям)
+        group_by: str (ключ GROUP_FIELDS)
+        queryset: QuerySet (вакансии для анализа, нужен для группировки по навыку)
+
+    Returns:
+        dict: значение группы → np.ndarray индексов
+    """
+    if group_by == 'skill':
+        positions = {vacancy_id: position for position, vacancy_id in enumerate(groups)}
+        links = (VacancySkill.objects
+                 .filter(vacancy__in=queryset.order_by().values('pk'))
+                 .values_list('vacancy_id', 'skill__name'))
+        index_lists = {}
+        for vacancy_id, skill in links.iterator():
+            position = positions.get(vacancy_id)
+            if position is not None:
+                index_lists.setdefault(skill, []).append(position)
+        return {skill: np.array(indices) for skill, indices in index_lists.items()}
+
+    labels, inverse = np.unique(np.array(groups, dtype=str), return_inverse=True)
+    order = np.argsort(inverse, kind='stable')
+    boundaries = np.cumsum(np.bincount(inverse, minlength=len(labels)))[:-1]
+    return dict(zip(labels.tolist(), np.split(order, boundaries)))
+
+
+def salary_analytics(queryset=None, group_by: str = None, bins: int = DEFAULT_BINS,
+                     limit: int = DEFAULT_GROUP_LIMIT, min_count: int = 1) -> dict:
+    """
+    Аналитика зарплат с группировкой.
+
+    Args:
+        queryset: QuerySet (вакансии для анализа, по умолчанию все)
+        group_by: str (experience, employment, company, skill или None)
+        bins: int (количество корзин гистограммы)
+        limit: int (максимальное количество групп, самые многочисленные)
+        min_count: int (минимальный размер группы)
+
+    Returns:
+        dict: общие показатели, группы, границы корзин и распределение по валютам
+    """
+    if group_by and group_by not in GROUP_FIELDS:
+        raise ValueError(f"Недопустимая группировка: {group_by}")
+
+    if queryset is None:
+        queryset = Vacancy.objects.all()
+
+    arrays = load_salary_arrays(queryset, group_by)
+    salary = arrays['salary']
+
+    if len(salary):
+        # Общие границы корзин по 1-99 перцентилям, чтобы выбросы не растягивали шкалу
+        low, high = np.percentile(salary, (1, 99))
+        bin_edges = np.linspace(low, high if high > low else low + 1, bins + 1)
+    else:
+        bin_edges = np.linspace(0, 1, bins + 1)
+
+    result = {
+        'currency': BASE_CURRENCY,
+        'group_by': group_by,
+        'overall': describe(salary, bin_edges),
+        'bin_edges': [round(float(edge)) for edge in bin_edges],
+        'currencies': _currency_distribution(arrays),
+        'groups': [],
+    }
+
+    if group_by and len(salary):
+        display = _group_display(group_by)
+        indexed = sorted(_group_indices(arrays['groups'], group_by, queryset).items(),
+                         key=lambda item: len(item[1]), reverse=True)
+        for key, indices in indexed:
+            if len(indices) < min_count or len(result['groups']) >= limit:
+                break
+            result['groups'].append({
+                'key': key,
+                'label': display.get(key, key),
+                **describe(salary[indices], bin_edges),
+            })
+
+    return result
+
+
+def _currency_distribution(arrays: dict) -> dict:
+    """
+    Количество вакансий и медиана в исходной валюте для каждой валюты.
+
+    Args:
+        arrays: dict (результат load_salary_arrays)
+
+    Returns:
+        dict: код валюты → {'count', 'median'}
+    """
+    distribution = {}
+    currency = arrays['currency']
+    if not len(currency):
+        return distribution
+
+    codes, inverse = np.unique(currency.astype(str), return_inverse=True)
+    for position, code in enumerate(codes.tolist()):
+        values = arrays['raw_salary'][inverse == position]
+        distribution[code] = {'count': int(len(values)), 'median': round(float(np.median(values)))}
+    return distribution
+
+
+def _group_display(group_by: str) -> dict:
+    """Человекочитаемые названия значений для группировок с выбором из списка."""
+    if group_by == 'experience':
+        return dict(Vacancy.EXPERIENCE_CHOICES)
+    if group_by == 'employment':
+        return dict(Vacancy.EMPLOYMENT_CHOICES)
+    return {}
@@ -0,0 +1,327 @@
+"""
+Модуль benchmarks.py содержит воспроизводимые бенчмарки парсера и представлений.
+
+Парсер измеряется на локальном FakeHHServer, представления — через тестовый
+клиент Django на базе, заполненной generate_vacancies. Результаты собираются
+в словарь с окружением (коммит, версии, СУБД) и сохраняются в JSON, чтобы
+сравнивать замеры между коммитами (compare_results).
+
+Основной функционал:
+- BENCHMARKS: доступные бенчмарки в порядке выполнения
+- run_benchmarks: запуск набора бенчмарков
+- compare_results: сравнение с результатами предыдущего запуска
+"""
+
+import json
+import platform
+import statistics as stats_lib
+import subprocess
+import time
+import django
+from django.conf import settings
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from hhparser.models import Vacancy
+from hhparser.services.datagen import synthetic_items
+from hhparser.services.statistics import invalidate_statistics
+from DjangoProject_HH_parser.Services.fake_hh_server import FakeHHServer
+from DjangoProject_HH_parser.Services.hh_client import HHClient
+from DjangoProject_HH_parser.Services.hh_parser import HHApiParser
+from DjangoProject_HH_parser.Services.rate_limiter import RateLimiter
+from DjangoProject_HH_parser.Services.retry_policy import RetryPolicy
+
+# Константы
+DEFAULT_REPEAT = 20
+DEFAULT_PARSE_COUNT = 500
+DEFAULT_SAVE_COUNT = 2000
+DEFAULT_RATE = 1000.0  # запросов в секунду: ограничитель не должен определять результат
+REGRESSION_THRESHOLD = 0.1
+SAVE_START = 10_000_000  # номера вакансий save_to_database не пересекаются с заполненной базой
+
+LIST_VIEW_CASES = {
+    'plain': {},
+    'search': {'search': 'python разработчик'},
+    'keywords': {'keywords': 'python AND (django OR fastapi) NOT java'},
+    'filters': {'min_salary': '150000', 'experience': '3-6', 'employment': 'full'},
+    'collapse_duplicates': {'collapse_duplicates': '1'},
+}
+FILTER_VIEW_CASES = {
+    'plain': {},
+    'keywords': {'keywords': 'python, go'},
+    'filters': {'min_salary': '150000', 'min_experience_years': '3', 'employment': 'full'},
+}
+
+
+def bench_parse_vacancies(count: int = DEFAULT_PARSE_COUNT, rate: float = DEFAULT_RATE,
+                          **server_options) -> dict:
+    """
+    Парсинг вакансий с FakeHHServer без HTTP-кэша.
+
+    Args:
+        count: int (количество вакансий)
+        rate: float (ограничение запросов в секунду)
+        **server_options: параметры FakeHHServer (latency, jitter, error_rate, retry_after, seed)
+
+    Returns:
+        dict: время, скорость и количество запросов к серверу по типам
+    """
+    server_options.setdefault('vacancy_count', count)
+    with FakeHHServer(**server_options) as server:
+        parser = HHClient(rate_limiter=RateLimiter(rate, burst=max(1, int(rate))),
+                          retry_policy=RetryPolicy(base_delay=0.05), base_url=server.search_url)
+
+        started = time.perf_counter()
+        vacancies = parser.parse_vacancies('python', count)
+        elapsed = time.perf_counter() - started
+        requests_stats = server.stats()
+
+    return {
+        'seconds': round(elapsed, 4),
+        'vacancies': len(vacancies),
+        'vacancies_per_second': round(len(vacancies) / elapsed, 1) if elapsed else None,
+        'requests': requests_stats,
+    }
+
+
+def bench_save_to_database(count: int = DEFAULT_SAVE_COUNT, seed: int = 0) -> dict:
+    """
+    Пакетное сохранение новых вакансий и повторное сохранение тех же (обновление).
+
+    Args:
+        count: int (количество вакансий)
+        seed: int (зерно генератора)
+
+    Returns:
+        dict: время вставки и обновления
+    """
+    parser = HHApiParser()
+    items = list(synthetic_items(count, seed, SAVE_START))
+    result = {'vacancies': count}
+    for phase in ('insert', 'update'):
+        started = time.perf_counter()
+        parser.save_to_database(items)
+        result[f'{phase}_seconds'] = round(time.perf_counter() - started, 4)
+    result['seconds'] = result['insert_seconds']
+    result['rows_per_second'] = round(count / result['insert_seconds'], 1) if result['insert_seconds'] else None
+
+    # Вакансии бенчмарка удаляются, чтобы не менять данные следующих запусков
+    Vacancy.objects.filter(link__in=[item['link'] for item in items]).delete()
+    return result
+
+
+def bench_request(client: Client, method: str, path: str, repeat: int = DEFAULT_REPEAT,
+                  data=None, before=None) -> dict:
+    """
+    Замер запроса к представлению через тестовый клиент.
+
+    Первый запрос выполняется для прогрева и не учитывается; по нему
+    считается количество SQL-запросов.
+
+    Args:
+        client: Client (тестовый клиент Django)
+        method: str ('get' или 'post')
+        path: str (адрес представления)
+        repeat: int (количество замеров)
+        data: dict или str (параметры GET или тело POST)
+        before: callable (вызывается перед каждым запросом, например для сброса кэша)
+
+    Returns:
+        dict: статистика длительности в миллисекундах и количество SQL-запросов
+    """
+    def send():
+        if before:
+            before()
+        if method == 'post':
+            return client.post(path, data=data, content_type='application/json')
+        return client.get(path, data=data)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = send()
+    if response.status_code != 200:
+        raise RuntimeError(f"{method.upper()} {path} вернул {response.status_code}")
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        send()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {**_timings(samples), 'queries': len(queries)}
+
+
+def bench_vacancy_list_view(repeat: int = DEFAULT_REPEAT) -> dict:
+    """Замеры VacancyListView для типичных наборов фильтров."""
+    client = Client()
+    return {case: bench_request(client, 'get', '/vacancies/', repeat, params)
+            for case, params in LIST_VIEW_CASES.items()}
+
+
+def bench_filter_vacancies_view(repeat: int = DEFAULT_REPEAT) -> dict:
+    """Замеры FilterVacanciesView для первой страницы выдачи."""
+    client = Client()
+    return {case: bench_request(client, 'post', '/api/filter-vacancies/', repeat,
+                                json.dumps({'filters': filters, 'limit': 50}))
+            for case, filters in FILTER_VIEW_CASES.items()}
+
+
+def bench_statistics_view(repeat: int = DEFAULT_REPEAT) -> dict:
+    """Замеры StatisticsView с пересчетом статистики и из кэша."""
+    client = Client()
+    return {
+        'cold': bench_request(client, 'get', '/api/statistics/', repeat, before=invalidate_statistics),
+        'warm': bench_request(client, 'get', '/api/statistics/', repeat),
+    }
+
+
+BENCHMARKS = {
+    'parse_vacancies': bench_parse_vacancies,
+    'vacancy_list_view': bench_vacancy_list_view,
+    'filter_vacancies_view': bench_filter_vacancies_view,
+    'statistics_view': bench_statistics_view,
+    'save_to_database': bench_save_to_database,
+}
+
+
+def run_benchmarks(names: list = None, repeat: int = DEFAULT_REPEAT, parse_count: int = DEFAULT_PARSE_COUNT,
+                   save_count: int = DEFAULT_SAVE_COUNT, rate: float = DEFAULT_RATE,
+                   server_options: dict = None, on_result=None) -> dict:
+    """
+    Запуск набора бенчмарков на текущей базе данных.
+
+    Args:
+        names: list (имена из BENCHMARKS; None — все)
+        repeat: int (количество замеров запроса к представлению)
+        parse_count: int (количество вакансий для parse_vacancies)
+        save_count: int (количество вакансий для save_to_database)
+        rate: float (ограничение запросов в секунду для parse_vacancies)
+        server_options: dict (параметры FakeHHServer)
+        on_result: callable (получает имя и результат каждого бенчмарка)
+
+    Returns:
+        dict: окружение, параметры и результаты
+    """
+    names = names or list(BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f"Неизвестные бенчмарки: {', '.join(sorted(unknown))}")
+
+    arguments = {
+        'parse_vacancies': lambda: bench_parse_vacancies(parse_count, rate, **(server_options or {})),
+        'save_to_database': lambda: bench_save_to_database(save_count),
+    }
+    results = {}
+    for name in BENCHMARKS:
+        if name not in names:
+            continue
+        run = arguments.get(name) or (lambda benchmark=BENCHMARKS[name]: benchmark(repeat))
+        results[name] = run()
+        if on_result:
+            on_result(name, results[name])
+
+    return {
+        'environment': environment_info(),
+        'parameters': {
+            'rows': Vacancy.objects.count(),
+            'repeat': repeat,
+            'parse_count': parse_count,
+            'save_count': save_count,
+            'rate': rate,
+            'server': server_options or {},
+        },
+        'results': results,
+    }
+
+
+def environment_info() -> dict:
+    """
+    Сведения об окружении замера.
+
+    Returns:
+        dict: коммит, версии Python и Django, СУБД и время запуска
+    """
+    return {
+        'commit': _git('rev-parse', 'HEAD'),
+        'dirty': bool(_git('status', '--porcelain', '--untracked-files=no')),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'database': connection.vendor,
+        'machine': platform.machine(),
+        'timestamp': timezone.now().isoformat(),
+    }
+
+
+def flatten_results(results: dict, prefix: str = '') -> dict:
+    """
+    Основные показатели результатов: медиана для представлений, время для остальных.
+
+    Args:
+        results: dict (результаты run_benchmarks['results'])
+        prefix: str (префикс имени)
+
+    Returns:
+        dict: имя замера → значение (меньше — лучше)
+    """
+    flat = {}
+    for name, value in results.items():
+        key = f'{prefix}{name}'
+        if not isinstance(value, dict):
+            continue
+        if 'median_ms' in value:
+            flat[key] = value['median_ms']
+        elif 'seconds' in value:
+            flat[key] = value['seconds']
+        else:
+            flat.update(flatten_results(value, f'{key}.'))
+    return flat
+
+
+def compare_results(current: dict, previous: dict, threshold: float = REGRESSION_THRESHOLD) -> list:
+    """
+    Сравнение основных показателей двух запусков.
+
+    Args:
+        current: dict (результат run_benchmarks)
+        previous: dict (результат предыдущего запуска)
+        threshold: float (доля замедления, считающаяся регрессией)
+
+    Returns:
+        list: словари name, previous, current, ratio и regression для общих замеров
+    """
+    before = flatten_results(previous.get('results', {}))
+    after = flatten_results(current.get('results', {}))
+    rows = []
+    for name in after:
+        if name not in before or not before[name]:
+            continue
+        ratio = after[name] / before[name]
+        rows.append({
+            'name': name,
+            'previous': before[name],
+            'current': after[name],
+            'ratio': round(ratio, 3),
+            'regression': ratio > 1 + threshold,
+        })
+    return rows
+
+
+def _timings(samples: list) -> dict:
+    """Статистика длительностей в миллисекундах."""
+    ordered = sorted(samples)
+    return {
+        'runs': len(ordered),
+        'mean_ms': round(stats_lib.fmean(ordered), 3),
+        'median_ms': round(stats_lib.median(ordered), 3),
+        'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        'min_ms': round(ordered[0], 3),
+    }
+
+
+def _git(*args) -> str:
+    """Вывод команды git в каталоге проекта или None, если git недоступен."""
+    try:
+        result = subprocess.run(['git', *args], cwd=settings.BASE_DIR, capture_output=True,
+                                text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
@@ -0,0 +1,212 @@
+"""
+Модуль boolean_query.py содержит язык булевых запросов по ключевым словам.
+
+Синтаксис: слова, фразы в кавычках, операторы AND, OR, NOT (а также И, ИЛИ, НЕ),
+запятая как OR и скобки, например `python AND (django OR fastapi) NOT senior`.
+Соседние слова без оператора объединяются через AND; NOT после операнда
+означает "AND NOT". Разбор нестрогий: лишние скобки и висящие операторы
+игнорируются.
+
+Запрос разбирается в дерево терминов; значение вычисляется по множеству
+найденных терминов (evaluate), а для базы данных запрос переводится в условие
+Q с подстановкой условия для отдельного термина (to_q). Как искать термины,
+решает вызывающий код: фильтры (filters.py) ищут их по токенам полнотекстового
+индекса (search.term_q и search.TermMatcher).
+
+Основной класс:
+- BooleanQuery: разобранный запрос (вычисление по найденным терминам и перевод в Q)
+"""
+
+import re
+from django.db.models import Q
+
+# Константы
+OPERATORS = {
+    'AND': 'and', 'И': 'and',
+    'OR': 'or', 'ИЛИ': 'or',
+    'NOT': 'not', 'НЕ': 'not',
+}
+TOKEN_PATTERN = re.compile(r'"([^"]*)"?|(\()|(\))|(,)|([^\s(),"]+)')
+
+
+class BooleanQuery:
+    """
+    Разобранный булев запрос по ключевым словам.
+
+    Дерево запроса состоит из кортежей ('term', индекс), ('and', [узлы]),
+    ('or', [узлы]) и ('not', узел); термины хранятся в terms в нижнем регистре.
+    """
+
+    __slots__ = ('text', 'terms', 'tree')
+
+    def __init__(self, text: str):
+        """
+        Разбор запроса.
+
+        Args:
+            text: str (запрос пользователя)
+        """
+        self.text = text
+        self.terms = []
+        self.tree = _Parser(_tokenize(text), self.terms).parse()
+
+    @property
+    def is_empty(self) -> bool:
+        """True, если в запросе нет терминов."""
+        return self.tree is None
+
+    def evaluate(self, found: set) -> bool:
+        """
+        Значение запроса по найденным терминам.
+
+        Args:
+            found: set (индексы совпавших терминов из terms)
+
+        Returns:
+            bool: True, если запрос выполняется
+        """
+        return True if self.tree is None else _evaluate(self.tree, found)
+
+    def to_q(self, term_q) -> Q:
+        """
+        Перевод запроса в условие Q.
+
+        Args:
+            term_q: callable (строка термина → Q для одного термина)
+
+        Returns:
+            Q: условие для QuerySet (пустое Q для пустого запроса)
+        """
+        if self.tree is None:
+            return Q()
+        return _to_q(self.tree, self.terms, term_q)
+
+
+def _tokenize(text: str) -> list:
+    """
+    Разбиение запроса на лексемы.
+
+    Args:
+        text: str (запрос пользователя)
+
+    Returns:
+        list: пары (тип, значение): ('term', строка), ('op', and/or/not), ('(', None), (')', None)
+    """
+    tokens = []
+    for phrase, opening, closing, comma, word in TOKEN_PATTERN.findall(text or ''):
+        if opening:
+            tokens.append(('(', None))
+        elif closing:
+            tokens.append((')', None))
+        elif comma:
+            tokens.append(('op', 'or'))
+        elif word:
+            operator = OPERATORS.get(word) if word.isupper() else None
+            tokens.append(('op', operator) if operator else ('term', word))
+        elif phrase.strip():
+            tokens.append(('term', ' '.join(phrase.split())))
+    return tokens
+
+
+class _Parser:
+    """Нестрогий рекурсивный разбор: OR < AND (явный или неявный) < NOT."""
+
+    def __init__(self, tokens: list, terms: list):
+        """Сохраняет лексемы; найденные термины добавляются в terms."""
+        self.tokens = tokens
+        self.position = 0
+        self.terms = terms
+
+    def parse(self):
+        """Разбор всего запроса; лишние закрывающие скобки пропускаются."""
+        nodes = []
+        while self.position < len(self.tokens):
+            node = self._or()
+            if node is not None:
+                nodes.append(node)
+            if self._peek() == (')', None):
+                self.position += 1
+        return _combine('and', nodes)
+
+    def _peek(self) -> tuple:
+        """Текущая лексема или (None, None) в конце запроса."""
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def _or(self):
+        """Дизъюнкция конъюнкций."""
+        nodes = [self._and()]
+        while self._peek() == ('op', 'or'):
+            self.position += 1
+            nodes.append(self._and())
+        return _combine('or', nodes)
+
+    def _and(self):
+        """Конъюнкция с явным или неявным AND."""
+        nodes = []
+        while True:
+            kind, value = self._peek()
+            if kind is None or kind == ')' or (kind, value) == ('op', 'or'):
+                break
+            if (kind, value) == ('op', 'and'):
+                self.position += 1
+                continue
+            nodes.append(self._not())
+        return _combine('and', nodes)
+
+    def _not(self):
+        """Отрицание операнда."""
+        if self._peek() == ('op', 'not'):
+            self.position += 1
+            operand = self._not()
+            return ('not', operand) if operand is not None else None
+        return self._primary()
+
+    def _primary(self):
+        """Термин, фраза или выражение в скобках."""
+        kind, value = self._peek()
+        self.position += 1
+        if kind == 'term':
+            term = value.lower()
+            if term not in self.terms:
+                self.terms.append(term)
+            return ('term', self.terms.index(term))
+        if kind == '(':
+            node = self._or()
+            if self._peek() == (')', None):
+                self.position += 1
+            return node
+        return None
+
+
+def _combine(operator: str, nodes: list):
+    """Объединение узлов с пропуском пустых."""
+    nodes = [node for node in nodes if node is not None]
+    if not nodes:
+        return None
+    return nodes[0] if len(nodes) == 1 else (operator, nodes)
+
+
+def _evaluate(node, found: set) -> bool:
+    """Вычисление дерева по множеству найденных терминов."""
+    kind, value = node
+    if kind == 'term':
+        return value in found
+    if kind == 'not':
+        return not _evaluate(value, found)
+    if kind == 'and':
+        return all(_evaluate(child, found) for child in value)
+    return any(_evaluate(child, found) for child in value)
+
+
+def _to_q(node, terms: list, term_q) -> Q:
+    """Перевод дерева в Q."""
+    kind, value = node
+    if kind == 'term':
+        return term_q(terms[value])
+    if kind == 'not':
+        return ~_to_q(value, terms, term_q)
+    result = _to_q(value[0], terms, term_q)
+    for child in value[1:]:
+        child_q = _to_q(child, terms, term_q)
+        result = result & child_q if kind == 'and' else result | child_q
+    return result
@@ -0,0 +1,192 @@
+"""
+Модуль crawl_state.py содержит логику инкрементального обхода выдачи HH.ru.
+
+Основной класс:
+- CrawlWatermark: отметка последней публикации и известных вакансий
+  для поискового запроса; формирует параметры запроса только новых
+  вакансий, продвигает отметку после полного обхода и сохраняет курсор
+  продолжения после неполного.
+"""
+
+from datetime import datetime
+from hhparser.models import CrawlState
+from DjangoProject_HH_parser.Services.hh_client import DEFAULT_AREA, SeenIds
+
+# Константы
+MAX_SEEN_IDS = 5000
+HH_DATE_FORMAT = '%Y-%m-%dT%H:%M:%S%z'
+
+
+def make_query_key(search_query: str, area: int = DEFAULT_AREA) -> str:
+    """
+    Нормализованный ключ состояния обхода.
+
+    Args:
+        search_query: str (поисковый запрос)
+        area: int (идентификатор региона)
+
+    Returns:
+        str: ключ в формате "area:запрос"
+    """
+    return f"{area}:{' '.join(search_query.lower().split())}"
+
+
+def parse_published_at(value: str):
+    """
+    Разбор даты публикации из формата API HH.ru.
+
+    Args:
+        value: str (дата вида 2025-01-31T12:00:00+0300)
+
+    Returns:
+        datetime: дата с часовым поясом или None, если разобрать не удалось
+    """
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, HH_DATE_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+class CrawlWatermark:
+    """
+    Отметка инкрементального обхода для одного поискового запроса.
+
+    Наблюдает все разобранные вакансии запуска (до пользовательских
+    фильтров). Выдача идет от новых к старым, поэтому отметка
+    last_published_at продвигается, только когда обход без пропусков дошел
+    до прошлой отметки (mark_complete). Если запуск остановился раньше
+    (лимит vacancy_count, сбой), сохраняется курсор продолжения: дата самой
+    старой полученной публикации. Следующий запуск запрашивает выдачу до
+    этой даты (date_to), пропуская уже полученные вакансии, поэтому каждый
+    запуск продвигается к прошлой отметке, даже если между запусками
+    публикуется больше vacancy_count вакансий. Когда пропуск закрыт,
+    отметка переносится на самую свежую публикацию всех его запусков.
+    """
+
+    def __init__(self, search_query: str, area: int = DEFAULT_AREA) -> None:
+        """
+        Загрузка или создание состояния обхода для запроса.
+
+        Args:
+            search_query: str (поисковый запрос)
+            area: int (идентификатор региона)
+        """
+        self.state, _ = CrawlState.objects.get_or_create(query_key=make_query_key(search_query, area))
+        self.known_ids = set(self.state.seen_ids)
+        self._newest = None
+        self._oldest = None
+        self._contiguous_oldest = None
+        self._page_skipped = False
+        self._new_ids = []
+        self._new_id_set = set()
+        self.complete = False
+
+    @property
+    def resuming(self) -> bool:
+        """Запуск продолжает незакрытый пропуск прошлых запусков."""
+        return self.state.resume_before is not None
+
+    def search_params(self) -> dict:
+        """
+        Параметры поиска только новых вакансий.
+
+        Выдача сортируется по дате публикации, чтобы обход можно было
+        остановить на первой уже известной вакансии. При продолжении
+        пропуска выдача ограничивается сверху курсором resume_before.
+
+        Returns:
+            dict: дополнительные параметры запроса к API
+        """
+        params = {'order_by': 'publication_time'}
+        if self.state.last_published_at:
+            params['date_from'] = self.state.last_published_at.replace(microsecond=0).isoformat()
+        if self.resuming:
+            params['date_to'] = self.state.resume_before.replace(microsecond=0).isoformat()
+        return params
+
+    def skip_ids(self) -> SeenIds:
+        """
+        Вакансии пропуска, уже полученные прошлыми запусками.
+
+        Такие вакансии пропускаются без загрузки, но, в отличие от known_ids,
+        не останавливают обход: на границе курсора они идут первыми.
+
+        Returns:
+            SeenIds: множество для параметра seen обхода
+        """
+        seen = SeenIds()
+        seen.claim(self.state.resume_ids)
+        return seen
+
+    def observe(self, vacancy: dict) -> None:
+        """
+        Учитывает разобранную вакансию в отметке.
+
+        Args:
+            vacancy: dict (данные вакансии после parse_vacancy_item)
+        """
+        hh_id = vacancy.get('hh_id')
+        # known_ids не пополняется во время запуска: вакансия, сдвинутая новыми
+        # публикациями на следующую страницу, не должна останавливать обход
+        if hh_id and hh_id not in self.known_ids and hh_id not in self._new_id_set:
+            self._new_id_set.add(hh_id)
+            self._new_ids.append(hh_id)
+
+        published_at = parse_published_at(vacancy.get('published_at'))
+        if published_at:
+            if self._newest is None or published_at > self._newest:
+                self._newest = published_at
+            if self._oldest is None or published_at < self._oldest:
+                self._oldest = published_at
+
+    def mark_complete(self) -> None:
+        """Обход дошел до известных вакансий или до конца выдачи без пропусков."""
+        self.complete = True
+
+    def mark_page_skipped(self) -> None:
+        """
+        Страница выдачи пропущена: курсор продолжения не сдвигается дальше
+        последней вакансии, полученной до пропуска.
+        """
+        if not self._page_skipped:
+            self._page_skipped = True
+            self._contiguous_oldest = self._oldest
+
+    def commit(self) -> bool:
+        """
+        Завершение запуска: увеличивает счетчик запусков и сохраняет отметку.
+
+        Полный обход (или первый запуск, у которого еще нет отметки)
+        продвигает last_published_at и закрывает пропуск. Неполный обход
+        сохраняет курсор продолжения по самой старой полученной публикации.
+
+        Returns:
+            bool: отметка или курсор продвинуты
+        """
+        state = self.state
+        advanced = False
+        if self.complete or (state.last_published_at is None and not self.resuming):
+            newest = max((value for value in (state.last_published_at, state.resume_published_at, self._newest)
+                          if value is not None), default=None)
+            # Вакансии пропуска тоже известны следующему запуску
+            if self._new_ids or state.resume_ids:
+                state.seen_ids = (state.seen_ids + self._new_ids + state.resume_ids)[-MAX_SEEN_IDS:]
+            state.last_published_at = newest
+            state.resume_before = None
+            state.resume_published_at = None
+            state.resume_ids = []
+            advanced = True
+        else:
+            oldest = self._contiguous_oldest if self._page_skipped else self._oldest
+            if oldest is not None and (state.resume_before is None or oldest <= state.resume_before):
+                if state.resume_before is None:
+                    state.resume_published_at = self._newest
+                state.resume_before = oldest
+                state.resume_ids = (state.resume_ids + self._new_ids)[-MAX_SEEN_IDS:]
+                advanced = True
+        self._new_ids = []
+        state.runs += 1
+        state.save()
+        return advanced
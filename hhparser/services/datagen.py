@@ -0,0 +1,66 @@
+"""
+Модуль datagen.py содержит генератор синтетических вакансий для бенчмарков.
+
+Вакансии строятся из тех же синтетических ответов API, что отдает
+FakeHHServer, нормализуются hh_client.normalize_vacancy и сохраняются
+через save_to_database, поэтому поисковый индекс, индекс навыков и
+кластеры дубликатов заполняются так же, как при настоящем парсинге.
+Одинаковые seed и start дают одинаковые вакансии (повторный запуск
+обновляет их по ссылке).
+
+Основной функционал:
+- synthetic_items: поток разобранных синтетических вакансий
+- generate_vacancies: заполнение таблицы Vacancy
+"""
+
+from DjangoProject_HH_parser.Services.fake_hh_server import synthetic_vacancy
+from DjangoProject_HH_parser.Services.hh_client import normalize_vacancy
+from DjangoProject_HH_parser.Services.hh_parser import HHApiParser
+from hhparser.services.pipeline import chunked
+
+# Константы
+DEFAULT_BATCH_SIZE = 500
+
+
+def synthetic_items(count: int, seed: int = 0, start: int = 0):
+    """
+    Поток синтетических вакансий в формате parse_vacancy_item.
+
+    Args:
+        count: int (количество вакансий)
+        seed: int (зерно генератора)
+        start: int (порядковый номер первой вакансии)
+
+    Yields:
+        dict: данные вакансии для save_to_database
+    """
+    for index in range(start, start + count):
+        payload = synthetic_vacancy(index, seed)
+        # Синтетический ответ /vacancies/{id} служит и элементом выдачи, и детальной информацией
+        yield normalize_vacancy(payload, payload)
+
+
+def generate_vacancies(count: int, seed: int = 0, start: int = 0,
+                       batch_size: int = DEFAULT_BATCH_SIZE, progress=None) -> int:
+    """
+    Заполнение таблицы Vacancy синтетическими вакансиями.
+
+    Args:
+        count: int (количество вакансий)
+        seed: int (зерно генератора)
+        start: int (порядковый номер первой вакансии)
+        batch_size: int (количество вакансий в одном вызове save_to_database)
+        progress: callable (функция, получающая количество обработанных вакансий)
+
+    Returns:
+        int: количество сохраненных или обновленных вакансий
+    """
+    parser = HHApiParser()
+    saved = 0
+    processed = 0
+    for batch in chunked(synthetic_items(count, seed, start), batch_size):
+        saved += parser.save_to_database(batch)
+        processed += len(batch)
+        if progress:
+            progress(processed)
+    return saved
@@ -0,0 +1,322 @@
+"""
+Модуль dedup.py содержит поиск почти дубликатов вакансий (MinHash + LSH).
+
+Для каждой вакансии по основам слов названия, компании и описания строится
+сигнатура MinHash; полосы сигнатуры хэшируются в корзины LSH. Кандидаты
+в дубликаты — вакансии с общей корзиной, их сходство проверяется по
+сигнатурам, поэтому попарное сравнение всех вакансий не требуется.
+
+Вакансии-дубликаты получают общий Vacancy.cluster_id — идентификатор самой
+ранней вакансии кластера. Кластеры только объединяются; после изменения
+текстов вакансий их можно пересчитать командой rebuild_duplicate_clusters.
+
+Основной функционал:
+- minhash_signature / lsh_buckets: сигнатура и корзины вакансии
+- assign_clusters: инкрементальное обновление кластеров для сохраненных вакансий
+- collapse_duplicates: queryset без повторов (по одной вакансии на кластер)
+- rebuild_clusters: полный пересчет кластеров
+"""
+
+import hashlib
+import threading
+import zlib
+import numpy as np
+from django.db import transaction
+from django.db.models import F, Q
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
+from hhparser.models import Vacancy, VacancyFingerprint, VacancyLshBand
+from hhparser.services.stemmer import stem, tokenize
+from hhparser.services.descriptions import load_descriptions
+from hhparser.services.signals import derived_indexes_enabled
+
+# Константы
+NUM_PERMUTATIONS = 128
+LSH_BANDS = 16  # 16 полос по 8 строк: порог срабатывания LSH около 0.7
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+SIMILARITY_THRESHOLD = 0.8
+SHINGLE_SIZE = 3
+MERSENNE_PRIME = (1 << 31) - 1
+HASH_SEED = 20240601
+BATCH_SIZE = 500
+
+_random = np.random.default_rng(HASH_SEED)
+_PERM_A = _random.integers(1, MERSENNE_PRIME, NUM_PERMUTATIONS, dtype=np.uint64)
+_PERM_B = _random.integers(0, MERSENNE_PRIME, NUM_PERMUTATIONS, dtype=np.uint64)
+
+# Объединение кластеров читает и обновляет несколько строк, поэтому выполняется последовательно
+_cluster_lock = threading.Lock()
+
+
+def shingles(text: str) -> set:
+    """
+    Множество шинглов (последовательностей основ слов) текста.
+
+    Args:
+        text: str (исходный текст)
+
+    Returns:
+        set: хэши шинглов; для коротких текстов — хэши отдельных слов
+    """
+    words = [stem(token) for token in tokenize(text)]
+    if len(words) < SHINGLE_SIZE:
+        grams = words
+    else:
+        grams = [' '.join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+    return {zlib.crc32(gram.encode('utf-8')) for gram in grams}
+
+
+def minhash_signature(title: str, company: str, description: str) -> np.ndarray:
+    """
+    Сигнатура MinHash вакансии.
+
+    Args:
+        title: str (название)
+        company: str (компания)
+        description: str (описание)
+
+    Returns:
+        np.ndarray: NUM_PERMUTATIONS значений uint32 или None для пустого текста
+    """
+    hashes = shingles(' '.join([title or '', company or '', description or '']))
+    if not hashes:
+        return None
+    values = np.fromiter(hashes, dtype=np.uint64, count=len(hashes)) % MERSENNE_PRIME
+    permuted = (np.outer(values, _PERM_A) + _PERM_B) % MERSENNE_PRIME
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+def lsh_buckets(signature: np.ndarray) -> list:
+    """
+    Корзины LSH сигнатуры: хэш каждой полосы вместе с ее номером.
+
+    Args:
+        signature: np.ndarray (сигнатура MinHash)
+
+    Returns:
+        list: LSH_BANDS целых чисел со знаком (64 бита)
+    """
+    buckets = []
+    for band, rows in enumerate(signature.reshape(LSH_BANDS, LSH_ROWS)):
+        digest = hashlib.blake2b(bytes([band]) + rows.tobytes(), digest_size=8).digest()
+        buckets.append(int.from_bytes(digest, 'big', signed=True))
+    return buckets
+
+
+def similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """
+    Оценка коэффициента Жаккара по двум сигнатурам.
+
+    Args:
+        first: np.ndarray (сигнатура MinHash)
+        second: np.ndarray (сигнатура MinHash)
+
+    Returns:
+        float: доля совпадающих значений сигнатур
+    """
+    return float(np.count_nonzero(first == second)) / NUM_PERMUTATIONS
+
+
+def _load_signature(data) -> np.ndarray:
+    """Восстанавливает сигнатуру из BinaryField."""
+    return np.frombuffer(bytes(data), dtype='<u4')
+
+
+def assign_clusters(vacancy_ids=None, links=None) -> int:
+    """
+    Обновление сигнатур, корзин LSH и кластеров дубликатов для сохраненных вакансий.
+
+    Args:
+        vacancy_ids: iterable (идентификаторы вакансий)
+        links: iterable (ссылки вакансий, если идентификаторы неизвестны)
+
+    Returns:
+        int: количество вакансий, у которых найдены дубликаты
+    """
+    queryset = Vacancy.objects.all()
+    if vacancy_ids is not None:
+        queryset = queryset.filter(id__in=list(vacancy_ids))
+    elif links is not None:
+        queryset = queryset.filter(link__in=list(links))
+
+    ids = list(queryset.values_list('id', flat=True))
+    duplicates = 0
+    for start in range(0, len(ids), BATCH_SIZE):
+        duplicates += _assign_batch(ids[start:start + BATCH_SIZE])
+    return duplicates
+
+
+def _assign_batch(ids: list) -> int:
+    """
+    Обработка пакета вакансий: сигнатуры, поиск кандидатов и объединение кластеров.
+
+    Args:
+        ids: list (идентификаторы вакансий)
+
+    Returns:
+        int: количество вакансий пакета, у которых найдены дубликаты
+    """
+    signatures = {}
+    full_texts = load_descriptions(ids)
+    for vacancy_id, title, company, description in (
+            Vacancy.objects.filter(id__in=ids).values_list('id', 'title', 'company', 'description')):
+        signature = minhash_signature(title, company, full_texts.get(vacancy_id, description))
+        if signature is not None:
+            signatures[vacancy_id] = signature
+    buckets = {vacancy_id: lsh_buckets(signature) for vacancy_id, signature in signatures.items()}
+
+    with _cluster_lock, transaction.atomic():
+        VacancyLshBand.objects.filter(vacancy_id__in=ids).delete()
+        VacancyFingerprint.objects.filter(vacancy_id__in=ids).delete()
+        VacancyFingerprint.objects.bulk_create([
+            VacancyFingerprint(vacancy_id=vacancy_id, signature=signature.astype('<u4').tobytes())
+            for vacancy_id, signature in signatures.items()
+        ], batch_size=BATCH_SIZE)
+        VacancyLshBand.objects.bulk_create([
+            VacancyLshBand(vacancy_id=vacancy_id, bucket=bucket)
+            for vacancy_id, vacancy_buckets in buckets.items() for bucket in vacancy_buckets
+        ], batch_size=BATCH_SIZE)
+
+        edges = _find_duplicate_edges(signatures, buckets)
+        _merge_clusters(ids, edges)
+
+    return len({vacancy_id for edge in edges for vacancy_id in edge if vacancy_id in signatures})
+
+
+def _find_duplicate_edges(signatures: dict, buckets: dict) -> list:
+    """
+    Пары вакансий с общей корзиной LSH и сходством не ниже порога.
+
+    Args:
+        signatures: dict (идентификатор вакансии → сигнатура)
+        buckets: dict (идентификатор вакансии → корзины LSH)
+
+    Returns:
+        list: пары (идентификатор вакансии пакета, идентификатор дубликата)
+    """
+    all_buckets = list({bucket for vacancy_buckets in buckets.values() for bucket in vacancy_buckets})
+    members = {}
+    for start in range(0, len(all_buckets), BATCH_SIZE):
+        for bucket, vacancy_id in VacancyLshBand.objects.filter(
+                bucket__in=all_buckets[start:start + BATCH_SIZE]).values_list('bucket', 'vacancy_id'):
+            members.setdefault(bucket, set()).add(vacancy_id)
+
+    candidates = {
+        vacancy_id: set().union(*(members.get(bucket, ()) for bucket in vacancy_buckets)) - {vacancy_id}
+        for vacancy_id, vacancy_buckets in buckets.items()
+    }
+
+    known = dict(signatures)
+    missing = list({other for others in candidates.values() for other in others} - set(known))
+    for start in range(0, len(missing), BATCH_SIZE):
+        for vacancy_id, data in VacancyFingerprint.objects.filter(
+                vacancy_id__in=missing[start:start + BATCH_SIZE]).values_list('vacancy_id', 'signature'):
+            known[vacancy_id] = _load_signature(data)
+
+    edges = []
+    for vacancy_id, others in candidates.items():
+        for other in others:
+            if other in known and similarity(signatures[vacancy_id], known[other]) >= SIMILARITY_THRESHOLD:
+                edges.append((vacancy_id, other))
+    return edges
+
+
+def _merge_clusters(ids: list, edges: list) -> None:
+    """
+    Объединение кластеров по найденным парам дубликатов (система непересекающихся множеств).
+
+    Args:
+        ids: list (идентификаторы вакансий пакета)
+        edges: list (пары дубликатов)
+    """
+    parent = {}
+
+    def find(node: int) -> int:
+        parent.setdefault(node, node)
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for first, second in edges:
+        parent[find(first)] = find(second)
+
+    involved = set(ids) | {vacancy_id for edge in edges for vacancy_id in edge}
+    clusters = dict(Vacancy.objects.filter(id__in=list(involved)).values_list('id', 'cluster_id'))
+
+    components = {}
+    for vacancy_id in clusters:
+        components.setdefault(find(vacancy_id), []).append(vacancy_id)
+
+    unassigned = []
+    for component in components.values():
+        if len(component) == 1:
+            if clusters[component[0]] is None:
+                unassigned.append(component[0])
+            continue
+        old_clusters = {clusters[vacancy_id] for vacancy_id in component if clusters[vacancy_id] is not None}
+        target = min(old_clusters | set(component))
+        Vacancy.objects.filter(Q(id__in=component) | Q(cluster_id__in=old_clusters)) \
+            .exclude(cluster_id=target).update(cluster_id=target)
+
+    if unassigned:
+        Vacancy.objects.filter(id__in=unassigned).update(cluster_id=F('id'))
+
+
+def collapse_duplicates(queryset):
+    """
+    Оставляет по одной вакансии на кластер дубликатов (самую раннюю).
+
+    Args:
+        queryset: QuerySet (вакансии)
+
+    Returns:
+        QuerySet: вакансии без повторов
+    """
+    return queryset.filter(Q(cluster_id__isnull=True) | Q(cluster_id=F('id')))
+
+
+def rebuild_clusters(batch_size: int = BATCH_SIZE) -> int:
+    """
+    Полный пересчет сигнатур и кластеров дубликатов.
+
+    Args:
+        batch_size: int (количество вакансий в одной транзакции)
+
+    Returns:
+        int: количество обработанных вакансий
+    """
+    with _cluster_lock, transaction.atomic():
+        VacancyLshBand.objects.all().delete()
+        VacancyFingerprint.objects.all().delete()
+        Vacancy.objects.update(cluster_id=None)
+
+    processed = 0
+    last_id = 0
+    while True:
+        ids = list(Vacancy.objects.filter(id__gt=last_id).order_by('id')
+                   .values_list('id', flat=True)[:batch_size])
+        if not ids:
+            break
+        _assign_batch(ids)
+        processed += len(ids)
+        last_id = ids[-1]
+    return processed
+
+
+@receiver(post_save, sender=Vacancy)
+def _assign_saved_vacancy(sender, instance, **kwargs) -> None:
+    """Обновляет кластер после сохранения вакансии через ORM."""
+    if derived_indexes_enabled():
+        _assign_batch([instance.pk])
+
+
+@receiver(pre_delete, sender=Vacancy)
+def _reassign_deleted_representative(sender, instance, **kwargs) -> None:
+    """Передает кластер следующей по возрасту вакансии, если удаляется самая ранняя."""
+    if instance.cluster_id != instance.pk:
+        return
+    remaining = Vacancy.objects.filter(cluster_id=instance.pk).exclude(pk=instance.pk)
+    next_id = remaining.order_by('id').values_list('id', flat=True).first()
+    if next_id is not None:
+        remaining.update(cluster_id=next_id)
@@ -0,0 +1,104 @@
+"""
+Модуль descriptions.py содержит хранение полных описаний вакансий.
+
+В строке Vacancy остается только краткое описание для списков
+(description_preview), а полный текст и очищенная HTML-разметка
+сжимаются zlib и хранятся в VacancyDescription. Полный текст читают
+поисковый индекс, поиск дубликатов и карточка вакансии; для записей без
+VacancyDescription (сохраненных до ее появления) используется краткое
+описание из строки вакансии.
+
+Основной функционал:
+- description_preview: краткое описание для строки Vacancy
+- store_descriptions: пакетная запись полных описаний
+- load_descriptions: полные тексты пакета вакансий
+- get_description: текст и HTML одной вакансии
+"""
+
+import zlib
+from hhparser.models import Vacancy, VacancyDescription
+
+# Константы
+PREVIEW_LENGTH = 400
+COMPRESSION_LEVEL = 6
+STORE_BATCH_SIZE = 500
+
+
+def compress_text(text: str) -> bytes:
+    """Сжатие текста в UTF-8."""
+    return zlib.compress((text or '').encode('utf-8'), COMPRESSION_LEVEL)
+
+
+def decompress_text(data) -> str:
+    """Распаковка текста, сжатого compress_text."""
+    return zlib.decompress(bytes(data)).decode('utf-8') if data else ''
+
+
+def description_preview(text: str) -> str:
+    """
+    Краткое описание: начало текста не длиннее PREVIEW_LENGTH по границе слова.
+
+    Args:
+        text: str (полный текст описания)
+
+    Returns:
+        str: краткое описание
+    """
+    text = (text or '').strip()
+    if len(text) <= PREVIEW_LENGTH:
+        return text
+    cut = text[:PREVIEW_LENGTH]
+    space = cut.rfind(' ')
+    return (cut[:space] if space > PREVIEW_LENGTH // 2 else cut).rstrip() + '…'
+
+
+def store_descriptions(descriptions: dict) -> int:
+    """
+    Пакетная запись полных описаний вакансий (вставка или замена).
+
+    Args:
+        descriptions: dict (идентификатор вакансии → (текст, HTML))
+
+    Returns:
+        int: количество записанных описаний
+    """
+    objects = [VacancyDescription(vacancy_id=vacancy_id, text=compress_text(text), html=compress_text(html))
+               for vacancy_id, (text, html) in descriptions.items()]
+    VacancyDescription.objects.bulk_create(
+        objects,
+        batch_size=STORE_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=['vacancy'],
+        update_fields=['text', 'html'],
+    )
+    return len(objects)
+
+
+def load_descriptions(vacancy_ids) -> dict:
+    """
+    Полные тексты описаний пакета вакансий.
+
+    Args:
+        vacancy_ids: iterable (идентификаторы вакансий)
+
+    Returns:
+        dict: идентификатор вакансии → текст (только для вакансий с VacancyDescription)
+    """
+    return {vacancy_id: decompress_text(text) for vacancy_id, text in
+            VacancyDescription.objects.filter(vacancy_id__in=list(vacancy_ids)).values_list('vacancy_id', 'text')}
+
+
+def get_description(vacancy: Vacancy) -> dict:
+    """
+    Полное описание одной вакансии.
+
+    Args:
+        vacancy: Vacancy (вакансия)
+
+    Returns:
+        dict: text и html; без VacancyDescription — краткое описание и пустой HTML
+    """
+    row = VacancyDescription.objects.filter(vacancy_id=vacancy.pk).values_list('text', 'html').first()
+    if row is None:
+        return {'text': vacancy.description, 'html': ''}
+    return {'text': decompress_text(row[0]), 'html': decompress_text(row[1])}
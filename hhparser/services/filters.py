@@ -1,134 +1,271 @@
 """
-Модуль filters.py содержит классы для фильтрации вакансий.
+Модуль filters.py содержит единый движок фильтрации вакансий.
+
+Спецификация фильтров (словарь keywords, min_salary, experience, employment,
+min_experience_years) компилируется один раз в CompiledFilter, который
+одновременно является предикатом для записей в памяти и содержит
+эквивалентное условие Q для фильтрации в базе данных.
 
 Основные классы:
-- UniversalVacancyFilter: универсальный фильтр для вакансий
+- CompiledFilter: скомпилированный фильтр (предикат и условие Q)
+- VacancyRecord: компактная запись вакансии с __slots__ для фильтрации в памяти
+- UniversalVacancyFilter: фильтрация списков вакансий через CompiledFilter
 - StyleFilterManager: менеджер конфигураций фильтров
 """
 
-import re
+from django.db.models import Q
+from hhparser.services.boolean_query import BooleanQuery
+from hhparser.services.search import term_q, TermMatcher
 
-class UniversalVacancyFilter:
+# Константы
+KEYWORD_FIELDS = ('title', 'company', 'skills', 'description')
+EXPERIENCE_YEARS = {
+    'no': 0,
+    '1-3': 2,
+    '3-6': 4,
+    '6+': 7,
+}
+EMPTY_CHOICES = ('', 'any')
+
+
+class VacancyRecord:
     """
-    Универсальный фильтр для вакансий.
+    Компактная запись вакансии для фильтрации в памяти.
 
-    Обеспечивает фильтрацию вакансий по ключевым словам, зарплате, опыту работы
-    и типу занятости.
+    Использует __slots__, поэтому дешевле словаря и модели Django
+    при обработке больших пакетов.
     """
 
-    @staticmethod
-    def filter_vacancies(vacancies: list, filters: dict) -> list:
-        """
-        Фильтрация списка вакансий по заданным параметрам.
+    __slots__ = ('title', 'company', 'salary', 'salary_from', 'salary_to', 'description',
+                 'experience', 'employment', 'skills', 'link')
 
-        Применяет заданные фильтры к списку вакансий. Поддерживает все основные типы фильтров.
+    def __init__(self, **fields):
+        """Заполняет поля записи; отсутствующие поля равны None."""
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'VacancyRecord':
+        """
+        Создание записи из словаря данных вакансии.
 
         Args:
-            vacancies: list (список объектов вакансий для фильтрации)
-            filters: dict (словарь с параметрами фильтрации)
+            data: dict (данные вакансии после парсинга)
 
         Returns:
-            list: отфильтрованный список вакансий
+            VacancyRecord: запись вакансии
         """
-        filtered = []
+        return cls(**data)
+
 
-        for vacancy in vacancies:
-            if UniversalVacancyFilter._matches_filters(vacancy, filters):
-                filtered.append(vacancy)
+class CompiledFilter:
+    """
+    Скомпилированный фильтр вакансий.
+
+    Вызов экземпляра проверяет запись (словарь или объект с атрибутами),
+    атрибут q содержит то же условие для QuerySet. Ключевые слова — булев
+    запрос (boolean_query.py); термины ищутся так же, как в полнотекстовом
+    поиске (search.term_q): по основам слов с учетом префиксов, в базе — через
+    индекс FTS5 с полным описанием, в памяти — по тем же токенам полей записи.
+    Вакансии без числовых границ зарплаты не проходят фильтр min_salary ни в
+    памяти, ни в базе.
+    """
 
-        return filtered
+    __slots__ = ('spec', 'q', '_checks')
 
-    @staticmethod
-    def _matches_filters(vacancy: object, filters: dict) -> bool:
+    def __init__(self, filters: dict):
         """
-        Проверяет соответствие вакансии заданным фильтрам.
-
-        Выполняет комплексную проверку вакансии по всем критериям фильтрации.
+        Компиляция спецификации фильтров.
 
         Args:
-            vacancy: object (объект вакансии для проверки)
-            filters: dict (словарь с параметрами фильтрации)
+            filters: dict (параметры фильтрации; пустые и некорректные значения игнорируются)
+        """
+        self.spec = {}
+        self.q = Q()
+        self._checks = []
 
-        Returns:
-            bool: True если вакансия соответствует всем фильтрам, иначе False
+        keywords = str(filters.get('keywords') or '').strip()
+        if keywords:
+            self._add_keywords(keywords)
+
+        min_salary = _to_int(filters.get('min_salary'))
+        if min_salary is not None:
+            self._add_min_salary(min_salary)
+
+        for field in ('experience', 'employment'):
+            value = filters.get(field) or ''
+            if value not in EMPTY_CHOICES:
+                self._add_choice(field, value)
+
+        min_years = _to_int(filters.get('min_experience_years'))
+        if min_years is not None:
+            self._add_min_experience(min_years)
+
+    @property
+    def is_empty(self) -> bool:
+        """True, если фильтр пропускает все вакансии."""
+        return not self._checks
+
+    def __call__(self, record) -> bool:
         """
-        # Фильтр по ключевым словам
-        if filters.get('keywords'):
-            keywords = filters['keywords'].lower()
-            if not UniversalVacancyFilter._matches_keywords(vacancy, keywords):
-                return False
+        Проверка записи вакансии.
 
-        # Фильтр по минимальной зарплате
-        if filters.get('min_salary'):
-            min_salary = int(filters['min_salary'])
-            if not UniversalVacancyFilter._matches_salary(vacancy, min_salary):
-                return False
+        Args:
+            record: dict или объект с атрибутами (VacancyRecord, Vacancy)
 
-        # Фильтр по опыту работы
-        if filters.get('experience') and filters['experience'] != 'any':
-            if vacancy.experience != filters['experience']:
+        Returns:
+            bool: True, если запись проходит все условия
+        """
+        if isinstance(record, dict):
+            get = record.get
+        else:
+            def get(name, default=None):
+                return getattr(record, name, default)
+
+        for check in self._checks:
+            if not check(get):
                 return False
+        return True
 
-        # Фильтр по типу занятости
-        if filters.get('employment') and filters['employment'] != 'any':
-            if vacancy.employment != filters['employment']:
-                return False
+    def filter(self, records) -> list:
+        """
+        Фильтрация последовательности записей в памяти.
 
-        return True
+        Args:
+            records: iterable (словари или объекты вакансий)
 
-    @staticmethod
-    def _matches_keywords(vacancy: object, keywords: str) -> bool:
+        Returns:
+            list: записи, прошедшие фильтр
         """
-        Проверяет наличие ключевых слов в данных вакансии.
+        return [record for record in records if self(record)]
 
-        Осуществляет поиск ключевых слов в различных полях вакансии.
+    def apply(self, queryset):
+        """
+        Фильтрация QuerySet в базе данных.
 
         Args:
-            vacancy: object (объект вакансии для поиска)
-            keywords: str (ключевые слова для поиска в нижнем регистре)
+            queryset: QuerySet (вакансии)
 
         Returns:
-            bool: True если ключевые слова найдены, иначе False
+            QuerySet: отфильтрованные вакансии
         """
-        search_fields = [
-            vacancy.title.lower(),
-            vacancy.company.lower(),
-            vacancy.description.lower(),
-            vacancy.salary.lower()
-        ]
-
-        # Проверяем наличие ключевых слов в любом из полей
-        for field in search_fields:
-            if keywords in field:
-                return True
-        return False
+        return queryset.filter(self.q) if self._checks else queryset
+
+    def _add_keywords(self, keywords: str) -> None:
+        """Булев запрос по KEYWORD_FIELDS: все термины ищутся одним проходом по полю, пока не найдены все."""
+        query = BooleanQuery(keywords)
+        if query.is_empty:
+            return
+        matcher = TermMatcher(query.terms)
+        total = len(query.terms)
+
+        def check(get) -> bool:
+            found = set()
+            for field in KEYWORD_FIELDS:
+                matcher.find(get(field), found)
+                if len(found) == total:
+                    break
+            return query.evaluate(found)
+
+        self._register('keywords', keywords, check, query.to_q(keyword_term_q))
+
+    def _add_min_salary(self, min_salary: int) -> None:
+        """Верхняя граница вилки (или нижняя при отсутствии верхней) не ниже заданной."""
+        def check(get) -> bool:
+            value = get('salary_to')
+            if value is None:
+                value = get('salary_from')
+            return value is not None and value >= min_salary
+
+        q = Q(salary_to__gte=min_salary) | Q(salary_to__isnull=True, salary_from__gte=min_salary)
+        self._register('min_salary', min_salary, check, q)
+
+    def _add_choice(self, field: str, value: str) -> None:
+        """Точное совпадение кода опыта или типа занятости."""
+        def check(get) -> bool:
+            return get(field) == value
+
+        self._register(field, value, check, Q(**{field: value}))
+
+    def _add_min_experience(self, min_years: int) -> None:
+        """Опыт не меньше заданного количества лет (по EXPERIENCE_YEARS)."""
+        codes = frozenset(code for code, years in EXPERIENCE_YEARS.items() if years >= min_years)
+
+        def check(get) -> bool:
+            return get('experience') in codes
+
+        self._register('min_experience_years', min_years, check, Q(experience__in=sorted(codes)))
+
+    def _register(self, name: str, value, check, q: Q) -> None:
+        """Добавляет условие в предикат и в Q."""
+        self.spec[name] = value
+        self._checks.append(check)
+        self.q &= q
+
+
+def compile_filters(filters: dict) -> CompiledFilter:
+    """
+    Компиляция спецификации фильтров.
+
+    Args:
+        filters: dict (параметры фильтрации)
+
+    Returns:
+        CompiledFilter: предикат и условие Q
+    """
+    return CompiledFilter(filters or {})
+
+
+def keyword_term_q(term: str) -> Q:
+    """
+    Условие Q для одного термина через полнотекстовый индекс (search.term_q).
+
+    Индекс содержит полное описание из VacancyDescription, а не краткое
+    описание строки Vacancy, и не зависит от LIKE, который в SQLite не
+    учитывает регистр только для латиницы.
+
+    Args:
+        term: str (термин или фраза)
+
+    Returns:
+        Q: условие для QuerySet
+    """
+    return term_q(term)
+
+
+def _to_int(value) -> int:
+    """Целое число из параметра фильтра или None для пустого и некорректного значения."""
+    if value in (None, ''):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class UniversalVacancyFilter:
+    """
+    Универсальный фильтр для вакансий.
+
+    Обеспечивает фильтрацию вакансий по ключевым словам, зарплате, опыту работы
+    и типу занятости.
+    """
 
     @staticmethod
-    def _matches_salary(vacancy: object, min_salary: int) -> bool:
+    def filter_vacancies(vacancies: list, filters: dict) -> list:
         """
-        Проверяет соответствие зарплаты вакансии минимальному требованию.
+        Фильтрация списка вакансий по заданным параметрам.
 
-        Анализирует данные о зарплате вакансии, извлекая числовые значения
-        из текстового представления.
+        Фильтры компилируются один раз и применяются ко всем вакансиям.
 
         Args:
-            vacancy: object (объект вакансии для проверки)
-            min_salary: int (минимальная требуемая зарплата)
+            vacancies: list (список объектов или словарей вакансий для фильтрации)
+            filters: dict (словарь с параметрами фильтрации)
 
         Returns:
-            bool: True если зарплата соответствует требованию или не указана, иначе False
+            list: отфильтрованный список вакансий
         """
-        salary_text = vacancy.salary
-        # Регулярное выражение для извлечения чисел из текста зарплаты
-        # Ищет последовательности цифр, игнорируя пробелы и запятые
-        numbers = re.findall(r'\d+', salary_text)
-        if numbers:
-            # Берем максимальное число из найденных (для диапазонов "100-200")
-            salary_value = max(map(int, numbers))
-            return salary_value >= min_salary
-
-        # Если зарплата не указана или не распознана, пропускаем фильтр
-        return True
+        return compile_filters(filters).filter(vacancies)
 
 
 class StyleFilterManager:
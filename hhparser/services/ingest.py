@@ -0,0 +1,291 @@
+"""
+Модуль ingest.py содержит загрузку дампов вакансий HH.ru без обращения к API.
+
+Поддерживаются файлы JSON Lines (.jsonl, .ndjson; по одной вакансии в
+строке), массивы JSON, ответы поиска ({"items": [...]}) и их сжатые gzip
+варианты (.gz). Файлы читаются потоково: строки JSON Lines передаются
+рабочим процессам без разбора, массивы разбираются по одному элементу.
+Вакансии нормализуются hh_client.normalize_vacancy так же, как при обходе
+API, но без запроса детальной информации: описание и навыки берутся из
+самого элемента, если они в нем есть. Сохранение выполняется пакетами в
+основном процессе через HHApiParser.save_to_database. Индекс навыков
+синхронизируется при записи каждого пакета по полным спискам key_skills
+дампа, а поисковый индекс и кластеры дубликатов обновляются один раз после
+загрузки и только для записанных вакансий.
+
+Основной функционал:
+- iter_dump_chunks: потоковое чтение дампа пакетами
+- normalize_chunk: разбор и нормализация пакета (выполняется в рабочих процессах)
+- ingest_dumps: загрузка дампов в таблицу Vacancy
+- update_derived_indexes: обновление индексов для записанных вакансий
+- rebuild_derived_indexes: полное перестроение индексов по всей таблице
+"""
+
+import gzip
+import json
+import logging
+import multiprocessing
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import django
+from django.db import connections
+from hhparser.services.dedup import assign_clusters, rebuild_clusters
+from hhparser.services.search import index_vacancies, rebuild_index
+from hhparser.services.skills import sync_vacancy_skills
+from DjangoProject_HH_parser.Services.hh_client import normalize_vacancy
+from DjangoProject_HH_parser.Services.hh_parser import HHApiParser
+
+# Константы
+DEFAULT_BATCH_SIZE = 2000
+SKILL_SYNC_SIZE = 20000  # вакансий в одной синхронизации индекса навыков
+READ_SIZE = 1024 * 1024
+MAX_VALUE_SIZE = 64 * 1024 * 1024  # символов; элемент дампа длиннее считается поврежденным
+TRUNCATION_MARGIN = 16  # ошибка разбора дальше от конца буфера вызвана не обрывом элемента
+JSON_LINES_SUFFIXES = ('.jsonl', '.ndjson')
+CHUNK_LINES = 'lines'
+CHUNK_ITEMS = 'items'
+_SEPARATORS = re.compile(r'[\s,]*')
+
+logger = logging.getLogger(__name__)
+
+
+def open_dump(path: str):
+    """
+    Открытие файла дампа в текстовом режиме (с распаковкой .gz).
+
+    Args:
+        path: str (путь к файлу)
+
+    Returns:
+        file: текстовый поток UTF-8
+    """
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, encoding='utf-8')
+
+
+def is_json_lines(path: str) -> bool:
+    """Формат JSON Lines определяется по расширению (без учета .gz)."""
+    name = path[:-3] if path.endswith('.gz') else path
+    return name.lower().endswith(JSON_LINES_SUFFIXES)
+
+
+def iter_json_values(file):
+    """
+    Потоковый разбор JSON: элементы массива, элементы items ответа поиска
+    или подряд записанные объекты.
+
+    Буфер дочитывается, только если ошибка разбора может быть вызвана
+    обрывом элемента на границе буфера; ошибка в середине буфера и элемент
+    длиннее MAX_VALUE_SIZE означают поврежденный дамп, и разбор
+    прекращается сразу, без чтения остатка файла.
+
+    Args:
+        file: file (текстовый поток)
+
+    Yields:
+        dict: очередная вакансия
+
+    Raises:
+        ValueError: поврежденный JSON (json.JSONDecodeError) или слишком длинный элемент
+    """
+    decoder = json.JSONDecoder()
+    buffer = file.read(READ_SIZE)
+    position = _SEPARATORS.match(buffer).end()
+    in_array = buffer[position:position + 1] == '['
+    if in_array:
+        position += 1
+    eof = not buffer
+
+    while True:
+        position = _SEPARATORS.match(buffer, position).end()
+        if in_array and buffer[position:position + 1] == ']':
+            return
+        if position >= len(buffer) and eof:
+            if in_array:
+                raise ValueError("Неожиданный конец массива JSON")
+            return
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as e:
+            # Незакрытая строка сообщается с позиции ее начала, остальные обрывы — у конца буфера
+            if e.pos < len(buffer) - TRUNCATION_MARGIN and not e.msg.startswith('Unterminated string'):
+                raise
+            if len(buffer) - position > MAX_VALUE_SIZE:
+                raise ValueError(f"Элемент JSON длиннее {MAX_VALUE_SIZE} символов, дамп поврежден") from e
+            # Элемент не поместился в буфер: дочитываем файл и разбираем его заново
+            chunk = file.read(READ_SIZE)
+            if not chunk:
+                if eof:
+                    raise
+                eof = True
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+
+        position = end
+        if isinstance(value, dict) and isinstance(value.get('items'), list):
+            yield from value['items']
+        elif isinstance(value, list):
+            yield from value
+        else:
+            yield value
+
+
+def iter_dump_chunks(path: str, batch_size: int = DEFAULT_BATCH_SIZE):
+    """
+    Потоковое чтение дампа пакетами для normalize_chunk.
+
+    Args:
+        path: str (путь к файлу)
+        batch_size: int (количество вакансий в пакете)
+
+    Yields:
+        tuple: (CHUNK_LINES и список строк JSON) или (CHUNK_ITEMS и список словарей)
+    """
+    with open_dump(path) as file:
+        if is_json_lines(path):
+            kind, values = CHUNK_LINES, (line for line in file if line.strip())
+        else:
+            kind, values = CHUNK_ITEMS, iter_json_values(file)
+
+        batch = []
+        for value in values:
+            batch.append(value)
+            if len(batch) >= batch_size:
+                yield kind, batch
+                batch = []
+        if batch:
+            yield kind, batch
+
+
+def normalize_chunk(kind: str, values: list) -> tuple:
+    """
+    Разбор и нормализация пакета вакансий.
+
+    Args:
+        kind: str (CHUNK_LINES — строки JSON, CHUNK_ITEMS — разобранные словари)
+        values: list (вакансии пакета)
+
+    Returns:
+        tuple: (список данных вакансий, количество пропущенных элементов)
+    """
+    vacancies = []
+    skipped = 0
+    for value in values:
+        try:
+            item = json.loads(value) if kind == CHUNK_LINES else value
+            vacancy = normalize_vacancy(item, item)
+        except Exception as e:
+            logger.debug("Пропуск элемента дампа: %s", e)
+            vacancy = None
+        if vacancy:
+            vacancies.append(vacancy)
+        else:
+            skipped += 1
+    return vacancies, skipped
+
+
+def ingest_dumps(paths: list, workers: int = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                 progress=None) -> dict:
+    """
+    Загрузка дампов вакансий в таблицу Vacancy.
+
+    Файлы читаются основным процессом, пакеты нормализуются в рабочих
+    процессах; одновременно в работе не больше двух пакетов на процесс,
+    поэтому память не зависит от размера дампа. Пакеты сохраняются в
+    порядке чтения; поисковый индекс и кластеры дубликатов не обновляются,
+    идентификаторы записанных вакансий возвращаются для update_derived_indexes.
+    Индекс навыков синхронизируется не после каждого пакета записи, а по
+    накоплении SKILL_SYNC_SIZE вакансий и в конце загрузки.
+
+    Args:
+        paths: list (пути к файлам дампов)
+        workers: int (количество рабочих процессов; по умолчанию по числу процессоров)
+        batch_size: int (количество вакансий в пакете)
+        progress: callable (функция, получающая словарь промежуточного результата)
+
+    Returns:
+        dict: количество прочитанных, сохраненных и пропущенных вакансий и
+            written_ids (идентификаторы новых и изменившихся вакансий)
+    """
+    parser = HHApiParser()
+    written_ids = set()
+    pending_skills = {}
+    result = {'read': 0, 'saved': 0, 'skipped': 0}
+    chunks = (chunk for path in paths for chunk in iter_dump_chunks(path, batch_size))
+
+    def save(size: int, vacancies: list, skipped: int) -> None:
+        result['read'] += size
+        if vacancies:
+            result['saved'] += parser.save_to_database(vacancies, update_indexes=False, written_ids=written_ids,
+                                                       pending_skills=pending_skills)
+        if len(pending_skills) >= SKILL_SYNC_SIZE:
+            sync_vacancy_skills(pending_skills)
+            pending_skills.clear()
+        result['skipped'] += skipped
+        if progress:
+            progress(dict(result))
+
+    workers = max(1, workers or os.cpu_count() or 1)
+    if workers == 1:
+        for kind, values in chunks:
+            save(len(values), *normalize_chunk(kind, values))
+        sync_vacancy_skills(pending_skills)
+        return {**result, 'written_ids': written_ids}
+
+    # Как и в crawl_scheduler, рабочие процессы запускаются заново (spawn) с настройкой Django
+    connections.close_all()
+    context = multiprocessing.get_context('spawn')
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=django.setup) as executor:
+        for kind, values in chunks:
+            pending.append((len(values), executor.submit(normalize_chunk, kind, values)))
+            if len(pending) >= workers * 2:
+                size, future = pending.popleft()
+                save(size, *future.result())
+        while pending:
+            size, future = pending.popleft()
+            save(size, *future.result())
+    sync_vacancy_skills(pending_skills)
+    return {**result, 'written_ids': written_ids}
+
+
+def update_derived_indexes(vacancy_ids, batch_size: int = DEFAULT_BATCH_SIZE) -> dict:
+    """
+    Обновление поискового индекса и кластеров дубликатов для записанных вакансий.
+
+    Args:
+        vacancy_ids: iterable (идентификаторы вакансий, например written_ids из ingest_dumps)
+        batch_size: int (количество вакансий в одном запросе)
+
+    Returns:
+        dict: количество проиндексированных вакансий и вакансий с найденными дубликатами
+    """
+    ids = sorted(vacancy_ids)
+    result = {'search': 0, 'clusters': 0}
+    for start in range(0, len(ids), batch_size):
+        batch = ids[start:start + batch_size]
+        result['search'] += index_vacancies(vacancy_ids=batch)
+        result['clusters'] += assign_clusters(vacancy_ids=batch)
+    return result
+
+
+def rebuild_derived_indexes() -> dict:
+    """
+    Полное перестроение поискового индекса и кластеров дубликатов по всей таблице.
+
+    Индекс навыков не перестраивается: он синхронизируется при записи по
+    полным спискам навыков, а rebuild_skill_index восстановил бы его из
+    обрезанного текстового поля Vacancy.skills.
+
+    Returns:
+        dict: количество обработанных вакансий по индексам
+    """
+    return {
+        'search': rebuild_index(),
+        'clusters': rebuild_clusters(),
+    }
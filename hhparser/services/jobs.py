@@ -0,0 +1,279 @@
+"""
+Модуль jobs.py содержит очередь фоновых задач парсинга.
+
+Веб-приложение только создает задачу ParseJob в статусе pending, а
+выполняет ее отдельный процесс-обработчик (команда parse_worker). Задачи
+захватываются из базы условным UPDATE, как сохраненные поиски в
+scheduler.py: одну задачу получает только один обработчик, а общее число
+выполняемых задач во всех обработчиках не превышает MAX_CONCURRENT_JOBS.
+Обработчик периодически обновляет updated_at своих задач; задачи в статусе
+running без такой отметки дольше STALE_AFTER (обработчик остановлен или
+перезапущен) помечаются как завершенные с ошибкой. Задачи, которые ни один
+обработчик не взял за CLAIM_DEADLINE (parse_worker не запущен), тоже
+завершаются с ошибкой, чтобы клиент не опрашивал их бесконечно.
+
+Основной функционал:
+- claim_job: захват следующей задачи в очереди с учетом общего лимита
+- fail_stale_jobs: завершение задач остановленных обработчиков
+- expire_pending_jobs: завершение задач, не взятых обработчиком
+- run_parse_job: выполнение конвейера парсинга для задачи
+- run_worker: цикл обработчика задач
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Count, Subquery
+from django.db.models.functions import Coalesce
+from django.urls import reverse
+from django.utils import timezone
+from hhparser.models import ParseJob, QueueLock
+from hhparser.services.crawl_state import CrawlWatermark
+from hhparser.services.filters import compile_filters
+from hhparser.services.pipeline import run_pipeline
+from DjangoProject_HH_parser.Services.hh_parser import HHApiParser
+
+# Константы
+MAX_CONCURRENT_JOBS = 2
+POLL_INTERVAL = 2.0
+STALE_AFTER = timedelta(minutes=2)
+CLAIM_DEADLINE = timedelta(minutes=5)
+QUEUE_LOCK_NAME = 'parse_jobs'
+FILTER_URL_KEYS = ('keywords', 'min_salary', 'experience', 'employment', 'min_experience_years')
+DEFAULT_QUERY = 'Python'
+
+logger = logging.getLogger(__name__)
+
+
+def update_progress(job_id: int, **fields) -> None:
+    """
+    Обновляет счетчики прогресса задачи одним UPDATE-запросом.
+
+    Args:
+        job_id: int (идентификатор задачи)
+        **fields: значения полей pages_fetched, items_parsed, rows_saved
+    """
+    ParseJob.objects.filter(pk=job_id).update(updated_at=timezone.now(), **fields)
+
+
+def claim_job(max_concurrent: int = MAX_CONCURRENT_JOBS):
+    """
+    Захват самой старой задачи в очереди.
+
+    Статус меняется условным UPDATE: строка обновляется, только если задача
+    еще в очереди и выполняемых задач меньше max_concurrent. На СУБД с
+    SELECT ... FOR UPDATE (PostgreSQL и др.) захват выполняется в транзакции
+    под блокировкой строки QueueLock: при READ COMMITTED два обработчика,
+    захватывающие разные задачи, иначе могли бы оба увидеть счетчик ниже
+    лимита. SQLite выполняет записи последовательно, и проверка лимита в том
+    же UPDATE достаточна без блокировки.
+
+    Args:
+        max_concurrent: int (общий лимит выполняемых задач)
+
+    Returns:
+        ParseJob: захваченная задача или None, если очередь пуста или лимит исчерпан
+    """
+    if not connection.features.has_select_for_update:
+        return _claim_next(max_concurrent)
+    with transaction.atomic():
+        QueueLock.objects.select_for_update().get_or_create(name=QUEUE_LOCK_NAME)
+        return _claim_next(max_concurrent)
+
+
+def _claim_next(max_concurrent: int):
+    """Условный UPDATE самой старой задачи в очереди (см. claim_job)."""
+    job = ParseJob.objects.filter(status=ParseJob.STATUS_PENDING).order_by('created_at', 'pk').first()
+    if job is None:
+        return None
+
+    running = (ParseJob.objects.filter(status=ParseJob.STATUS_RUNNING).order_by()
+               .values('status').annotate(total=Count('pk')).values('total'))
+    claimed = (ParseJob.objects
+               .filter(pk=job.pk, status=ParseJob.STATUS_PENDING)
+               .alias(running=Coalesce(Subquery(running), 0))
+               .filter(running__lt=max_concurrent)
+               .update(status=ParseJob.STATUS_RUNNING, updated_at=timezone.now()))
+    if not claimed:
+        return None
+    job.status = ParseJob.STATUS_RUNNING
+    return job
+
+
+def fail_stale_jobs(now=None) -> int:
+    """
+    Завершение с ошибкой задач, обработчик которых перестал отмечаться.
+
+    Args:
+        now: datetime (текущее время)
+
+    Returns:
+        int: количество завершенных задач
+    """
+    now = now or timezone.now()
+    failed = ParseJob.objects.filter(
+        status=ParseJob.STATUS_RUNNING, updated_at__lt=now - STALE_AFTER
+    ).update(status=ParseJob.STATUS_FAILED, error='Обработчик задачи остановлен',
+             finished_at=now, updated_at=now)
+    if failed:
+        logger.warning("Задач остановленных обработчиков завершено с ошибкой: %s", failed)
+    return failed
+
+
+def expire_pending_jobs(now=None, job_id: int = None) -> int:
+    """
+    Завершение с ошибкой задач, которые не были взяты обработчиком за CLAIM_DEADLINE.
+
+    Вызывается обработчиком и при опросе состояния задачи: если ни один
+    parse_worker не запущен, клиент получает ошибку вместо бесконечного
+    ожидания. Условный UPDATE по статусу не затрагивает задачу, которую
+    обработчик успел захватить.
+
+    Args:
+        now: datetime (текущее время)
+        job_id: int (проверить только эту задачу)
+
+    Returns:
+        int: количество завершенных задач
+    """
+    now = now or timezone.now()
+    pending = ParseJob.objects.filter(status=ParseJob.STATUS_PENDING, created_at__lt=now - CLAIM_DEADLINE)
+    if job_id is not None:
+        pending = pending.filter(pk=job_id)
+    minutes = int(CLAIM_DEADLINE.total_seconds() // 60)
+    expired = pending.update(
+        status=ParseJob.STATUS_FAILED, finished_at=now, updated_at=now,
+        error=f'Задача не взята обработчиком за {minutes} мин.: запустите manage.py parse_worker',
+    )
+    if expired:
+        logger.warning("Задач, не взятых обработчиком, завершено с ошибкой: %s", expired)
+    return expired
+
+
+def run_parse_job(job: ParseJob, progress) -> dict:
+    """
+    Выполняет потоковый конвейер парсинга для задачи.
+
+    Вакансии фильтруются и сохраняются пакетами по мере загрузки страниц.
+
+    Args:
+        job: ParseJob (задача с параметрами запуска)
+        progress: callable (функция обновления счетчиков прогресса задачи)
+
+    Returns:
+        dict: итоговый результат для клиента
+    """
+    predicate = compile_filters(job.filters)
+    stats = run_pipeline(
+        HHApiParser(),
+        job.query,
+        job.vacancy_count,
+        predicate=None if predicate.is_empty else predicate,
+        progress=progress,
+        watermark=CrawlWatermark(job.query) if job.incremental else None,
+    )
+    logger.info("Получено вакансий от API: %s, после фильтров: %s", stats['parsed'], stats['found'])
+
+    # При инкрементальном обходе отсутствие новых вакансий не является ошибкой
+    if not stats['parsed'] and not job.incremental:
+        raise RuntimeError('Не удалось получить данные')
+
+    return {
+        'success': True,
+        'found': stats['found'],
+        'saved': stats['saved'],
+        'message': f"Найдено {stats['found']} вакансий, обработано {stats['saved']}",
+        'filter_url': build_filter_url(job.filters, job.query),
+        'has_filters': any(job.filters.values()) and stats['found'] > 0,
+    }
+
+
+def build_filter_url(filters: dict, search_query: str) -> str:
+    """
+    Адрес списка вакансий с фильтрами задачи.
+
+    Args:
+        filters: dict (фильтры задачи)
+        search_query: str (поисковый запрос)
+
+    Returns:
+        str: адрес страницы списка вакансий
+    """
+    filter_params = {key: filters[key] for key in FILTER_URL_KEYS if filters.get(key)}
+    if search_query and search_query != DEFAULT_QUERY:
+        filter_params['search'] = search_query
+
+    filter_url = reverse('vacancy_list')
+    if filter_params:
+        filter_url += '?' + '&'.join(f"{key}={value}" for key, value in filter_params.items())
+    return filter_url
+
+
+def execute_job(job_id: int, runner=run_parse_job) -> None:
+    """
+    Выполняет захваченную задачу и фиксирует итоговый статус.
+
+    Args:
+        job_id: int (идентификатор задачи в статусе running)
+        runner: callable (функция runner(job, progress) -> dict, выполняющая работу)
+    """
+    close_old_connections()
+    try:
+        job = ParseJob.objects.get(pk=job_id)
+
+        def progress(**fields) -> None:
+            update_progress(job_id, **fields)
+
+        result = runner(job, progress)
+        update_progress(job_id, status=ParseJob.STATUS_DONE, result=result,
+                        finished_at=timezone.now())
+    except Exception as e:
+        logger.exception("Ошибка выполнения задачи #%s: %s", job_id, e)
+        update_progress(job_id, status=ParseJob.STATUS_FAILED, error=str(e),
+                        finished_at=timezone.now())
+    finally:
+        close_old_connections()
+
+
+def run_worker(threads: int = MAX_CONCURRENT_JOBS, max_concurrent: int = MAX_CONCURRENT_JOBS,
+               poll_interval: float = POLL_INTERVAL, once: bool = False, runner=run_parse_job) -> int:
+    """
+    Цикл обработчика: захват задач, выполнение в пуле потоков и отметка активности.
+
+    Args:
+        threads: int (количество задач, выполняемых этим обработчиком одновременно)
+        max_concurrent: int (общий лимит выполняемых задач всех обработчиков)
+        poll_interval: float (пауза между проверками очереди, секунд)
+        once: bool (выполнить задачи, находящиеся в очереди, и завершиться)
+        runner: callable (функция runner(job, progress) -> dict)
+
+    Returns:
+        int: количество выполненных задач
+    """
+    active = {}
+    completed = 0
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix='parse-job') as executor:
+        while True:
+            for job_id, future in list(active.items()):
+                if future.done():
+                    del active[job_id]
+                    completed += 1
+            if active:
+                # Отметка активности: задачи этого обработчика не считаются зависшими
+                ParseJob.objects.filter(pk__in=list(active), status=ParseJob.STATUS_RUNNING) \
+                    .update(updated_at=timezone.now())
+            fail_stale_jobs()
+            expire_pending_jobs()
+
+            while len(active) < threads:
+                job = claim_job(max_concurrent)
+                if job is None:
+                    break
+                logger.info("Задача #%s захвачена", job.pk)
+                active[job.pk] = executor.submit(execute_job, job.pk, runner)
+
+            if once and not active:
+                return completed
+            time.sleep(poll_interval)
@@ -0,0 +1,143 @@
+"""
+Модуль pipeline.py содержит потоковый конвейер парсинга вакансий.
+
+Стадии конвейера связаны генераторами и передают данные по мере готовности:
+загрузка страницы → разбор вакансий → фильтрация → пакетное сохранение.
+Память не растет с объемом выдачи, а уже сохраненные пакеты
+не теряются при сбое в середине запуска. Пропускная способность и время
+стадий учитываются в метриках (DjangoProject_HH_parser/Services/metrics.py).
+"""
+
+import time
+from itertools import chain, islice
+from DjangoProject_HH_parser.Services import metrics
+from DjangoProject_HH_parser.Services.hh_client import MAX_VACANCY_COUNT
+from DjangoProject_HH_parser.Services.partitioning import iter_partitioned_pages
+
+# Константы
+DEFAULT_CHUNK_SIZE = 100
+
+
+def iter_items(pages):
+    """
+    Разворачивает поток страниц в поток отдельных вакансий.
+
+    Args:
+        pages: iterable (поток списков вакансий, например HHApiParser.iter_vacancy_pages)
+
+    Yields:
+        dict: данные одной вакансии
+    """
+    for page_vacancies in pages:
+        for vacancy in page_vacancies:
+            if vacancy is not None:
+                yield vacancy
+
+
+def filter_items(items, predicate=None):
+    """
+    Оставляет в потоке только вакансии, удовлетворяющие предикату.
+
+    Args:
+        items: iterable (поток вакансий)
+        predicate: callable (функция vacancy -> bool; None пропускает все вакансии)
+
+    Yields:
+        dict: данные вакансии, прошедшей фильтр
+    """
+    if predicate is None:
+        for vacancy in items:
+            metrics.STAGE_ITEMS.inc(stage='filter')
+            yield vacancy
+        return
+
+    # Учитывается только время предиката: генератор чередуется с другими стадиями
+    elapsed = 0.0
+    try:
+        for vacancy in items:
+            started = time.perf_counter()
+            passed = predicate(vacancy)
+            elapsed += time.perf_counter() - started
+            if passed:
+                metrics.STAGE_ITEMS.inc(stage='filter')
+                yield vacancy
+    finally:
+        metrics.STAGE_DURATION.observe(elapsed, stage='filter')
+
+
+def chunked(items, size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Группирует поток в пакеты фиксированного размера.
+
+    Args:
+        items: iterable (поток элементов)
+        size: int (размер пакета)
+
+    Yields:
+        list: очередной пакет, последний может быть короче
+    """
+    iterator = iter(items)
+    for first in iterator:
+        yield list(chain((first,), islice(iterator, size - 1)))
+
+
+def run_pipeline(parser, search_query: str, vacancy_count: int, predicate=None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, progress=None, watermark=None) -> dict:
+    """
+    Запускает конвейер от API HH.ru до базы данных.
+
+    Каждый пакет сохраняется отдельным вызовом save_to_database и
+    фиксируется в своей транзакции до загрузки следующих страниц.
+    Если запрошено больше MAX_VACANCY_COUNT вакансий, выдача обходится
+    по срезам (partitioning.iter_partitioned_pages).
+
+    При переданной отметке watermark запрашиваются только вакансии новее
+    прошлого запуска. Отметка продвигается один раз в конце и только если
+    обход дошел до прошлой отметки; после сбоя или остановки по лимиту
+    сохраняется курсор продолжения, и следующий запуск продолжит обход с
+    самой старой полученной вакансии, а не с начала выдачи.
+
+    Args:
+        parser: HHApiParser (парсер, предоставляющий iter_vacancy_pages и save_to_database)
+        search_query: str (поисковый запрос)
+        vacancy_count: int (количество вакансий для получения)
+        predicate: callable (пользовательский фильтр vacancy -> bool)
+        chunk_size: int (размер пакета сохранения)
+        progress: callable (функция обновления прогресса, принимает именованные счетчики)
+        watermark: CrawlWatermark (отметка инкрементального обхода или None)
+
+    Returns:
+        dict: итоговые счетчики parsed, found и saved
+    """
+    stats = {'parsed': 0, 'found': 0, 'saved': 0}
+
+    def count_parsed(items):
+        for vacancy in items:
+            stats['parsed'] += 1
+            if watermark is not None:
+                watermark.observe(vacancy)
+            yield vacancy
+
+    if watermark is not None:
+        pages = parser.iter_vacancy_pages(search_query, vacancy_count, progress_callback=progress,
+                                          extra_params=watermark.search_params(),
+                                          known_ids=watermark.known_ids,
+                                          seen=watermark.skip_ids(),
+                                          on_complete=watermark.mark_complete,
+                                          on_page_skipped=watermark.mark_page_skipped)
+    elif vacancy_count > MAX_VACANCY_COUNT:
+        pages = iter_partitioned_pages(parser, search_query, vacancy_count, progress_callback=progress)
+    else:
+        pages = parser.iter_vacancy_pages(search_query, vacancy_count, progress_callback=progress)
+    filtered = filter_items(count_parsed(iter_items(pages)), predicate)
+
+    for chunk in chunked(filtered, chunk_size):
+        stats['found'] += len(chunk)
+        stats['saved'] += parser.save_to_database(chunk)
+        if progress:
+            progress(rows_saved=stats['saved'])
+
+    if watermark is not None:
+        watermark.commit()
+
+    return stats
@@ -0,0 +1,115 @@
+"""
+Модуль reprocess.py содержит повторную нормализацию вакансий из архива ответов API.
+
+Для каждой вакансии берется последний архивный ответ детальной информации
+(payload_archive.ArchiveReader.latest_details); он содержит все поля
+элемента выдачи, поэтому запросы к API не выполняются. Распаковка и
+нормализация выполняются пакетами в рабочих процессах, сохранение — в
+основном процессе через HHApiParser.save_to_database, чтобы запись в базу
+шла одним соединением.
+
+Основной функционал:
+- reprocess_archive: пересоздание записей Vacancy из архива
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+import django
+from django.db import connections
+from hhparser.services.pipeline import chunked
+from DjangoProject_HH_parser.Services.hh_client import normalize_vacancy
+from DjangoProject_HH_parser.Services.hh_parser import HHApiParser
+from DjangoProject_HH_parser.Services.payload_archive import ArchiveReader
+
+# Константы
+DEFAULT_BATCH_SIZE = 500
+
+_readers = {}
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_batch(archive_path: str, locations: list) -> tuple:
+    """
+    Распаковка и нормализация пакета архивных ответов детальной информации.
+
+    Args:
+        archive_path: str (каталог архива)
+        locations: list (расположения ответов: сегмент, смещение, длина)
+
+    Returns:
+        tuple: (список данных вакансий, количество пропущенных ответов)
+    """
+    # Отображения сегментов переиспользуются всеми пакетами рабочего процесса
+    reader = _readers.get(archive_path)
+    if reader is None:
+        reader = _readers[archive_path] = ArchiveReader(archive_path)
+
+    vacancies = []
+    skipped = 0
+    for segment, offset, length in locations:
+        try:
+            _, body = reader.read(segment, offset, length)
+            details = json.loads(body)
+            vacancy = normalize_vacancy(details, details)
+        except Exception as e:
+            logger.warning("Ошибка разбора архивного ответа %s:%s: %s", segment, offset, e)
+            vacancy = None
+        if vacancy:
+            vacancies.append(vacancy)
+        else:
+            skipped += 1
+    return vacancies, skipped
+
+
+def reprocess_archive(archive_path: str, workers: int = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                      progress=None) -> dict:
+    """
+    Пересоздание записей Vacancy из архива ответов API без сетевых запросов.
+
+    Args:
+        archive_path: str (каталог архива)
+        workers: int (количество рабочих процессов; по умолчанию по числу процессоров)
+        batch_size: int (количество ответов в одном пакете)
+        progress: callable (функция, получающая количество обработанных ответов)
+
+    Returns:
+        dict: количество ответов в архиве, сохраненных и пропущенных вакансий
+    """
+    with ArchiveReader(archive_path) as reader:
+        latest = reader.latest_details()
+    # Порядок по идентификатору делает повторные запуски воспроизводимыми
+    batches = list(chunked((latest[vacancy_id] for vacancy_id in sorted(latest)), batch_size))
+    result = {'archived': len(latest), 'saved': 0, 'skipped': 0}
+    if not batches:
+        return result
+
+    parser = HHApiParser()
+    workers = max(1, min(workers or os.cpu_count() or 1, len(batches)))
+    processed = 0
+
+    def save(vacancies: list, skipped: int, size: int) -> None:
+        nonlocal processed
+        result['saved'] += parser.save_to_database(vacancies) if vacancies else 0
+        result['skipped'] += skipped
+        processed += size
+        if progress:
+            progress(processed)
+
+    if workers == 1:
+        for batch in batches:
+            save(*normalize_batch(archive_path, batch), len(batch))
+        return result
+
+    # Как и в crawl_scheduler, рабочие процессы запускаются заново (spawn) с настройкой Django
+    connections.close_all()
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=django.setup) as executor:
+        results = executor.map(normalize_batch, [archive_path] * len(batches), batches)
+        for batch, (vacancies, skipped) in zip(batches, results):
+            save(vacancies, skipped, len(batch))
+    return result
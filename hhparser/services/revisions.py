@@ -0,0 +1,117 @@
+"""
+Модуль revisions.py содержит отпечатки содержимого вакансий и историю их изменений.
+
+Отпечаток (content_hash) считается по сохраняемым полям вакансии: если
+при повторном обходе он не изменился, запись не перезаписывается. Для
+изменившихся вакансий в VacancyRevision сохраняются только поля с
+другими значениями, например переход зарплатной вилки.
+
+Основной функционал:
+- content_hash: отпечаток значений TRACKED_FIELDS
+- diff_fields: изменившиеся поля двух версий вакансии
+- diff_vacancy: изменившиеся поля с полным текстом описания
+- record_revisions: пакетная запись изменений
+- field_history: история значений поля вакансии
+"""
+
+import hashlib
+import json
+from hhparser.models import VacancyRevision
+
+# Константы
+TRACKED_FIELDS = ('title', 'company', 'salary', 'salary_from', 'salary_to', 'currency',
+                  'description', 'experience', 'employment', 'skills')
+HASH_DIGEST_SIZE = 16  # 32 шестнадцатеричных символа
+
+
+def content_hash(values: dict) -> str:
+    """
+    Отпечаток содержимого вакансии.
+
+    Args:
+        values: dict (значения полей модели Vacancy)
+
+    Returns:
+        str: шестнадцатеричный хэш BLAKE2b значений TRACKED_FIELDS
+    """
+    payload = json.dumps([values.get(field) for field in TRACKED_FIELDS],
+                         ensure_ascii=False, separators=(',', ':'))
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=HASH_DIGEST_SIZE).hexdigest()
+
+
+def diff_fields(old: dict, new: dict) -> dict:
+    """
+    Изменившиеся поля двух версий вакансии.
+
+    Args:
+        old: dict (сохраненные значения полей)
+        new: dict (новые значения полей)
+
+    Returns:
+        dict: поле → [старое значение, новое значение]
+    """
+    return {field: [old.get(field), new.get(field)]
+            for field in TRACKED_FIELDS if old.get(field) != new.get(field)}
+
+
+def diff_vacancy(old: dict, new: dict, old_description: str = None, new_description: str = None) -> dict:
+    """
+    Изменившиеся поля вакансии с учетом полного описания.
+
+    В строке Vacancy хранится краткое описание, которое не меняется при
+    правке конца текста, поэтому описания сравниваются полностью. Если
+    полного текста прежней версии нет (запись сохранена до появления
+    VacancyDescription), сравниваются краткие описания.
+
+    Args:
+        old: dict (сохраненные значения полей)
+        new: dict (новые значения полей)
+        old_description: str (полный текст сохраненного описания или None)
+        new_description: str (полный текст нового описания или None)
+
+    Returns:
+        dict: поле → [старое значение, новое значение]
+    """
+    if old_description is not None and new_description is not None:
+        old = {**old, 'description': old_description}
+        new = {**new, 'description': new_description}
+    return diff_fields(old, new)
+
+
+def record_revisions(changes_by_vacancy: dict) -> int:
+    """
+    Пакетная запись изменений вакансий.
+
+    Args:
+        changes_by_vacancy: dict (идентификатор вакансии → результат diff_fields или diff_vacancy)
+
+    Returns:
+        int: количество записанных изменений
+    """
+    revisions = [VacancyRevision(vacancy_id=vacancy_id, changes=changes)
+                 for vacancy_id, changes in changes_by_vacancy.items() if changes]
+    VacancyRevision.objects.bulk_create(revisions)
+    return len(revisions)
+
+
+def field_history(vacancy_id: int, field: str) -> list:
+    """
+    История значений поля вакансии по записанным изменениям.
+
+    Args:
+        vacancy_id: int (идентификатор вакансии)
+        field: str (поле из TRACKED_FIELDS)
+
+    Returns:
+        list: словари changed_at, old, new в хронологическом порядке
+    """
+    if field not in TRACKED_FIELDS:
+        raise ValueError(f"Поле не отслеживается: {field}")
+
+    history = []
+    for changed_at, changes in (VacancyRevision.objects.filter(vacancy_id=vacancy_id)
+                                .order_by('changed_at').values_list('changed_at', 'changes')):
+        if field in changes:
+            old, new = changes[field]
+            history.append({'changed_at': changed_at, 'old': old, 'new': new})
+    return history
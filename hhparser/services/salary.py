@@ -0,0 +1,82 @@
+"""
+Модуль salary.py содержит функции нормализации зарплатных данных.
+
+Основной функционал:
+- Извлечение числовых границ и кода валюты из данных API HH.ru
+- Восстановление границ из текстового представления Vacancy.salary
+  для записей, сохраненных до появления числовых полей
+"""
+
+import re
+
+# Константы
+CURRENCY_SYMBOLS = {
+    '₽': 'RUR',
+    'руб': 'RUR',
+    '$': 'USD',
+    '€': 'EUR',
+    '₸': 'KZT',
+}
+NUMBER_PATTERN = re.compile(r'\d[\d\s]*')
+CURRENCY_CODE_PATTERN = re.compile(r'\b([A-Z]{3})\b')
+EMPTY_BOUNDS = {'salary_from': None, 'salary_to': None, 'currency': ''}
+
+
+def salary_bounds_from_api(salary_data: dict) -> dict:
+    """
+    Числовые границы зарплаты из словаря salary ответа API.
+
+    Args:
+        salary_data: dict (данные о зарплате от API или None)
+
+    Returns:
+        dict: значения полей salary_from, salary_to, currency
+    """
+    if not salary_data:
+        return dict(EMPTY_BOUNDS)
+
+    return {
+        'salary_from': salary_data.get('from') or None,
+        'salary_to': salary_data.get('to') or None,
+        'currency': (salary_data.get('currency') or '')[:3],
+    }
+
+
+def salary_bounds_from_text(salary_text: str) -> dict:
+    """
+    Числовые границы зарплаты из строки, сформированной HHApiParser.parse_salary.
+
+    Поддерживает форматы "от X ₽", "до Y ₽" и "X - Y ₽".
+
+    Args:
+        salary_text: str (текстовое представление зарплаты)
+
+    Returns:
+        dict: значения полей salary_from, salary_to, currency
+    """
+    if not salary_text or 'Не указана' in salary_text:
+        return dict(EMPTY_BOUNDS)
+
+    numbers = [int(re.sub(r'\s', '', number)) for number in NUMBER_PATTERN.findall(salary_text)]
+    if not numbers:
+        return dict(EMPTY_BOUNDS)
+
+    text = salary_text.strip().lower()
+    if text.startswith('от'):
+        salary_from, salary_to = numbers[0], None
+    elif text.startswith('до'):
+        salary_from, salary_to = None, numbers[0]
+    else:
+        salary_from, salary_to = numbers[0], numbers[-1] if len(numbers) > 1 else None
+
+    currency = ''
+    for symbol, code in CURRENCY_SYMBOLS.items():
+        if symbol in salary_text:
+            currency = code
+            break
+    else:
+        match = CURRENCY_CODE_PATTERN.search(salary_text)
+        if match:
+            currency = match.group(1)
+
+    return {'salary_from': salary_from, 'salary_to': salary_to, 'currency': currency}
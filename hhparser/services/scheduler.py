@@ -0,0 +1,185 @@
+"""
+Модуль scheduler.py содержит планировщик сохраненных поисков.
+
+Планировщик выбирает поиски, у которых наступило время запуска, захватывает
+их условным UPDATE (повторный или параллельный экземпляр планировщика не
+запустит тот же поиск дважды) и выполняет в отдельных рабочих процессах
+через общий конвейер run_pipeline. Каждый запуск записывается в
+SavedSearchRun с длительностью и счетчиками.
+
+Основной функционал:
+- claim_due_searches: захват поисков, время запуска которых наступило
+- run_saved_search: выполнение одного поиска (в рабочем процессе)
+- run_due_searches: параллельный запуск захваченных поисков
+"""
+
+import logging
+import multiprocessing
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import timedelta
+import django
+from django.db import close_old_connections, connections
+from django.db.models import F, Q
+from django.utils import timezone
+from hhparser.models import SavedSearch, SavedSearchRun
+from hhparser.services.crawl_state import CrawlWatermark
+from hhparser.services.filters import compile_filters
+from hhparser.services.pipeline import run_pipeline
+from DjangoProject_HH_parser.Services import metrics
+from DjangoProject_HH_parser.Services.hh_parser import HHApiParser
+from DjangoProject_HH_parser.Services.rate_limiter import RateLimiter, DEFAULT_RATE
+
+# Константы
+DEFAULT_WORKERS = 2
+SCHEDULE_JITTER = 0.1  # доля интервала: случайный сдвиг разносит запуски поисков во времени
+
+logger = logging.getLogger(__name__)
+
+
+def next_run_time(saved_search: SavedSearch, now=None):
+    """
+    Время следующего запуска поиска со случайным сдвигом.
+
+    Сдвиг только увеличивает интервал, чтобы поиски, созданные одновременно,
+    не запускались одной волной.
+
+    Args:
+        saved_search: SavedSearch (сохраненный поиск)
+        now: datetime (текущее время)
+
+    Returns:
+        datetime: время следующего запуска
+    """
+    now = now or timezone.now()
+    interval = timedelta(minutes=max(1, saved_search.interval_minutes))
+    return now + interval * (1 + random.uniform(0, SCHEDULE_JITTER))
+
+
+def claim_due_searches(now=None, limit: int = None) -> list:
+    """
+    Захват активных поисков, время запуска которых наступило.
+
+    Время следующего запуска сдвигается условным UPDATE по прежнему значению,
+    поэтому поиск захватывает только один экземпляр планировщика.
+
+    Args:
+        now: datetime (текущее время)
+        limit: int (максимальное количество поисков)
+
+    Returns:
+        list: идентификаторы захваченных поисков
+    """
+    now = now or timezone.now()
+    due = (SavedSearch.objects
+           .filter(is_active=True)
+           .filter(Q(next_run_at__isnull=True) | Q(next_run_at__lte=now))
+           .order_by(F('next_run_at').asc(nulls_first=True)))
+    if limit:
+        due = due[:limit]
+
+    claimed = []
+    for saved_search in due:
+        updated = SavedSearch.objects.filter(
+            pk=saved_search.pk, next_run_at=saved_search.next_run_at
+        ).update(next_run_at=next_run_time(saved_search, now), last_run_at=now)
+        if updated:
+            claimed.append(saved_search.pk)
+    return claimed
+
+
+def run_saved_search(search_id: int, rate: float = None) -> dict:
+    """
+    Выполнение одного сохраненного поиска с записью истории запуска.
+
+    Args:
+        search_id: int (идентификатор SavedSearch)
+        rate: float (ограничение запросов в секунду для этого процесса)
+
+    Returns:
+        dict: идентификатор запуска, статус, длительность и счетчики
+    """
+    close_old_connections()
+    saved_search = SavedSearch.objects.get(pk=search_id)
+    run = SavedSearchRun.objects.create(saved_search=saved_search)
+    started = time.monotonic()
+
+    def progress(**fields) -> None:
+        SavedSearchRun.objects.filter(pk=run.pk).update(**fields)
+
+    try:
+        parser = HHApiParser(rate_limiter=RateLimiter(rate=rate) if rate else None)
+        predicate = compile_filters(saved_search.filters)
+        stats = run_pipeline(
+            parser,
+            saved_search.query,
+            saved_search.vacancy_count,
+            predicate=None if predicate.is_empty else predicate,
+            progress=progress,
+            watermark=CrawlWatermark(saved_search.query) if saved_search.incremental else None,
+        )
+        fields = {
+            'status': SavedSearchRun.STATUS_DONE,
+            'items_parsed': stats['parsed'],
+            'items_found': stats['found'],
+            'rows_saved': stats['saved'],
+        }
+    except Exception as e:
+        logger.exception("Ошибка выполнения сохраненного поиска #%s: %s", search_id, e)
+        fields = {'status': SavedSearchRun.STATUS_FAILED, 'error': str(e)}
+
+    fields['duration_seconds'] = round(time.monotonic() - started, 3)
+    SavedSearchRun.objects.filter(pk=run.pk).update(finished_at=timezone.now(), **fields)
+    # Рабочий процесс пула может быть остановлен без atexit: метрики запуска записываются сразу
+    metrics.flush()
+    return {'search_id': search_id, 'run_id': run.pk, **fields}
+
+
+def run_due_searches(workers: int = DEFAULT_WORKERS, now=None, on_result=None) -> list:
+    """
+    Захват и параллельное выполнение поисков, время запуска которых наступило.
+
+    Лимит частоты запросов к API делится между рабочими процессами, поэтому
+    суммарная нагрузка на HH.ru не растет с числом процессов.
+
+    Args:
+        workers: int (количество рабочих процессов)
+        now: datetime (текущее время)
+        on_result: callable (функция, получающая результат каждого запуска)
+
+    Returns:
+        list: результаты run_saved_search
+    """
+    search_ids = claim_due_searches(now)
+    if not search_ids:
+        return []
+
+    workers = max(1, min(workers, len(search_ids)))
+    rate = DEFAULT_RATE / workers
+    results = []
+
+    if workers == 1:
+        for search_id in search_ids:
+            results.append(run_saved_search(search_id, rate))
+            if on_result:
+                on_result(results[-1])
+        return results
+
+    # Рабочие процессы запускаются заново (spawn), не наследуя соединения с базой;
+    # Django настраивается в них до импорта моделей по унаследованной DJANGO_SETTINGS_MODULE
+    connections.close_all()
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=django.setup) as executor:
+        futures = {executor.submit(run_saved_search, search_id, rate): search_id for search_id in search_ids}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {'search_id': futures[future], 'status': SavedSearchRun.STATUS_FAILED, 'error': str(e)}
+            results.append(result)
+            if on_result:
+                on_result(result)
+    return results
+
@@ -0,0 +1,446 @@
+"""
+Модуль search.py содержит полнотекстовый поиск по вакансиям.
+
+Бэкенд выбирается по используемой СУБД:
+- SQLite: виртуальная таблица FTS5 с основами слов (русский стемминг
+  из stemmer.py), синхронизируемая с Vacancy, ранжирование bm25; таблица
+  создается и заполняется после migrate (или командой rebuild_search_index)
+- PostgreSQL: SearchVector/SearchQuery с конфигурацией 'russian'
+- прочие СУБД: поиск подстроки через icontains
+
+Основной функционал:
+- search_queryset: фильтрация и ранжирование queryset по поисковой строке
+- term_q: условие Q для термина булева запроса (boolean_query.py) через индекс
+- TermMatcher: та же проверка терминов в памяти
+- index_vacancies / remove_vacancies: синхронизация индекса FTS5
+- rebuild_index: полное перестроение индекса
+"""
+
+import logging
+import re
+import threading
+from django.db import connection, transaction, OperationalError
+from django.db.models import Q, F
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_save, post_delete, post_migrate
+from django.dispatch import receiver
+from hhparser.models import Vacancy
+from hhparser.services.stemmer import stem, stem_text, tokenize
+from hhparser.services.descriptions import load_descriptions
+from hhparser.services.signals import derived_indexes_enabled
+
+# Константы
+FTS_TABLE = 'hhparser_vacancy_fts'
+INDEXED_FIELDS = ('title', 'company', 'skills', 'description')
+FTS_WEIGHTS = (10.0, 5.0, 5.0, 1.0)  # веса bm25 для полей INDEXED_FIELDS
+INDEX_BATCH_SIZE = 500
+FTS_TOKEN_PATTERN = re.compile(r'[^\W_]+')  # буквы и цифры, как у токенизатора unicode61
+WORD_CHARS = '0-9a-zа-я'  # символы токенов индекса после stem_text и замены ё на е
+WORD_PATTERN = re.compile(f'[{WORD_CHARS}]+')
+WORD_CHAR_SET = frozenset('0123456789abcdefghijklmnopqrstuvwxyzабвгдежзийклмнопрстуфхцчшщъыьэюя')
+
+_fts_state = {'checked': False, 'available': False}
+_fts_lock = threading.Lock()
+
+logger = logging.getLogger(__name__)
+
+
+def get_backend() -> str:
+    """
+    Определяет бэкенд полнотекстового поиска для текущей СУБД.
+
+    Returns:
+        str: 'fts5', 'postgres' или 'like'
+    """
+    if connection.vendor == 'postgresql':
+        return 'postgres'
+    if connection.vendor == 'sqlite' and ensure_fts_table():
+        return 'fts5'
+    return 'like'
+
+
+def ensure_fts_table() -> bool:
+    """
+    Создает таблицу FTS5 при первом обращении.
+
+    Таблица, созданная здесь, пуста: существующие вакансии индексируются
+    после migrate (_index_after_migrate) или командой rebuild_search_index,
+    а не в запросе пользователя.
+
+    Returns:
+        bool: True, если FTS5 доступен
+    """
+    if _fts_state['checked']:
+        return _fts_state['available']
+
+    with _fts_lock:
+        if _fts_state['checked']:
+            return _fts_state['available']
+        try:
+            with connection.cursor() as cursor:
+                existed = FTS_TABLE in connection.introspection.table_names(cursor)
+                cursor.execute(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                    f"{', '.join(INDEXED_FIELDS)}, tokenize = 'unicode61 remove_diacritics 2')"
+                )
+            _fts_state['available'] = True
+        except OperationalError as e:
+            logger.warning("FTS5 недоступен, используется поиск подстроки: %s", e)
+            _fts_state['available'] = False
+            existed = True
+        _fts_state['checked'] = True
+
+    if _fts_state['available'] and not existed:
+        logger.info("Создана пустая таблица индекса FTS5 (заполняется после migrate или rebuild_search_index)")
+    return _fts_state['available']
+
+
+def build_match_expression(query: str) -> str:
+    """
+    Преобразует поисковую строку в выражение MATCH для FTS5.
+
+    Каждое слово приводится к основе и ищется как префикс; все слова обязательны.
+
+    Args:
+        query: str (поисковая строка пользователя)
+
+    Returns:
+        str: выражение MATCH или пустая строка, если слов нет
+    """
+    terms = [stem(token) for token in tokenize(query)]
+    return ' AND '.join(f'"{term}"*' for term in terms if term)
+
+
+def search_queryset(queryset, queries: list, ranked: bool = True):
+    """
+    Фильтрует queryset вакансий по одной или нескольким поисковым строкам.
+
+    Все строки должны совпасть (логическое И) и применяются одним запросом
+    к индексу. При ranked=True добавляется аннотация search_rank
+    (меньше — релевантнее для FTS5, больше — для PostgreSQL). Для FTS5
+    таблица индекса присоединяется к запросу по rowid, поэтому MATCH
+    выполняется один раз, а bm25 считается для найденных строк того же
+    поиска.
+
+    Args:
+        queryset: QuerySet (вакансии)
+        queries: list (поисковые строки)
+        ranked: bool (добавить аннотацию релевантности)
+
+    Returns:
+        QuerySet: отфильтрованные вакансии
+    """
+    queries = [query.strip() for query in queries if query and query.strip()]
+    if not queries:
+        return queryset
+
+    backend = get_backend()
+
+    if backend == 'fts5':
+        expression = ' AND '.join(f'({build_match_expression(query)})' for query in queries
+                                  if build_match_expression(query))
+        if not expression:
+            return queryset
+        weights = ', '.join(str(weight) for weight in FTS_WEIGHTS)
+        return queryset.extra(
+            tables=[FTS_TABLE],
+            where=[f"{FTS_TABLE}.rowid = {Vacancy._meta.db_table}.id", f"{FTS_TABLE} MATCH %s"],
+            params=[expression],
+            select={'search_rank': f"bm25({FTS_TABLE}, {weights})"} if ranked else None,
+        )
+
+    if backend == 'postgres':
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+
+        vector = _postgres_vector()
+        search_query = None
+        for query in queries:
+            part = SearchQuery(query, config='russian', search_type='plain')
+            search_query = part if search_query is None else search_query & part
+        queryset = queryset.annotate(search_vector=vector).filter(search_vector=search_query)
+        if ranked:
+            queryset = queryset.annotate(search_rank=SearchRank(F('search_vector'), search_query))
+        return queryset
+
+    for query in queries:
+        queryset = queryset.filter(
+            Q(title__icontains=query) |
+            Q(company__icontains=query) |
+            Q(skills__icontains=query) |
+            Q(description__icontains=query)
+        )
+    return queryset
+
+
+def term_q(term: str) -> Q:
+    """
+    Условие Q для одного термина или фразы булева запроса.
+
+    Для FTS5 слова термина приводятся к основам и ищутся как префиксы
+    подряд идущих слов; для PostgreSQL используется фразовый поиск.
+
+    Args:
+        term: str (термин или фраза)
+
+    Returns:
+        Q: условие для QuerySet вакансий
+    """
+    backend = get_backend()
+
+    if backend == 'fts5':
+        terms = _term_stems(term)
+        if not terms:
+            return Q()
+        expression = ' + '.join(f'"{stemmed}"*' for stemmed in terms)
+        return Q(id__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", (expression,)))
+
+    if backend == 'postgres':
+        from django.contrib.postgres.search import SearchQuery
+
+        query = SearchQuery(term, config='russian', search_type='phrase')
+        return Q(id__in=Vacancy.objects.annotate(search_vector=_postgres_vector())
+                 .filter(search_vector=query).values('id'))
+
+    return (Q(title__icontains=term) | Q(company__icontains=term) |
+            Q(skills__icontains=term) | Q(description__icontains=term))
+
+
+def _term_stems(term: str) -> list:
+    """Основы слов термина, из которых строится выражение MATCH в term_q."""
+    return [stemmed for stemmed in (stem(token) for token in tokenize(term)) if stemmed]
+
+
+def _fts_tokens(text: str) -> list:
+    """
+    Разбиение строки основ на токены так же, как unicode61.
+
+    Основы состоят из латиницы, кириллицы, цифр и символов + и #, поэтому
+    remove_diacritics (только для латиницы с диакритикой) их не меняет.
+    """
+    return FTS_TOKEN_PATTERN.findall(text)
+
+
+class TermMatcher:
+    """
+    Проверка терминов булева запроса в памяти так же, как term_q в индексе FTS5.
+
+    Каждый термин — последовательность токенов индекса; последний токен каждой
+    основы сравнивается как префикс (звездочка в выражении MATCH), остальные —
+    точно. Все термины ищутся за один проход регулярного выражения по полю:
+    оно находит только слова, начинающиеся с токена какого-либо термина, и
+    только эти слова приводятся к основам, поэтому поле не разбирается на
+    основы целиком. Токены фразы должны идти подряд:
+    между найденными словами не должно быть других слов.
+    """
+
+    __slots__ = ('terms', 'pattern')
+
+    def __init__(self, terms: list):
+        """
+        Построение выражения поиска кандидатов.
+
+        Args:
+            terms: list (термины или фразы)
+        """
+        self.terms = [_term_symbols(term) for term in terms]
+        starts = sorted({token for symbols in self.terms for token, _ in symbols}, key=len, reverse=True)
+        # Простое перечисление без проверки границы слова в выражении: так re
+        # пропускает позиции по первым символам терминов, граница проверяется в find
+        self.pattern = re.compile('|'.join(map(re.escape, starts))) if starts else None
+
+    def find(self, text: str, found: set = None) -> set:
+        """
+        Поиск терминов в тексте поля.
+
+        Args:
+            text: str (значение поля)
+            found: set (множество для добавления индексов найденных терминов)
+
+        Returns:
+            set: индексы найденных терминов; пустой термин найден всегда (как Q())
+        """
+        found = set() if found is None else found
+        found.update(index for index, symbols in enumerate(self.terms) if not symbols)
+        if not text or self.pattern is None or len(found) == len(self.terms):
+            return found
+
+        lowered = text.lower().replace('ё', 'е')
+        states = []
+        previous_end = None
+        for match in self.pattern.finditer(lowered):
+            start = match.start()
+            if start and lowered[start - 1] in WORD_CHAR_SET:
+                continue
+            end = WORD_PATTERN.match(lowered, start).end()
+            word = lowered[start:end]
+            # Слова, соседние с + и #, входят в индекс без стемминга (как части "c++" или "c#")
+            bordered = (start and lowered[start - 1] in '+#') or (end < len(lowered) and lowered[end] in '+#')
+            token = word if bordered else stem(word)
+
+            next_states = []
+            if previous_end is not None and not WORD_PATTERN.search(lowered, previous_end, start):
+                for index, position in states:
+                    if index not in found and _symbol_matches(token, self.terms[index][position]):
+                        if position + 1 == len(self.terms[index]):
+                            found.add(index)
+                        else:
+                            next_states.append((index, position + 1))
+            for index, symbols in enumerate(self.terms):
+                if index not in found and symbols and _symbol_matches(token, symbols[0]):
+                    if len(symbols) == 1:
+                        found.add(index)
+                    else:
+                        next_states.append((index, 1))
+            if len(found) == len(self.terms):
+                break
+            states = next_states
+            previous_end = end
+        return found
+
+
+def _term_symbols(term: str) -> list:
+    """Токены индекса термина: пары (токен, сравнение как префикс)."""
+    symbols = []
+    for stemmed in _term_stems(term):
+        tokens = _fts_tokens(stemmed)
+        symbols.extend((token, index == len(tokens) - 1) for index, token in enumerate(tokens))
+    return symbols
+
+
+def _symbol_matches(token: str, symbol: tuple) -> bool:
+    """Совпадение токена текста с токеном термина."""
+    expected, is_prefix = symbol
+    return token.startswith(expected) if is_prefix else token == expected
+
+
+def _postgres_vector():
+    """Взвешенный поисковый вектор вакансии для PostgreSQL."""
+    from django.contrib.postgres.search import SearchVector
+
+    return (SearchVector('title', weight='A', config='russian') +
+            SearchVector('company', 'skills', weight='B', config='russian') +
+            SearchVector('description', weight='D', config='russian'))
+
+
+def rank_ordering() -> tuple:
+    """
+    Порядок сортировки по релевантности для текущего бэкенда.
+
+    Returns:
+        tuple: аргументы order_by
+    """
+    backend = get_backend()
+    if backend == 'fts5':
+        return ('search_rank', '-created_at')
+    if backend == 'postgres':
+        return ('-search_rank', '-created_at')
+    return ('-created_at',)
+
+
+def index_vacancies(vacancy_ids=None, links=None) -> int:
+    """
+    Добавляет или обновляет вакансии в индексе FTS5.
+
+    Args:
+        vacancy_ids: iterable (идентификаторы вакансий)
+        links: iterable (ссылки вакансий, если идентификаторы неизвестны)
+
+    Returns:
+        int: количество проиндексированных вакансий
+    """
+    if connection.vendor != 'sqlite' or not ensure_fts_table():
+        return 0
+
+    queryset = Vacancy.objects.all()
+    if vacancy_ids is not None:
+        queryset = queryset.filter(id__in=list(vacancy_ids))
+    elif links is not None:
+        queryset = queryset.filter(link__in=list(links))
+
+    indexed = 0
+    batch = []
+    for row in queryset.values_list('id', *INDEXED_FIELDS).iterator(chunk_size=INDEX_BATCH_SIZE):
+        batch.append(row)
+        if len(batch) >= INDEX_BATCH_SIZE:
+            indexed += _write_batch(batch)
+            batch = []
+    if batch:
+        indexed += _write_batch(batch)
+    return indexed
+
+
+def _write_batch(rows: list) -> int:
+    """
+    Записывает пакет вакансий в индекс, заменяя прежние записи.
+
+    Описание индексируется полностью из VacancyDescription; краткое описание
+    строки используется, только если полного нет.
+
+    Args:
+        rows: list (кортежи (id, title, company, skills, description))
+
+    Returns:
+        int: количество записанных строк
+    """
+    full_texts = load_descriptions(row[0] for row in rows)
+    rows = [(*row[:-1], full_texts.get(row[0], row[-1])) for row in rows]
+    # Без транзакции каждая строка executemany фиксируется отдельно (режим autocommit)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.executemany(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [(row[0],) for row in rows])
+        cursor.executemany(
+            f"INSERT INTO {FTS_TABLE} (rowid, {', '.join(INDEXED_FIELDS)}) VALUES (%s, %s, %s, %s, %s)",
+            [(row[0], *(stem_text(value) for value in row[1:])) for row in rows]
+        )
+    return len(rows)
+
+
+def remove_vacancies(vacancy_ids) -> None:
+    """
+    Удаляет вакансии из индекса FTS5.
+
+    Args:
+        vacancy_ids: iterable (идентификаторы вакансий)
+    """
+    if connection.vendor != 'sqlite' or not ensure_fts_table():
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [(pk,) for pk in vacancy_ids])
+
+
+def rebuild_index() -> int:
+    """
+    Полностью перестраивает индекс FTS5 по таблице вакансий.
+
+    Returns:
+        int: количество проиндексированных вакансий
+    """
+    if connection.vendor != 'sqlite' or not ensure_fts_table():
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+    return index_vacancies()
+
+
+@receiver(post_migrate)
+def _index_after_migrate(sender, **kwargs) -> None:
+    """Создает и заполняет индекс FTS5 после migrate, если его еще нет."""
+    if sender.label != Vacancy._meta.app_label or connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        existed = FTS_TABLE in connection.introspection.table_names(cursor)
+    if not existed and ensure_fts_table():
+        indexed = rebuild_index()
+        logger.info("Индекс FTS5 создан, проиндексировано вакансий: %s", indexed)
+
+
+@receiver(post_save, sender=Vacancy)
+def _index_saved_vacancy(sender, instance, **kwargs) -> None:
+    """Синхронизирует индекс после сохранения вакансии через ORM."""
+    if derived_indexes_enabled():
+        index_vacancies(vacancy_ids=[instance.pk])
+
+
+@receiver(post_delete, sender=Vacancy)
+def _remove_deleted_vacancy(sender, instance, **kwargs) -> None:
+    """Удаляет вакансию из индекса после удаления через ORM."""
+    remove_vacancies([instance.pk])
@@ -0,0 +1,41 @@
+"""
+Модуль signals.py управляет обработчиками post_save модели Vacancy.
+
+Обработчики в search.py, dedup.py и skills.py обновляют поисковый индекс,
+кластеры дубликатов и индекс навыков при сохранении вакансии через ORM
+(админка, shell) по данным строки Vacancy: краткому описанию и обрезанному
+полю навыков. Код, который сам обновляет эти индексы по полным данным
+после записи (построчное сохранение HHApiParser), отключает обработчики на
+время записи, чтобы каждый индекс строился один раз и по полному тексту.
+
+Основной функционал:
+- derived_indexes_deferred: отключение обработчиков в текущем потоке
+- derived_indexes_enabled: проверка, выполняемая обработчиками
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Константы
+_deferred = ContextVar('derived_indexes_deferred', default=False)
+
+
+@contextmanager
+def derived_indexes_deferred():
+    """
+    Отключение обработчиков post_save производных индексов вакансий.
+
+    Действует только в текущем потоке (контексте); вызывающий код обязан
+    сам обновить поисковый индекс, кластеры дубликатов и навыки записанных
+    вакансий.
+    """
+    token = _deferred.set(True)
+    try:
+        yield
+    finally:
+        _deferred.reset(token)
+
+
+def derived_indexes_enabled() -> bool:
+    """Обновляют ли обработчики post_save производные индексы вакансий."""
+    return not _deferred.get()
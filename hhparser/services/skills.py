@@ -0,0 +1,347 @@
+"""
+Модуль skills.py содержит индекс навыков вакансий.
+
+Навыки из строки Vacancy.skills нормализуются в таблицу Skill и связываются
+с вакансиями через VacancySkill. Счетчики Skill.vacancy_count и SkillPair.count
+обновляются инкрементально: при каждой синхронизации применяется только
+разница между прежним и новым набором навыков вакансии.
+
+Основной функционал:
+- split_skills / normalize_skill: разбор и нормализация навыков
+- sync_vacancy_skills: синхронизация навыков сохраненных вакансий
+- top_skills / related_skills: самые востребованные и совместно упоминаемые навыки
+- rebuild_skill_index: полное перестроение индекса по текстовому полю
+"""
+
+from collections import Counter
+from itertools import combinations
+from django.db import connection, transaction
+from django.db.models import F
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
+from hhparser.models import Vacancy, Skill, VacancySkill, SkillPair
+from hhparser.services.signals import derived_indexes_enabled
+
+# Константы
+MAX_SKILL_LENGTH = 100
+SYNC_BATCH_SIZE = 500
+TRUNCATION_MARK = '...'
+
+
+def normalize_skill(name: str) -> tuple:
+    """
+    Нормализация названия навыка.
+
+    Args:
+        name: str (название навыка)
+
+    Returns:
+        tuple: (отображаемое название, ключ для сравнения) или (None, None) для пустого навыка
+    """
+    display = ' '.join((name or '').split())[:MAX_SKILL_LENGTH]
+    if not display or display == TRUNCATION_MARK:
+        return None, None
+    return display, display.lower()
+
+
+def split_skills(text: str) -> list:
+    """
+    Разбор строки навыков, сохраненной в Vacancy.skills.
+
+    Последний навык строки, обрезанной в parse_vacancy_item, отбрасывается.
+
+    Args:
+        text: str (навыки через запятую)
+
+    Returns:
+        list: названия навыков
+    """
+    parts = (text or '').split(',')
+    if parts and parts[-1].endswith(TRUNCATION_MARK):
+        parts = parts[:-1]
+    return [part.strip() for part in parts if part.strip()]
+
+
+def sync_vacancy_skills(skills_by_link: dict) -> int:
+    """
+    Синхронизация навыков сохраненных вакансий с обновлением счетчиков.
+
+    Args:
+        skills_by_link: dict (ссылка вакансии → список названий навыков)
+
+    Returns:
+        int: количество синхронизированных вакансий
+    """
+    links = list(skills_by_link)
+    names_by_vacancy = {}
+    for start in range(0, len(links), SYNC_BATCH_SIZE):
+        chunk = links[start:start + SYNC_BATCH_SIZE]
+        for link, vacancy_id in Vacancy.objects.filter(link__in=chunk).values_list('link', 'id'):
+            names_by_vacancy[vacancy_id] = skills_by_link[link]
+    _sync(names_by_vacancy)
+    return len(names_by_vacancy)
+
+
+def remove_vacancy_skills(vacancy_ids) -> None:
+    """
+    Удаление навыков вакансий из индекса с уменьшением счетчиков.
+
+    Args:
+        vacancy_ids: iterable (идентификаторы вакансий)
+    """
+    _sync({vacancy_id: [] for vacancy_id in vacancy_ids})
+
+
+def _sync(names_by_vacancy: dict) -> None:
+    """
+    Применение новых наборов навыков к вакансиям.
+
+    Запросы выполняются пакетами по SYNC_BATCH_SIZE вакансий, а приращения
+    счетчиков Skill и SkillPair суммируются по всем пакетам и применяются
+    один раз: чем больше вакансий синхронизируется за вызов, тем меньше
+    запросов к счетчикам.
+
+    Args:
+        names_by_vacancy: dict (идентификатор вакансии → список названий навыков)
+    """
+    if not names_by_vacancy:
+        return
+
+    skill_deltas = Counter()
+    pair_deltas = Counter()
+    vacancy_ids = list(names_by_vacancy)
+    with transaction.atomic():
+        for start in range(0, len(vacancy_ids), SYNC_BATCH_SIZE):
+            chunk = vacancy_ids[start:start + SYNC_BATCH_SIZE]
+            skill_ids = _get_or_create_skills(
+                name for vacancy_id in chunk for name in names_by_vacancy[vacancy_id]
+            )
+            desired = {
+                vacancy_id: {skill_ids[key] for key in (normalize_skill(name)[1]
+                                                         for name in names_by_vacancy[vacancy_id]) if key}
+                for vacancy_id in chunk
+            }
+
+            current = {vacancy_id: {} for vacancy_id in desired}
+            for link_id, vacancy_id, skill_id in VacancySkill.objects.filter(
+                    vacancy_id__in=chunk).values_list('id', 'vacancy_id', 'skill_id'):
+                current[vacancy_id][skill_id] = link_id
+
+            to_create = []
+            to_delete = []
+            for vacancy_id, new_skills in desired.items():
+                old_skills = set(current[vacancy_id])
+                if old_skills == new_skills:
+                    continue
+                for skill_id in new_skills - old_skills:
+                    skill_deltas[skill_id] += 1
+                    to_create.append((vacancy_id, skill_id))
+                for skill_id in old_skills - new_skills:
+                    skill_deltas[skill_id] -= 1
+                    to_delete.append(current[vacancy_id][skill_id])
+                pair_deltas.update(combinations(sorted(new_skills), 2))
+                pair_deltas.subtract(combinations(sorted(old_skills), 2))
+
+            if to_delete:
+                VacancySkill.objects.filter(id__in=to_delete).delete()
+            _insert_vacancy_skills(to_create)
+        _apply_skill_deltas(skill_deltas)
+        _apply_pair_deltas(pair_deltas)
+
+
+def _insert_vacancy_skills(rows: list) -> None:
+    """
+    Вставка связей вакансий с навыками одним executemany.
+
+    bulk_create создает модель на каждую связь, а при массовой загрузке
+    связей в несколько раз больше, чем вакансий.
+
+    Args:
+        rows: list (пары идентификаторов вакансии и навыка)
+    """
+    if not rows:
+        return
+    quote = connection.ops.quote_name
+    fields = VacancySkill._meta
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {quote(fields.db_table)} "
+            f"({quote(fields.get_field('vacancy').column)}, {quote(fields.get_field('skill').column)}) "
+            f"VALUES (%s, %s)",
+            rows,
+        )
+
+
+def _get_or_create_skills(names) -> dict:
+    """
+    Идентификаторы навыков с созданием отсутствующих.
+
+    Args:
+        names: iterable (названия навыков)
+
+    Returns:
+        dict: ключ навыка → идентификатор Skill
+    """
+    display_by_key = {}
+    for name in names:
+        display, key = normalize_skill(name)
+        if key:
+            display_by_key.setdefault(key, display)
+    if not display_by_key:
+        return {}
+
+    keys = list(display_by_key)
+    skill_ids = dict(Skill.objects.filter(key__in=keys).values_list('key', 'id'))
+    missing = [Skill(key=key, name=display_by_key[key]) for key in keys if key not in skill_ids]
+    if missing:
+        Skill.objects.bulk_create(missing, batch_size=SYNC_BATCH_SIZE, ignore_conflicts=True)
+        skill_ids.update(Skill.objects.filter(key__in=[skill.key for skill in missing])
+                         .values_list('key', 'id'))
+    return skill_ids
+
+
+def _apply_skill_deltas(deltas: Counter) -> None:
+    """
+    Изменение Skill.vacancy_count одним UPDATE на каждое значение приращения.
+
+    Args:
+        deltas: Counter (идентификатор навыка → приращение)
+    """
+    by_delta = {}
+    for skill_id, delta in deltas.items():
+        if delta:
+            by_delta.setdefault(delta, []).append(skill_id)
+    for delta, skill_ids in by_delta.items():
+        Skill.objects.filter(id__in=skill_ids).update(vacancy_count=F('vacancy_count') + delta)
+
+
+def _apply_pair_deltas(deltas: Counter) -> None:
+    """
+    Изменение счетчиков SkillPair в обоих направлениях.
+
+    Приращения применяются в SQL (count = count + приращение), поэтому
+    синхронизации из разных процессов (crawl_scheduler, ingest_dump) не
+    затирают изменения друг друга. Положительные приращения записываются
+    вставкой с обработкой конфликта по skill_pair_unique, отрицательные —
+    UPDATE; пары с нулевым счетчиком удаляются.
+
+    Args:
+        deltas: Counter ((меньший идентификатор, больший идентификатор) → приращение)
+    """
+    increments, decrements = [], []
+    for (first, second), delta in deltas.items():
+        if delta:
+            target = increments if delta > 0 else decrements
+            target.append((first, second, delta))
+            target.append((second, first, delta))
+    if not increments and not decrements:
+        return
+
+    quote = connection.ops.quote_name
+    table = quote(SkillPair._meta.db_table)
+    count = quote('count')
+    with connection.cursor() as cursor:
+        if increments:
+            cursor.executemany(
+                f"INSERT INTO {table} (skill_id, other_id, {count}) VALUES (%s, %s, %s) "
+                f"ON CONFLICT (skill_id, other_id) DO UPDATE SET {count} = {table}.{count} + excluded.{count}",
+                increments,
+            )
+        if decrements:
+            # Счетчик не уходит ниже нуля даже при рассинхронизации индекса
+            cursor.executemany(
+                f"UPDATE {table} SET {count} = CASE WHEN {count} + %s > 0 THEN {count} + %s ELSE 0 END "
+                f"WHERE skill_id = %s AND other_id = %s",
+                [(delta, delta, first, second) for first, second, delta in decrements],
+            )
+    if decrements:
+        SkillPair.objects.filter(skill_id__in={first for first, _, _ in decrements}, count__lte=0).delete()
+
+
+def top_skills(limit: int = 20) -> list:
+    """
+    Самые востребованные навыки по предрасчитанным счетчикам.
+
+    Args:
+        limit: int (количество навыков)
+
+    Returns:
+        list: словари с названием и количеством вакансий
+    """
+    return [
+        {'name': name, 'count': count}
+        for name, count in Skill.objects.filter(vacancy_count__gt=0)
+        .order_by('-vacancy_count', 'name').values_list('name', 'vacancy_count')[:limit]
+    ]
+
+
+def related_skills(name: str, limit: int = 20) -> dict:
+    """
+    Навыки, чаще всего упоминаемые вместе с заданным.
+
+    Args:
+        name: str (название навыка)
+        limit: int (количество связанных навыков)
+
+    Returns:
+        dict: навык с количеством вакансий и список связанных навыков
+            с долей вакансий навыка, где они встречаются; None, если навык не найден
+    """
+    _, key = normalize_skill(name)
+    skill = Skill.objects.filter(key=key).first() if key else None
+    if skill is None:
+        return None
+
+    related = []
+    for other_name, count in (SkillPair.objects.filter(skill=skill)
+                              .order_by('-count', 'other__name')
+                              .values_list('other__name', 'count')[:limit]):
+        related.append({
+            'name': other_name,
+            'count': count,
+            'share': round(count / skill.vacancy_count, 4) if skill.vacancy_count else 0,
+        })
+    return {'name': skill.name, 'count': skill.vacancy_count, 'related': related}
+
+
+def rebuild_skill_index(batch_size: int = SYNC_BATCH_SIZE) -> int:
+    """
+    Полное перестроение индекса навыков по полю Vacancy.skills.
+
+    Args:
+        batch_size: int (количество вакансий в одной транзакции)
+
+    Returns:
+        int: количество обработанных вакансий
+    """
+    with transaction.atomic():
+        SkillPair.objects.all().delete()
+        VacancySkill.objects.all().delete()
+        Skill.objects.update(vacancy_count=0)
+
+    processed = 0
+    last_id = 0
+    while True:
+        batch = list(Vacancy.objects.filter(id__gt=last_id).order_by('id')
+                     .values_list('id', 'skills')[:batch_size])
+        if not batch:
+            break
+        _sync({vacancy_id: split_skills(skills) for vacancy_id, skills in batch})
+        processed += len(batch)
+        last_id = batch[-1][0]
+
+    Skill.objects.filter(vacancy_count=0).delete()
+    return processed
+
+
+@receiver(post_save, sender=Vacancy)
+def _sync_saved_vacancy(sender, instance, **kwargs) -> None:
+    """Синхронизирует навыки после сохранения вакансии через ORM."""
+    if derived_indexes_enabled():
+        _sync({instance.pk: split_skills(instance.skills)})
+
+
+@receiver(pre_delete, sender=Vacancy)
+def _remove_deleted_vacancy(sender, instance, **kwargs) -> None:
+    """Уменьшает счетчики навыков до каскадного удаления связей вакансии."""
+    remove_vacancy_skills([instance.pk])
@@ -0,0 +1,97 @@
+"""
+Модуль statistics.py содержит расчет сводной статистики по вакансиям.
+
+Основной функционал:
+- compute_statistics: все счетчики одним агрегирующим запросом
+  (включая количество вакансий без учета дубликатов)
+- get_statistics: снимок статистики из таблицы StatisticsSnapshot с
+  пересчетом при отсутствии или устаревании
+- invalidate_statistics: явный сброс снимка после записи вакансий
+  (вызывается из save_to_database и по сигналам изменения Vacancy)
+
+Снимок хранится в базе данных, а не в кэше Django: вакансии записывают
+отдельные процессы (parse_worker, crawl_scheduler, ingest_dump, reprocess,
+hh_crawl), и сброс в любом из них должен быть виден веб-серверу.
+"""
+
+from datetime import timedelta
+from django.db.models import Count, Q, F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from hhparser.models import Vacancy, StatisticsSnapshot
+
+# Константы
+STATISTICS_KEY = 'statistics'
+STATISTICS_TTL = timedelta(minutes=5)  # ограничивает устаревание счетчика за последние 7 дней
+RECENT_DAYS = 7
+
+
+def compute_statistics() -> dict:
+    """
+    Расчет статистики одним запросом с условной агрегацией.
+
+    Returns:
+        dict: общее количество, количество без дубликатов, количество за последние
+            дни и распределения по опыту работы и типу занятости
+    """
+    experience_codes = [code for code, _ in Vacancy.EXPERIENCE_CHOICES]
+    employment_codes = [code for code, _ in Vacancy.EMPLOYMENT_CHOICES]
+    recent_since = timezone.now() - timezone.timedelta(days=RECENT_DAYS)
+
+    aggregates = {
+        'total': Count('id'),
+        'recent': Count('id', filter=Q(created_at__gte=recent_since)),
+        'clusters': Count('cluster_id', distinct=True),
+        'unclustered': Count('id', filter=Q(cluster_id__isnull=True)),
+    }
+    for code in experience_codes:
+        aggregates[f'experience_{code}'] = Count('id', filter=Q(experience=code))
+    for code in employment_codes:
+        aggregates[f'employment_{code}'] = Count('id', filter=Q(employment=code))
+
+    result = Vacancy.objects.aggregate(**aggregates)
+
+    return {
+        'total_vacancies': result['total'],
+        'unique_vacancies': result['clusters'] + result['unclustered'],
+        'recent_vacancies': result['recent'],
+        'experience_stats': {code: result[f'experience_{code}'] for code in experience_codes},
+        'employment_stats': {code: result[f'employment_{code}'] for code in employment_codes},
+        'computed_at': timezone.now().isoformat(),
+    }
+
+
+def get_statistics() -> dict:
+    """
+    Снимок статистики из базы; при отсутствии или устаревании пересчитывается и сохраняется.
+
+    Новый снимок сохраняется условным UPDATE по поколению: если снимок был
+    сброшен во время расчета, результат возвращается, но не сохраняется.
+
+    Returns:
+        dict: статистика в формате compute_statistics
+    """
+    snapshot, _ = StatisticsSnapshot.objects.get_or_create(key=STATISTICS_KEY)
+    now = timezone.now()
+    if snapshot.data is not None and snapshot.computed_at and now - snapshot.computed_at < STATISTICS_TTL:
+        return snapshot.data
+
+    data = compute_statistics()
+    StatisticsSnapshot.objects.filter(pk=snapshot.pk, generation=snapshot.generation) \
+        .update(data=data, computed_at=now)
+    return data
+
+
+def invalidate_statistics() -> None:
+    """
+    Сбрасывает снимок статистики для всех процессов; следующий запрос пересчитает его.
+    """
+    StatisticsSnapshot.objects.filter(key=STATISTICS_KEY).update(generation=F('generation') + 1, data=None)
+
+
+@receiver(post_save, sender=Vacancy)
+@receiver(post_delete, sender=Vacancy)
+def _invalidate_on_change(sender, **kwargs) -> None:
+    """Сбрасывает снимок при изменении вакансии через ORM (админка, построчное сохранение)."""
+    invalidate_statistics()
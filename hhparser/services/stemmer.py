@@ -0,0 +1,199 @@
+"""
+Модуль stemmer.py содержит стеммер русского языка для полнотекстового поиска.
+
+Реализует алгоритм Snowball (Porter) для русского языка; английские
+и прочие слова возвращаются без изменений. Используется индексом
+SQLite FTS5, у которого нет встроенного русского стемминга.
+"""
+
+import re
+from functools import lru_cache
+
+# Константы
+VOWELS = 'аеиоуыэюя'
+TOKEN_PATTERN = re.compile(r'[0-9a-zа-яё+#]+', re.IGNORECASE)
+CYRILLIC_PATTERN = re.compile(r'^[а-я]+$')
+
+PERFECTIVE_GERUND_1 = ('вшись', 'вши', 'в')
+PERFECTIVE_GERUND_2 = ('ившись', 'ывшись', 'ивши', 'ывши', 'ив', 'ыв')
+ADJECTIVE = ('ими', 'ыми', 'его', 'ого', 'ему', 'ому', 'ее', 'ие', 'ые', 'ое', 'ей', 'ий', 'ый', 'ой',
+             'ем', 'им', 'ым', 'ом', 'их', 'ых', 'ую', 'юю', 'ая', 'яя', 'ою', 'ею')
+PARTICIPLE_1 = ('ем', 'нн', 'вш', 'ющ', 'щ')
+PARTICIPLE_2 = ('ивш', 'ывш', 'ующ')
+REFLEXIVE = ('ся', 'сь')
+VERB_1 = ('ла', 'на', 'ете', 'йте', 'ли', 'й', 'л', 'ем', 'н', 'ло', 'но', 'ет', 'ют', 'ны', 'ть',
+          'ешь', 'нно')
+VERB_2 = ('ила', 'ыла', 'ена', 'ейте', 'уйте', 'ите', 'или', 'ыли', 'ей', 'уй', 'ил', 'ыл', 'им', 'ым',
+          'ен', 'ило', 'ыло', 'ено', 'ят', 'ует', 'уют', 'ит', 'ыт', 'ены', 'ить', 'ыть', 'ишь', 'ую', 'ю')
+NOUN = ('иями', 'ями', 'ами', 'ией', 'иям', 'ием', 'иях', 'ев', 'ов', 'ие', 'ье', 'еи', 'ии', 'ей', 'ой',
+        'ий', 'ям', 'ем', 'ам', 'ом', 'ах', 'ях', 'ию', 'ью', 'ия', 'ья', 'а', 'е', 'и', 'й', 'о', 'у',
+        'ы', 'ь', 'ю', 'я')
+SUPERLATIVE = ('ейше', 'ейш')
+DERIVATIONAL = ('ость', 'ост')
+
+
+def _longest_first(endings: tuple) -> tuple:
+    """Сортирует окончания по убыванию длины для поиска самого длинного."""
+    return tuple(sorted(endings, key=len, reverse=True))
+
+
+PERFECTIVE_GERUND_1 = _longest_first(PERFECTIVE_GERUND_1)
+PERFECTIVE_GERUND_2 = _longest_first(PERFECTIVE_GERUND_2)
+ADJECTIVE = _longest_first(ADJECTIVE)
+PARTICIPLE_1 = _longest_first(PARTICIPLE_1)
+PARTICIPLE_2 = _longest_first(PARTICIPLE_2)
+VERB_1 = _longest_first(VERB_1)
+VERB_2 = _longest_first(VERB_2)
+NOUN = _longest_first(NOUN)
+
+
+def _regions(word: str) -> tuple:
+    """
+    Вычисляет начала областей RV и R2 слова.
+
+    Args:
+        word: str (слово в нижнем регистре)
+
+    Returns:
+        tuple: (индекс начала RV, индекс начала R2)
+    """
+    length = len(word)
+    rv = length
+    for i, char in enumerate(word):
+        if char in VOWELS:
+            rv = i + 1
+            break
+
+    def next_region(start: int) -> int:
+        for i in range(start + 1, length):
+            if word[i] not in VOWELS and word[i - 1] in VOWELS:
+                return i + 1
+        return length
+
+    r1 = next_region(0)
+    r2 = next_region(r1)
+    return rv, r2
+
+
+def _strip(rv: str, endings: tuple, preceded_endings: tuple = ()) -> str:
+    """
+    Удаляет самое длинное подходящее окончание в области RV.
+
+    Окончания из preceded_endings удаляются, только если перед ними стоит "а" или "я".
+
+    Args:
+        rv: str (область RV слова)
+        endings: tuple (окончания без дополнительных условий)
+        preceded_endings: tuple (окончания, требующие предшествующей "а"/"я")
+
+    Returns:
+        str: область RV без окончания или None, если окончание не найдено
+    """
+    best = None
+    for ending in preceded_endings:
+        if rv.endswith(ending) and len(rv) > len(ending) and rv[-len(ending) - 1] in 'ая':
+            best = ending
+            break
+    for ending in endings:
+        if rv.endswith(ending) and (best is None or len(ending) > len(best)):
+            best = ending
+            break
+    if best is None:
+        return None
+    return rv[:-len(best)]
+
+
+def _strip_adjectival(rv: str) -> str:
+    """Удаляет окончание прилагательного вместе с предшествующим суффиксом причастия."""
+    stripped = _strip(rv, ADJECTIVE)
+    if stripped is None:
+        return None
+    participle = _strip(stripped, PARTICIPLE_2, PARTICIPLE_1)
+    return participle if participle is not None else stripped
+
+
+@lru_cache(maxsize=100000)
+def stem(word: str) -> str:
+    """
+    Основа слова по алгоритму Snowball для русского языка.
+
+    Args:
+        word: str (слово)
+
+    Returns:
+        str: основа слова; нерусские слова возвращаются в нижнем регистре без изменений
+    """
+    word = word.lower().replace('ё', 'е')
+    if not CYRILLIC_PATTERN.match(word):
+        return word
+
+    rv_start, r2_start = _regions(word)
+    prefix, rv = word[:rv_start], word[rv_start:]
+
+    # Шаг 1
+    stripped = _strip(rv, PERFECTIVE_GERUND_2, PERFECTIVE_GERUND_1)
+    if stripped is None:
+        without_reflexive = _strip(rv, REFLEXIVE)
+        if without_reflexive is not None:
+            rv = without_reflexive
+        for step in (_strip_adjectival,
+                     lambda part: _strip(part, VERB_2, VERB_1),
+                     lambda part: _strip(part, NOUN)):
+            stripped = step(rv)
+            if stripped is not None:
+                break
+    if stripped is not None:
+        rv = stripped
+
+    # Шаг 2
+    if rv.endswith('и'):
+        rv = rv[:-1]
+
+    # Шаг 3: словообразовательный суффикс в области R2
+    r2_offset = max(0, r2_start - rv_start)
+    for ending in DERIVATIONAL:
+        if rv.endswith(ending) and len(rv) - len(ending) >= r2_offset:
+            rv = rv[:-len(ending)]
+            break
+
+    # Шаг 4
+    if rv.endswith('нн'):
+        rv = rv[:-1]
+    else:
+        for ending in SUPERLATIVE:
+            if rv.endswith(ending):
+                rv = rv[:-len(ending)]
+                if rv.endswith('нн'):
+                    rv = rv[:-1]
+                break
+        else:
+            if rv.endswith('ь'):
+                rv = rv[:-1]
+
+    return prefix + rv
+
+
+def tokenize(text: str) -> list:
+    """
+    Разбиение текста на слова в нижнем регистре.
+
+    Args:
+        text: str (исходный текст)
+
+    Returns:
+        list: список слов
+    """
+    return TOKEN_PATTERN.findall((text or '').lower())
+
+
+def stem_text(text: str) -> str:
+    """
+    Преобразование текста в строку основ слов для индексации.
+
+    Args:
+        text: str (исходный текст)
+
+    Returns:
+        str: основы слов через пробел
+    """
+    return ' '.join(stem(token) for token in tokenize(text))
@@ -27,6 +27,7 @@ function handleParseFormSubmit(event) {
     const jsonData = {
         'query': formData.get('query') || 'Python',
         'vacancy_count': parseInt(formData.get('vacancy_count') || 50),
+        'incremental': formData.get('incremental') === '1',
         'keywords': formData.get('keywords') || '',
         'min_salary': formData.get('min_salary') || '',
         'experience': formData.get('experience') || '',
@@ -65,13 +66,68 @@ function startParsing(data) {
         }
         return response.json();
     })
-    .then(handleParseResponse)
+    .then(response => {
+        if (response.success && response.status_url) {
+            console.log('Задача парсинга создана:', response.job_id);
+            pollParseJob(response.status_url);
+        } else {
+            handleParseResponse(response);
+        }
+    })
     .catch(error => {
         console.error('Ошибка парсинга:', error);
         showParseError('Ошибка сети при парсинге: ' + error.message);
     });
 }
 
+const PARSE_JOB_POLL_INTERVAL = 1000;
+
+function pollParseJob(statusUrl) {
+    fetch(statusUrl)
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            return response.json();
+        })
+        .then(job => {
+            if (!job.success) {
+                showParseError(job.error || 'Задача не найдена');
+                return;
+            }
+
+            if (job.status === 'done') {
+                handleParseResponse(job.result);
+            } else if (job.status === 'failed') {
+                showParseError(job.error || 'Неизвестная ошибка');
+            } else {
+                showParseProgress(job);
+                setTimeout(() => pollParseJob(statusUrl), PARSE_JOB_POLL_INTERVAL);
+            }
+        })
+        .catch(error => {
+            console.error('Ошибка опроса задачи:', error);
+            showParseError('Ошибка сети при получении статуса: ' + error.message);
+        });
+}
+
+function showParseProgress(job) {
+    const resultsDiv = document.getElementById('parseResults');
+    if (!resultsDiv) return;
+
+    resultsDiv.innerHTML = `
+        <div class="loading">
+            <div class="spinner"></div>
+            <h3>🔍 Парсим вакансии...</h3>
+            <div class="success-stats">
+                <div class="stat">Страниц: ${job.pages_fetched}</div>
+                <div class="stat">Обработано: ${job.items_parsed}/${job.vacancy_count}</div>
+                <div class="stat">Сохранено: ${job.rows_saved}</div>
+            </div>
+        </div>
+    `;
+}
+
 // static/parser/js/main.js - ЗАМЕНИТЕ эту функцию
 
 function handleParseResponse(response) {
@@ -329,6 +385,7 @@ window.HHParser = {
     validateForm,
     debounce,
     startParsing,
+    pollParseJob,
     handleParseResponse,
     resetParserForm,
     startCountdown
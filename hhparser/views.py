@@ -4,22 +4,39 @@
 Основные представления:
 - VacancyListView: отображение и фильтрация списка вакансий
 - ParserView: управление процессом парсинга вакансий
+- ParseJobStatusView: состояние фоновой задачи парсинга
+- SalaryAnalyticsView: перцентили и гистограммы зарплат
+- TopSkillsView: самые востребованные и совместно упоминаемые навыки
+- VacancyHistoryView: история изменений вакансии (зарплата, описание и другие поля)
+- VacancyDetailView: карточка вакансии с полным описанием
 - API представления: REST endpoints для работы с вакансиями
 """
 
 from django.shortcuts import render
 from django.views import View
-from django.http import JsonResponse
+from django.http import JsonResponse, HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from django.db.models import Q
-from django.utils import timezone
+from django.db.models.functions import Substr
 from django.core.paginator import Paginator
 from django.urls import reverse
-from .models import Vacancy
-from DjangoProject_HH_parser.Services.hh_parser import HHApiParser
+from .models import Vacancy, ParseJob, VacancyRevision
+from .services.search import search_queryset, rank_ordering, term_q
+from .services.statistics import get_statistics
+from .services.analytics import salary_analytics, DEFAULT_BINS, DEFAULT_GROUP_LIMIT
+from .services.skills import top_skills, related_skills
+from .services.dedup import collapse_duplicates
+from .services.filters import compile_filters
+from .services.boolean_query import BooleanQuery
+from .services.revisions import field_history
+from .services.descriptions import get_description
+from .services.jobs import expire_pending_jobs
+from DjangoProject_HH_parser.Services import metrics
+from datetime import datetime
+import base64
 import json
-import re
+import logging
 
 # Константы URL
 VACANCIES_URL = '/vacancies/'
@@ -29,6 +46,20 @@ API_FILTER_URL = '/api/filter/'
 API_GENERATE_LETTER_URL = '/api/generate-letter/'
 API_GET_VACANCIES_URL = '/api/vacancies/'
 API_STATISTICS_URL = '/api/statistics/'
+API_PARSE_JOBS_URL = '/api/parser/jobs/'
+API_SALARY_ANALYTICS_URL = '/api/analytics/salary/'
+API_TOP_SKILLS_URL = '/api/skills/top/'
+METRICS_URL = '/metrics'
+
+# Параметры выдачи FilterVacanciesView
+FILTER_PAGE_SIZE = 50
+FILTER_MAX_PAGE_SIZE = 200
+FILTER_DESCRIPTION_PREVIEW = 300
+SKILLS_DEFAULT_LIMIT = 20
+SKILLS_MAX_LIMIT = 200
+METRICS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+logger = logging.getLogger(__name__)
 
 
 class VacancyFilter:
@@ -36,81 +67,66 @@ class VacancyFilter:
 
     def __init__(self, queryset):
         self.queryset = queryset
+        self.search_terms = []
+        self.keyword_queries = []
+        self.filters = {}
 
     def apply_search_filter(self, search_query):
-        """Применяет поиск по всем текстовым полям"""
-        if search_query:
-            self.queryset = self.queryset.filter(
-                Q(title__icontains=search_query) |
-                Q(company__icontains=search_query) |
-                Q(skills__icontains=search_query) |
-                Q(description__icontains=search_query)
-            )
+        """Применяет полнотекстовый поиск по всем текстовым полям"""
+        self._add_search_term(search_query)
         return self
 
     def apply_keywords_filter(self, keywords):
-        """Применяет фильтр по ключевым словам"""
-        if keywords:
-            self.queryset = self.queryset.filter(
-                Q(title__icontains=keywords) |
-                Q(company__icontains=keywords) |
-                Q(skills__icontains=keywords) |
-                Q(description__icontains=keywords)
-            )
+        """Применяет булев запрос по ключевым словам (AND, OR, NOT, фразы в кавычках)"""
+        query = BooleanQuery(keywords or '')
+        if not query.is_empty:
+            self.keyword_queries.append(query)
         return self
 
+    def _add_search_term(self, term):
+        """Добавляет поисковую строку без повторов"""
+        term = (term or '').strip()
+        if term and term.lower() not in [existing.lower() for existing in self.search_terms]:
+            self.search_terms.append(term)
+
     def apply_salary_filter(self, min_salary):
-        """Применяет фильтр по минимальной зарплате"""
-        if min_salary:
-            try:
-                min_salary_val = int(min_salary)
-                salary_filter = Q()
-                salary_filter |= Q(salary__icontains=f"от {min_salary_val}")
-                salary_filter |= Q(salary__icontains=f"{min_salary_val} -")
-                salary_filter |= Q(salary__regex=rf'{min_salary_val}')
-                self.queryset = self.queryset.filter(salary_filter)
-            except ValueError:
-                pass
-        return self
+        """Применяет фильтр по минимальной зарплате (верхняя граница вилки не ниже заданной)"""
+        return self._add_filter('min_salary', min_salary)
 
     def apply_experience_filter(self, experience):
         """Применяет фильтр по опыту работы"""
-        if experience and experience != '':
-            self.queryset = self.queryset.filter(experience=experience)
-        return self
+        return self._add_filter('experience', experience)
 
     def apply_employment_filter(self, employment):
         """Применяет фильтр по типу занятости"""
-        if employment and employment != '':
-            self.queryset = self.queryset.filter(employment=employment)
-        return self
+        return self._add_filter('employment', employment)
 
     def apply_min_experience_filter(self, min_experience_years):
         """Применяет фильтр по минимальному количеству лет опыта"""
-        if min_experience_years:
-            try:
-                min_years = int(min_experience_years)
-                experience_map = {
-                    'no': 0,
-                    '1-3': 2,
-                    '3-6': 4,
-                    '6+': 7
-                }
+        return self._add_filter('min_experience_years', min_experience_years)
 
-                valid_experiences = []
-                for exp_code, years in experience_map.items():
-                    if years >= min_years:
-                        valid_experiences.append(exp_code)
+    def _add_filter(self, name, value):
+        """Добавляет параметр в спецификацию общего движка фильтров"""
+        if value:
+            self.filters[name] = value
+        return self
 
-                if valid_experiences:
-                    self.queryset = self.queryset.filter(experience__in=valid_experiences)
-            except ValueError:
-                pass
+    def apply_collapse_duplicates_filter(self, collapse):
+        """Оставляет по одной вакансии из каждого кластера дубликатов"""
+        if collapse and collapse not in ('0', 'false'):
+            self.queryset = collapse_duplicates(self.queryset)
         return self
 
     def get_queryset(self):
-        """Возвращает отфильтрованный queryset"""
-        return self.queryset
+        """Возвращает отфильтрованный queryset с полнотекстовым поиском и ранжированием"""
+        queryset = compile_filters(self.filters).apply(self.queryset)
+        for query in self.keyword_queries:
+            queryset = queryset.filter(query.to_q(term_q))
+        return search_queryset(queryset, self.search_terms)
+
+    def get_ordering(self) -> tuple:
+        """Возвращает порядок сортировки: по релевантности при активном поиске"""
+        return rank_ordering() if self.search_terms else ('-created_at',)
 
 
 class VacancyListView(View):
@@ -126,10 +142,11 @@ class VacancyListView(View):
         filter_params = self._get_filter_params(request)
 
         # Применяем фильтры
-        vacancies = self._apply_filters(filter_params)
+        filter_instance = self._apply_filters(filter_params)
+        vacancies = filter_instance.get_queryset()
 
         # Пагинация
-        paginator = Paginator(vacancies.order_by('-created_at'), 20)
+        paginator = Paginator(vacancies.order_by(*filter_instance.get_ordering()), 20)
         page_number = request.GET.get('page', 1)
         page_obj = paginator.get_page(page_number)
 
@@ -150,10 +167,11 @@ class VacancyListView(View):
             'experience': request.GET.get('experience', ''),
             'employment': request.GET.get('employment', ''),
             'min_experience_years': request.GET.get('min_experience_years', ''),
+            'collapse_duplicates': request.GET.get('collapse_duplicates', ''),
         }
 
-    def _apply_filters(self, filter_params: dict):
-        """Применяет все фильтры к queryset"""
+    def _apply_filters(self, filter_params: dict) -> VacancyFilter:
+        """Применяет все фильтры и возвращает настроенный VacancyFilter"""
         filter_instance = VacancyFilter(Vacancy.objects.all())
 
         filter_instance \
@@ -162,9 +180,10 @@ class VacancyListView(View):
             .apply_salary_filter(filter_params['min_salary']) \
             .apply_experience_filter(filter_params['experience']) \
             .apply_employment_filter(filter_params['employment']) \
-            .apply_min_experience_filter(filter_params['min_experience_years'])
+            .apply_min_experience_filter(filter_params['min_experience_years']) \
+            .apply_collapse_duplicates_filter(filter_params['collapse_duplicates'])
 
-        return filter_instance.get_queryset()
+        return filter_instance
 
     def _has_active_filters(self, filter_params: dict) -> bool:
         """Проверяет наличие активных фильтров"""
@@ -173,7 +192,8 @@ class VacancyListView(View):
             filter_params['min_salary'],
             filter_params['experience'] and filter_params['experience'] != '',
             filter_params['employment'] and filter_params['employment'] != '',
-            filter_params['min_experience_years']
+            filter_params['min_experience_years'],
+            filter_params['collapse_duplicates']
         ])
 
 
@@ -186,7 +206,7 @@ class IndexView(View):
         """
         Обработка GET-запросов для главной страницы.
         """
-        total_vacancies = Vacancy.objects.count()
+        total_vacancies = get_statistics()['total_vacancies']
         recent_vacancies = Vacancy.objects.all().order_by('-created_at')[:5]
 
         return render(request, 'parser/html/index.html', {
@@ -209,7 +229,7 @@ class ParserView(View):
         """
         Обработка GET-запросов для страницы парсинга.
         """
-        total_vacancies = Vacancy.objects.count()
+        total_vacancies = get_statistics()['total_vacancies']
         return render(request, 'parser/html/parser.html', {
             'total_vacancies': total_vacancies
         })
@@ -217,24 +237,28 @@ class ParserView(View):
     def post(self, request) -> JsonResponse:
         """
         Обработка запроса на запуск парсинга вакансий.
+
+        Создает задачу в очереди и сразу возвращает ее идентификатор;
+        задачу выполняет команда parse_worker (services/jobs.py), ход
+        выполнения доступен через ParseJobStatusView.
         """
         try:
             # Извлекаем данные
             data = self._extract_request_data(request)
 
-            # Парсим вакансии
-            vacancies_data = self._parse_vacancies(data['search_query'], data['vacancy_count'])
-            if not vacancies_data:
-                return JsonResponse({'success': False, 'error': 'Не удалось получить данные'})
-
-            # Применяем фильтры
-            filtered_data = self._apply_user_filters(vacancies_data, data['filters'])
-
-            # Сохраняем в БД
-            processed_count = self._save_to_database(filtered_data)
+            # Ставим задачу в очередь; ее выполнит обработчик parse_worker
+            job = ParseJob.objects.create(
+                query=data['search_query'],
+                vacancy_count=data['vacancy_count'],
+                filters=data['filters'],
+                incremental=data['incremental'],
+            )
 
-            # Формируем ответ
-            return self._build_success_response(filtered_data, processed_count, data['filters'], data['search_query'])
+            return JsonResponse({
+                'success': True,
+                'job_id': job.pk,
+                'status_url': f'{API_PARSE_JOBS_URL}{job.pk}/',
+            }, status=202)
 
         except Exception as e:
             return self._handle_error(e)
@@ -246,6 +270,7 @@ class ParserView(View):
             return {
                 'search_query': data.get('query', 'Python'),
                 'vacancy_count': int(data.get('vacancy_count', 50)),
+                'incremental': bool(data.get('incremental', False)),
                 'filters': {
                     'keywords': data.get('keywords', ''),
                     'min_salary': data.get('min_salary', ''),
@@ -258,6 +283,7 @@ class ParserView(View):
             return {
                 'search_query': request.POST.get('query', 'Python'),
                 'vacancy_count': int(request.POST.get('vacancy_count', 50)),
+                'incremental': request.POST.get('incremental') in ('1', 'true', 'on'),
                 'filters': {
                     'keywords': request.POST.get('keywords', ''),
                     'min_salary': request.POST.get('min_salary', ''),
@@ -267,91 +293,30 @@ class ParserView(View):
                 }
             }
 
-    def _parse_vacancies(self, search_query: str, vacancy_count: int) -> list:
-        """Парсит вакансии через API"""
-        parser = HHApiParser()
-        vacancies_data = parser.parse_vacancies(search_query, vacancy_count)
-
-        if vacancies_data:
-            vacancies_data = [v for v in vacancies_data if v is not None]
-            print(f"📥 Получено вакансий от API: {len(vacancies_data)}")
-
-        return vacancies_data
-
-    def _apply_user_filters(self, vacancies_data: list, filters: dict) -> list:
-        """Применяет пользовательские фильтры"""
-        if not any(filters.values()):
-            return vacancies_data
-
-        filter_view = FilterVacanciesView()
-        filtered_vacancies = []
-
-        for vacancy in vacancies_data:
-            temp_vacancy = self._create_temp_vacancy(vacancy)
-            if filter_view.matches_filters(temp_vacancy, filters):
-                filtered_vacancies.append(vacancy)
-
-        print(f"🎯 После пользовательских фильтров: {len(filtered_vacancies)} вакансий")
-        return filtered_vacancies
-
-    def _create_temp_vacancy(self, vacancy_data: dict):
-        """Создает временный объект вакансии для фильтрации"""
-        class TempVacancy:
-            def __init__(self, data):
-                self.title = data.get('title', '')
-                self.company = data.get('company', '')
-                self.salary = data.get('salary', '')
-                self.description = data.get('description', '')
-                self.experience = data.get('experience', '')
-                self.employment = data.get('employment', '')
-                self.skills = data.get('skills', '')
-                self.link = data.get('link', '')
-
-        return TempVacancy(vacancy_data)
-
-    def _save_to_database(self, vacancies_data: list) -> int:
-        """Сохраняет вакансии в базу данных"""
-        parser = HHApiParser()
-        return parser.save_to_database(vacancies_data)
-
-    def _build_success_response(self, vacancies_data: list, processed_count: int,
-                               filters: dict, search_query: str) -> JsonResponse:
-        """Формирует успешный JSON ответ"""
-        filter_url = self._build_filter_url(filters, search_query)
-        has_active_filters = any(filters.values())
-
-        return JsonResponse({
-            'success': True,
-            'found': len(vacancies_data),
-            'saved': processed_count,
-            'message': f'Найдено {len(vacancies_data)} вакансий, обработано {processed_count}',
-            'filter_url': filter_url,
-            'has_filters': has_active_filters and len(vacancies_data) > 0
-        })
-
-    def _build_filter_url(self, filters: dict, search_query: str) -> str:
-        """Строит URL для фильтрации"""
-        filter_params = {}
-
-        for key in ['keywords', 'min_salary', 'experience', 'employment', 'min_experience_years']:
-            if filters.get(key):
-                filter_params[key] = filters[key]
+    def _handle_error(self, error: Exception) -> JsonResponse:
+        """Обрабатывает ошибки"""
+        logger.exception("Ошибка в ParserView: %s", error)
+        return JsonResponse({'success': False, 'error': f'Ошибка: {str(error)}'})
 
-        if search_query and search_query != 'Python':
-            filter_params['search'] = search_query
 
-        filter_url = VACANCIES_URL
-        if filter_params:
-            filter_url += '?' + '&'.join([f"{k}={v}" for k, v in filter_params.items() if v])
+class ParseJobStatusView(View):
+    """
+    API представление для опроса состояния фоновой задачи парсинга.
+    """
 
-        return filter_url
+    def get(self, request, job_id: int) -> JsonResponse:
+        """
+        Обработка GET-запросов для получения прогресса задачи.
 
-    def _handle_error(self, error: Exception) -> JsonResponse:
-        """Обрабатывает ошибки"""
-        print(f"Ошибка в ParserView: {str(error)}")
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({'success': False, 'error': f'Ошибка: {str(error)}'})
+        Задача, которую не взял ни один обработчик за CLAIM_DEADLINE,
+        завершается с ошибкой до ответа, поэтому клиент прекращает опрос.
+        """
+        try:
+            expire_pending_jobs(job_id=job_id)
+            job = ParseJob.objects.get(pk=job_id)
+            return JsonResponse({'success': True, **job.to_dict()})
+        except ParseJob.DoesNotExist:
+            return JsonResponse({'success': False, 'error': 'Задача не найдена'}, status=404)
 
 
 class FilterVacanciesView(View):
@@ -367,37 +332,100 @@ class FilterVacanciesView(View):
     def post(self, request) -> JsonResponse:
         """
         Обработка POST-запросов для фильтрации вакансий через API.
+
+        Фильтрация выполняется в базе данных, в ответ попадает одна страница
+        с проекцией нужных полей и курсором для следующей страницы
+        (keyset-пагинация по created_at, id).
         """
         try:
             data = json.loads(request.body)
             filters = data.get('filters', {})
+            limit = self._get_limit(data.get('limit'))
+            cursor = self._decode_cursor(data.get('cursor'))
+
+            queryset = self._apply_filters(filters)
+            total_count = queryset.count() if cursor is None else None
+
+            if cursor is not None:
+                cursor_created_at, cursor_id = cursor
+                queryset = queryset.filter(
+                    Q(created_at__lt=cursor_created_at) |
+                    Q(created_at=cursor_created_at, id__lt=cursor_id)
+                )
+
+            rows = list(
+                queryset
+                .order_by('-created_at', '-id')
+                .annotate(description_preview=Substr('description', 1, FILTER_DESCRIPTION_PREVIEW))
+                .values('id', 'title', 'company', 'salary', 'experience', 'employment',
+                        'description_preview', 'link', 'created_at', 'cluster_id')[:limit + 1]
+            )
 
-            vacancies = Vacancy.objects.all().order_by('-created_at')
-            filtered_vacancies = []
-
-            for vacancy in vacancies:
-                if self.matches_filters(vacancy, filters):
-                    filtered_vacancies.append({
-                        'id': vacancy.id,
-                        'title': vacancy.title,
-                        'company': vacancy.company,
-                        'salary': vacancy.salary,
-                        'experience': self.get_experience_display(vacancy.experience),
-                        'employment': self.get_employment_display(vacancy.employment),
-                        'description': vacancy.description,
-                        'link': vacancy.link,
-                        'created_at': vacancy.created_at.strftime('%d.%m.%Y %H:%M')
-                    })
-
-            return JsonResponse({
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            next_cursor = self._encode_cursor(rows[-1]['created_at'], rows[-1]['id']) if has_more else None
+
+            filtered_vacancies = [{
+                'id': row['id'],
+                'title': row['title'],
+                'company': row['company'],
+                'salary': row['salary'],
+                'experience': self.get_experience_display(row['experience']),
+                'employment': self.get_employment_display(row['employment']),
+                'description': row['description_preview'],
+                'link': row['link'],
+                'cluster_id': row['cluster_id'],
+                'created_at': row['created_at'].strftime('%d.%m.%Y %H:%M')
+            } for row in rows]
+
+            response = {
                 'success': True,
                 'vacancies': filtered_vacancies,
-                'count': len(filtered_vacancies)
-            })
+                'has_more': has_more,
+                'next_cursor': next_cursor,
+            }
+            if total_count is not None:
+                response['count'] = total_count
+            return JsonResponse(response)
 
         except Exception as e:
             return JsonResponse({'success': False, 'error': str(e)})
 
+    def _apply_filters(self, filters: dict):
+        """Строит queryset с фильтрами на уровне базы данных"""
+        filter_instance = VacancyFilter(Vacancy.objects.all())
+        filter_instance \
+            .apply_keywords_filter(filters.get('keywords', '')) \
+            .apply_salary_filter(filters.get('min_salary', '')) \
+            .apply_experience_filter(filters.get('experience', '')) \
+            .apply_employment_filter(filters.get('employment', '')) \
+            .apply_min_experience_filter(filters.get('min_experience_years', '')) \
+            .apply_collapse_duplicates_filter(filters.get('collapse_duplicates', ''))
+        return filter_instance.get_queryset()
+
+    def _get_limit(self, limit) -> int:
+        """Возвращает размер страницы в допустимых пределах"""
+        try:
+            limit = int(limit)
+        except (TypeError, ValueError):
+            return FILTER_PAGE_SIZE
+        return max(1, min(limit, FILTER_MAX_PAGE_SIZE))
+
+    def _encode_cursor(self, created_at, vacancy_id: int) -> str:
+        """Кодирует позицию последней вакансии страницы в непрозрачный курсор"""
+        raw = f"{created_at.isoformat()}|{vacancy_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def _decode_cursor(self, cursor: str):
+        """Декодирует курсор в пару (created_at, id) или возвращает None"""
+        if not cursor:
+            return None
+        try:
+            created_at, vacancy_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+            return datetime.fromisoformat(created_at), int(vacancy_id)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValueError('Некорректный курсор') from e
+
     def get_experience_display(self, experience_code: str) -> str:
         """
         Преобразует код опыта работы в читаемое отображение.
@@ -422,78 +450,6 @@ class FilterVacanciesView(View):
         }
         return employment_map.get(employment_code, employment_code)
 
-    def matches_filters(self, vacancy, filters: dict) -> bool:
-        """
-        Проверяет соответствие вакансии заданным фильтрам.
-        """
-        # Фильтр по ключевым словам
-        if filters.get('keywords'):
-            keywords = filters['keywords'].lower().strip()
-            if keywords:
-                search_fields = [
-                    getattr(vacancy, 'title', '').lower(),
-                    getattr(vacancy, 'company', '').lower(),
-                    getattr(vacancy, 'description', '').lower(),
-                    getattr(vacancy, 'skills', '').lower()
-                ]
-
-                keyword_found = any(keywords in field for field in search_fields if field)
-                if not keyword_found:
-                    return False
-
-        # Фильтр по минимальной зарплате
-        if filters.get('min_salary'):
-            try:
-                min_salary = int(filters['min_salary'])
-                salary_text = getattr(vacancy, 'salary', '')
-
-                if salary_text and "Не указана" not in salary_text:
-                    numbers = re.findall(r'\d+', salary_text.replace(' ', '').replace(',', ''))
-                    if numbers:
-                        salary_value = max(map(int, numbers))
-                        if salary_value < min_salary:
-                            return False
-            except (ValueError, TypeError):
-                pass
-
-        # Фильтр по опыту работы
-        if filters.get('experience') and filters['experience'] != '':
-            vacancy_experience = getattr(vacancy, 'experience', '')
-            if vacancy_experience != filters['experience']:
-                return False
-
-        # Фильтр по типу занятости
-        if filters.get('employment') and filters['employment'] != '':
-            vacancy_employment = getattr(vacancy, 'employment', '')
-            if vacancy_employment != filters['employment']:
-                return False
-
-        # Фильтр по минимальному количеству лет опыта
-        if filters.get('min_experience_years'):
-            try:
-                min_years = int(filters['min_experience_years'])
-                vacancy_experience = getattr(vacancy, 'experience', '')
-                experience_years = self.get_experience_years(vacancy_experience)
-
-                if experience_years < min_years:
-                    return False
-            except (ValueError, TypeError):
-                pass
-
-        return True
-
-    def get_experience_years(self, experience_code: str) -> int:
-        """
-        Конвертирует код опыта в количество лет для численного сравнения.
-        """
-        experience_map = {
-            'no': 0,
-            '1-3': 2,
-            '3-6': 4,
-            '6+': 7
-        }
-        return experience_map.get(experience_code, 0)
-
 
 class GenerateLetterView(View):
     """
@@ -582,30 +538,146 @@ class StatisticsView(View):
         Обработка GET-запросов для получения статистических данных.
         """
         try:
-            total_vacancies = Vacancy.objects.count()
-            recent_count = Vacancy.objects.filter(
-                created_at__gte=timezone.now() - timezone.timedelta(days=7)
-            ).count()
-
-            experience_stats = {
-                'no': Vacancy.objects.filter(experience='no').count(),
-                '1-3': Vacancy.objects.filter(experience='1-3').count(),
-                '3-6': Vacancy.objects.filter(experience='3-6').count(),
-                '6+': Vacancy.objects.filter(experience='6+').count(),
-            }
+            return JsonResponse(get_statistics())
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
 
-            employment_stats = {
-                'full': Vacancy.objects.filter(employment='full').count(),
-                'part': Vacancy.objects.filter(employment='part').count(),
-                'remote': Vacancy.objects.filter(employment='remote').count(),
-                'project': Vacancy.objects.filter(employment='project').count(),
-            }
 
-            return JsonResponse({
-                'total_vacancies': total_vacancies,
-                'recent_vacancies': recent_count,
-                'experience_stats': experience_stats,
-                'employment_stats': employment_stats
-            })
+class SalaryAnalyticsView(View):
+    """
+    API представление для аналитики зарплат.
+    """
+
+    def get(self, request) -> JsonResponse:
+        """
+        Обработка GET-запросов для получения перцентилей и гистограмм зарплат.
+
+        Параметры: group_by (experience, employment, company, skill), bins,
+        limit, min_count и фильтры списка вакансий (search, keywords,
+        experience, employment, min_experience_years).
+        """
+        try:
+            filter_instance = VacancyFilter(Vacancy.objects.all())
+            filter_instance \
+                .apply_search_filter(request.GET.get('search', '')) \
+                .apply_keywords_filter(request.GET.get('keywords', '')) \
+                .apply_experience_filter(request.GET.get('experience', '')) \
+                .apply_employment_filter(request.GET.get('employment', '')) \
+                .apply_min_experience_filter(request.GET.get('min_experience_years', ''))
+
+            result = salary_analytics(
+                filter_instance.get_queryset(),
+                group_by=request.GET.get('group_by') or None,
+                bins=max(1, min(int(request.GET.get('bins', DEFAULT_BINS)), 100)),
+                limit=max(1, int(request.GET.get('limit', DEFAULT_GROUP_LIMIT))),
+                min_count=max(1, int(request.GET.get('min_count', 1))),
+            )
+            return JsonResponse({'success': True, **result})
+        except ValueError as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=400)
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+
+
+class TopSkillsView(View):
+    """
+    API представление для самых востребованных навыков.
+    """
+
+    def get(self, request) -> JsonResponse:
+        """
+        Обработка GET-запросов для получения топа навыков.
+
+        Параметры: limit и skill; при заданном skill возвращаются навыки,
+        чаще всего упоминаемые вместе с ним.
+        """
+        try:
+            limit = max(1, min(int(request.GET.get('limit', SKILLS_DEFAULT_LIMIT)), SKILLS_MAX_LIMIT))
+            skill_name = request.GET.get('skill', '').strip()
+
+            if skill_name:
+                skill = related_skills(skill_name, limit)
+                if skill is None:
+                    return JsonResponse({'success': False, 'error': f"Навык не найден: {skill_name}"},
+                                        status=404)
+                return JsonResponse({'success': True, 'skill': skill})
+
+            return JsonResponse({'success': True, 'skills': top_skills(limit)})
+        except ValueError as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=400)
         except Exception as e:
-            return JsonResponse({'success': False, 'error': str(e)})
\ No newline at end of file
+            return JsonResponse({'success': False, 'error': str(e)})
+
+
+class VacancyDetailView(View):
+    """
+    API представление для карточки вакансии с полным описанием.
+    """
+
+    def get(self, request, vacancy_id: int) -> JsonResponse:
+        """
+        Обработка GET-запросов для получения вакансии.
+
+        Полные текст и HTML описания загружаются из VacancyDescription
+        только здесь; списки вакансий отдают краткое описание.
+        """
+        try:
+            vacancy = Vacancy.objects.get(pk=vacancy_id)
+        except Vacancy.DoesNotExist:
+            return JsonResponse({'success': False, 'error': 'Вакансия не найдена'}, status=404)
+
+        description = get_description(vacancy)
+        return JsonResponse({'success': True, 'vacancy': {
+            'id': vacancy.id,
+            'title': vacancy.title,
+            'company': vacancy.company,
+            'salary': vacancy.salary,
+            'salary_from': vacancy.salary_from,
+            'salary_to': vacancy.salary_to,
+            'currency': vacancy.currency,
+            'experience': vacancy.experience,
+            'employment': vacancy.employment,
+            'skills': vacancy.skills,
+            'description': description['text'],
+            'description_html': description['html'],
+            'link': vacancy.link,
+            'cluster_id': vacancy.cluster_id,
+            'created_at': vacancy.created_at.strftime('%d.%m.%Y %H:%M'),
+        }})
+
+
+class VacancyHistoryView(View):
+    """
+    API представление для истории изменений вакансии.
+    """
+
+    def get(self, request, vacancy_id: int) -> JsonResponse:
+        """
+        Обработка GET-запросов для получения изменений вакансии.
+
+        Параметр field (например, salary_from) возвращает историю значений
+        одного поля; без него возвращаются все изменения по времени.
+        """
+        if not Vacancy.objects.filter(pk=vacancy_id).exists():
+            return JsonResponse({'success': False, 'error': 'Вакансия не найдена'}, status=404)
+
+        field = request.GET.get('field', '').strip()
+        try:
+            if field:
+                history = field_history(vacancy_id, field)
+            else:
+                history = list(VacancyRevision.objects.filter(vacancy_id=vacancy_id)
+                               .order_by('changed_at').values('changed_at', 'changes'))
+        except ValueError as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=400)
+        return JsonResponse({'success': True, 'vacancy_id': vacancy_id, 'history': history})
+
+
+class MetricsView(View):
+    """
+    Метрики парсера в текстовом формате Prometheus.
+    """
+
+    def get(self, request) -> HttpResponse:
+        """Обработка GET-запросов сборщика метрик."""
+        return HttpResponse(metrics.render(), content_type=METRICS_CONTENT_TYPE)